@@ -5,6 +5,10 @@ import { prisma } from "@/lib/server/prisma";
 export const runtime = "nodejs";
 
 const ParamsSchema = z.object({ id: z.string().uuid() });
+const DEFAULT_HOURS_OLD = 48;
+// tools/fetcher/run_jobspy.py DEFAULT_FULL_FETCH_RESULTS_WANTED
+const DEFAULT_RESULTS_WANTED = 10000;
+const PREVIOUS_RUN_LOOKBACK = 20;
 
 function requireSecret(req: Request) {
   const expected = process.env.FETCH_RUN_SECRET;
@@ -13,6 +17,42 @@ function requireSecret(req: Request) {
   return got === expected;
 }
 
+function asObject(raw: unknown): Record<string, unknown> {
+  return raw && typeof raw === "object" && !Array.isArray(raw) ? (raw as Record<string, unknown>) : {};
+}
+
+function sortedStrings(raw: unknown): string[] {
+  if (!Array.isArray(raw)) return [];
+  return raw
+    .filter((v): v is string => typeof v === "string")
+    .map((v) => v.trim().toLowerCase())
+    .sort();
+}
+
+/**
+ * Everything that decides which postings a run imports. Two runs with the
+ * same key differ only in when they ran, so the newer one only needs the
+ * postings that appeared since the older one started.
+ */
+function runConfigKey(run: {
+  queries: unknown;
+  location: string | null;
+  includeFromQueries: boolean;
+  filterDescription: boolean;
+}) {
+  const q = asObject(run.queries);
+  const locations = Array.isArray(q.locations) ? q.locations : [run.location ?? ""];
+  return JSON.stringify([
+    typeof q.title === "string" ? q.title.trim().toLowerCase() : "",
+    sortedStrings(q.queries),
+    sortedStrings(locations),
+    q.applyExcludes ?? run.filterDescription,
+    q.includeFromQueries ?? run.includeFromQueries,
+    sortedStrings(q.excludeTitleTerms),
+    sortedStrings(q.excludeDescriptionRules),
+  ]);
+}
+
 export async function GET(_req: Request, ctx: { params: Promise<{ id: string }> }) {
   if (!requireSecret(_req)) {
     return NextResponse.json({ error: "UNAUTHORIZED" }, { status: 401 });
@@ -22,11 +62,13 @@ export async function GET(_req: Request, ctx: { params: Promise<{ id: string }>
   const parsed = ParamsSchema.safeParse(params);
   if (!parsed.success) return NextResponse.json({ error: "INVALID_PARAMS" }, { status: 400 });
 
-  const run = await prisma.fetchRun.findUnique({
+  const found = await prisma.fetchRun.findUnique({
     where: { id: parsed.data.id },
     select: {
       id: true,
+      userId: true,
       userEmail: true,
+      market: true,
       status: true,
       error: true,
       importedCount: true,
@@ -36,10 +78,54 @@ export async function GET(_req: Request, ctx: { params: Promise<{ id: string }>
       resultsWanted: true,
       includeFromQueries: true,
       filterDescription: true,
+      createdAt: true,
     },
   });
-  if (!run) return NextResponse.json({ error: "NOT_FOUND" }, { status: 404 });
+  if (!found) return NextResponse.json({ error: "NOT_FOUND" }, { status: 404 });
+  // market stays in the response: the worker uses it to pick boards.
+  const { userId, createdAt, ...run } = found;
+  const { market } = run;
 
-  return NextResponse.json({ run });
-}
+  // Incremental mode (FETCH_INCREMENTAL on the worker): the latest complete
+  // SUCCEEDED run with the same config, at least the same look-back and at
+  // least the same result budget. Legacy list-shaped configs carry no
+  // title or flags to compare, so they never match.
+  if (Array.isArray(run.queries)) {
+    return NextResponse.json({ run: { ...run, previousSucceededAt: null } });
+  }
+  const previous = await prisma.fetchRun.findMany({
+    where: {
+      userId,
+      market,
+      status: "SUCCEEDED",
+      id: { not: run.id },
+      createdAt: { lt: createdAt },
+    },
+    orderBy: { createdAt: "desc" },
+    take: PREVIOUS_RUN_LOOKBACK,
+    select: {
+      createdAt: true,
+      queries: true,
+      location: true,
+      hoursOld: true,
+      resultsWanted: true,
+      includeFromQueries: true,
+      filterDescription: true,
+    },
+  });
+  const key = runConfigKey(run);
+  const hoursOld = run.hoursOld ?? DEFAULT_HOURS_OLD;
+  const resultsWanted = run.resultsWanted ?? DEFAULT_RESULTS_WANTED;
+  const match = previous.find(
+    (prev) =>
+      !Array.isArray(prev.queries) &&
+      !asObject(asObject(prev.queries).runMeta).partial &&
+      (prev.hoursOld ?? DEFAULT_HOURS_OLD) >= hoursOld &&
+      (prev.resultsWanted ?? DEFAULT_RESULTS_WANTED) >= resultsWanted &&
+      runConfigKey(prev) === key,
+  );
 
+  return NextResponse.json({
+    run: { ...run, previousSucceededAt: match ? match.createdAt.toISOString() : null },
+  });
+}
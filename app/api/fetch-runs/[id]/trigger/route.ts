@@ -203,6 +203,22 @@ export async function POST(req: Request, ctx: { params: Promise<{ id: string }>
     });
   }
 
+  // AU market with a resident worker (tools/fetcher/fetch_daemon.py): mark
+  // the run dispatched and let the worker pick it up from
+  // /api/fetch-runs/queued instead of cold-starting a workflow per run.
+  if (process.env.FETCH_WORKER_MODE === "daemon") {
+    await prisma.fetchRun.updateMany({
+      where: { id: runId, userId, status: "QUEUED" },
+      data: {
+        queries: withDispatchMeta(txResult.queries, {
+          inFlightAt: undefined,
+          dispatchedAt: new Date().toISOString(),
+        }),
+      },
+    });
+    return NextResponse.json({ ok: true, worker: "daemon" });
+  }
+
   const owner = envOrThrow("GITHUB_OWNER");
   const repo = envOrThrow("GITHUB_REPO");
   const token = envOrThrow("GITHUB_TOKEN");
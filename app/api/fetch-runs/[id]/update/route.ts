@@ -1,7 +1,7 @@
 import { NextResponse } from "next/server";
 import { z } from "zod";
 import { prisma } from "@/lib/server/prisma";
-import type { FetchRunStatus } from "@/lib/generated/prisma";
+import type { FetchRunStatus, Prisma } from "@/lib/generated/prisma";
 
 export const runtime = "nodejs";
 
@@ -10,6 +10,10 @@ const BodySchema = z.object({
   status: z.enum(["QUEUED", "RUNNING", "SUCCEEDED", "FAILED"]).optional(),
   importedCount: z.number().int().min(0).optional(),
   error: z.string().optional().nullable(),
+  // Runs the deadline cut or with failed terms, pages or detail fetches
+  // succeed with a partial scrape; incremental runs must not treat them as
+  // having covered their window.
+  partial: z.boolean().optional(),
 });
 
 const CANCELLED_ERROR = "Cancelled by user";
@@ -41,7 +45,7 @@ export async function PATCH(req: Request, ctx: { params: Promise<{ id: string }>
 
   const current = await prisma.fetchRun.findUnique({
     where: { id: parsedParams.data.id },
-    select: { id: true, status: true, error: true, importedCount: true },
+    select: { id: true, status: true, error: true, importedCount: true, queries: true },
   });
 
   if (!current) return NextResponse.json({ error: "NOT_FOUND" }, { status: 404 });
@@ -88,10 +92,29 @@ export async function PATCH(req: Request, ctx: { params: Promise<{ id: string }>
     }
   }
 
-  const patch: { status?: FetchRunStatus; error?: string | null; importedCount?: number } = {};
+  const patch: {
+    status?: FetchRunStatus;
+    error?: string | null;
+    importedCount?: number;
+    queries?: Prisma.InputJsonValue;
+  } = {};
   if (nextImportedCount !== current.importedCount) patch.importedCount = nextImportedCount;
   if (nextStatus !== current.status && nextStatus) patch.status = nextStatus;
   if ((current.error ?? null) !== nextError) patch.error = nextError;
+  // Recorded next to the config as queries.runMeta, merged into what is
+  // there. Legacy list-shaped configs are left alone: the config endpoint
+  // never uses them as an incremental baseline anyway.
+  const config =
+    current.queries && typeof current.queries === "object" && !Array.isArray(current.queries)
+      ? (current.queries as Record<string, unknown>)
+      : null;
+  if (patch.status === "SUCCEEDED" && incoming.partial && config) {
+    const runMeta =
+      config.runMeta && typeof config.runMeta === "object" && !Array.isArray(config.runMeta)
+        ? (config.runMeta as Record<string, unknown>)
+        : {};
+    patch.queries = { ...config, runMeta: { ...runMeta, partial: true } } as Prisma.InputJsonValue;
+  }
 
   if (Object.keys(patch).length) {
     await prisma.fetchRun.update({
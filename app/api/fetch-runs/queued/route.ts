@@ -0,0 +1,49 @@
+import { NextResponse } from "next/server";
+import { prisma } from "@/lib/server/prisma";
+
+export const runtime = "nodejs";
+
+const DEFAULT_LIMIT = 10;
+const MAX_LIMIT = 50;
+
+/**
+ * GET /api/fetch-runs/queued?limit=10
+ *
+ * Lists AU runs that were triggered (dispatchMeta.dispatchedAt set) and are
+ * still QUEUED, oldest first. Polled by the resident worker
+ * (tools/fetcher/fetch_daemon.py) when FETCH_WORKER_MODE=daemon; the worker
+ * claims a run by moving it to RUNNING through the update endpoint, so a
+ * run shows up here until some worker has started it.
+ *
+ * Auth: requires `x-fetch-run-secret` header matching FETCH_RUN_SECRET env var.
+ */
+export async function GET(req: Request) {
+  const secret = process.env.FETCH_RUN_SECRET;
+  const provided = req.headers.get("x-fetch-run-secret") ?? "";
+
+  if (!secret) {
+    return NextResponse.json({ error: "NOT_CONFIGURED" }, { status: 503 });
+  }
+  if (provided !== secret) {
+    return NextResponse.json({ error: "UNAUTHORIZED" }, { status: 401 });
+  }
+
+  const rawLimit = Number(new URL(req.url).searchParams.get("limit"));
+  const limit =
+    Number.isInteger(rawLimit) && rawLimit > 0 ? Math.min(rawLimit, MAX_LIMIT) : DEFAULT_LIMIT;
+
+  // Untriggered drafts share the QUEUED status and never leave it, so the
+  // dispatch check has to happen before LIMIT: filtering after `take` lets
+  // enough old drafts hide every dispatched run.
+  const runs = await prisma.$queryRaw<{ id: string; createdAt: Date }[]>`
+    SELECT "id", "createdAt"
+    FROM "FetchRun"
+    WHERE "status" = 'QUEUED'::"FetchRunStatus"
+      AND "market" = 'AU'
+      AND jsonb_typeof("queries" #> '{dispatchMeta,dispatchedAt}') = 'string'
+    ORDER BY "createdAt" ASC
+    LIMIT ${limit}
+  `;
+
+  return NextResponse.json({ runs: runs.map((run) => ({ id: run.id, createdAt: run.createdAt })) });
+}
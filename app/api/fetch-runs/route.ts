@@ -27,12 +27,30 @@ const queriesField = z
     return v.map((s) => s.trim()).filter(Boolean);
   });
 
+const MAX_LOCATIONS = 10;
+
+// One location or several; a multi-location run scrapes every
+// (query, location) pair in a single worker run.
+const locationField = z
+  .union([z.string(), z.array(z.string()).max(MAX_LOCATIONS)])
+  .optional()
+  .transform((v) => {
+    const list = (typeof v === "string" ? [v] : v ?? []).map((s) => s.trim()).filter(Boolean);
+    const seen = new Set<string>();
+    return list.filter((s) => {
+      const key = s.toLowerCase().replace(/\s+/g, " ");
+      if (seen.has(key)) return false;
+      seen.add(key);
+      return true;
+    });
+  });
+
 const AUSchema = z
   .object({
     market: z.literal("AU").optional().default("AU"),
     title: z.string().trim().min(1).optional(),
     queries: queriesField,
-    location: z.string().trim().min(1).optional(),
+    location: locationField,
     hoursOld: z.coerce.number().int().min(1).max(24 * 30).optional(),
     smartExpand: z.coerce.boolean().optional().default(true),
     includeFromQueries: z.coerce.boolean().optional().default(false),
@@ -126,8 +144,10 @@ export async function POST(req: Request) {
           applyExcludes: data.applyExcludes,
           excludeTitleTerms: data.excludeTitleTerms,
           excludeDescriptionRules: data.excludeDescriptionRules,
+          // The location column keeps the first entry for display.
+          ...(data.location.length > 1 ? { locations: data.location } : {}),
         },
-        location: data.location ?? null,
+        location: data.location[0] ?? null,
         hoursOld: data.hoursOld ?? null,
         resultsWanted: null,
         includeFromQueries: data.includeFromQueries,
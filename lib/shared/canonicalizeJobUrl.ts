@@ -2,6 +2,10 @@
 // Big-tech default: prefer a stable external identifier when available.
 
 const LINKEDIN_VIEW_RE = /\/jobs\/view\/(\d+)/i;
+// Boards that identify a posting by query parameter (Indeed viewjob?jk=,
+// Glassdoor job-listing/j?jl=). Keep in sync with JOB_ID_QUERY_PARAMS in
+// tools/fetcher/run_jobspy.py.
+const JOB_ID_QUERY_PARAMS = ["jk", "jl"];
 
 function normalizePathname(pathname: string) {
   let out = pathname || "/";
@@ -54,7 +58,13 @@ export function canonicalizeJobUrl(raw: string) {
     }
 
     const pathname = normalizePathname(parsed.pathname);
-    return `${protocol}//${host}${pathname}`;
+    const identity = new URLSearchParams();
+    for (const key of JOB_ID_QUERY_PARAMS) {
+      const value = parsed.searchParams.get(key);
+      if (value) identity.set(key, value);
+    }
+    const query = identity.toString();
+    return `${protocol}//${host}${pathname}${query ? `?${query}` : ""}`;
   } catch {
     // If URL parsing fails, return a trimmed string. Deduping is best-effort.
     return input;
@@ -0,0 +1,132 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+const fetchRunStore = vi.hoisted(() => ({
+  findUnique: vi.fn(),
+  findMany: vi.fn(),
+}));
+
+vi.mock("@/lib/server/prisma", () => ({
+  prisma: {
+    fetchRun: fetchRunStore,
+  },
+}));
+
+import { GET } from "@/app/api/fetch-runs/[id]/config/route";
+
+const RUN_ID = "550e8400-e29b-41d4-a716-446655440000";
+
+const config = {
+  queries: { title: "Software Engineer", queries: ["Software Engineer", "Backend Engineer"] },
+  location: "Sydney",
+  hoursOld: 48,
+  includeFromQueries: false,
+  filterDescription: true,
+};
+
+function makeReq(secret = "secret") {
+  return new Request(`http://localhost/api/fetch-runs/${RUN_ID}/config`, {
+    headers: { "x-fetch-run-secret": secret },
+  });
+}
+
+async function getConfig() {
+  const res = await GET(makeReq(), { params: Promise.resolve({ id: RUN_ID }) });
+  return { status: res.status, body: await res.json() };
+}
+
+describe("fetch run config api", () => {
+  beforeEach(() => {
+    fetchRunStore.findUnique.mockReset();
+    fetchRunStore.findMany.mockReset();
+    process.env.FETCH_RUN_SECRET = "secret";
+    fetchRunStore.findUnique.mockResolvedValue({
+      id: RUN_ID,
+      userId: "user-1",
+      userEmail: "user@example.com",
+      market: "AU",
+      status: "QUEUED",
+      error: null,
+      importedCount: 0,
+      resultsWanted: null,
+      createdAt: new Date("2026-05-02T12:00:00Z"),
+      ...config,
+    });
+  });
+
+  it("returns the latest complete run with the same config", async () => {
+    fetchRunStore.findMany.mockResolvedValueOnce([
+      { ...config, createdAt: new Date("2026-05-02T11:00:00Z"), queries: { ...config.queries, runMeta: { partial: true } } },
+      { ...config, createdAt: new Date("2026-05-02T10:30:00Z"), location: "Melbourne" },
+      {
+        ...config,
+        createdAt: new Date("2026-05-02T10:00:00Z"),
+        queries: { queries: ["backend engineer", "software engineer"], title: "software engineer" },
+      },
+    ]);
+
+    const { status, body } = await getConfig();
+
+    expect(status).toBe(200);
+    expect(body.run.previousSucceededAt).toBe("2026-05-02T10:00:00.000Z");
+    expect(body.run.userId).toBeUndefined();
+    expect(body.run.market).toBe("AU");
+    expect(fetchRunStore.findMany.mock.calls[0]?.[0]?.where).toMatchObject({
+      userId: "user-1",
+      status: "SUCCEEDED",
+    });
+  });
+
+  it("ignores runs that asked for fewer results", async () => {
+    fetchRunStore.findUnique.mockResolvedValueOnce({
+      id: RUN_ID,
+      userId: "user-1",
+      userEmail: "user@example.com",
+      market: "AU",
+      status: "QUEUED",
+      error: null,
+      importedCount: 0,
+      createdAt: new Date("2026-05-02T12:00:00Z"),
+      ...config,
+      resultsWanted: 500,
+    });
+    fetchRunStore.findMany.mockResolvedValueOnce([
+      { ...config, resultsWanted: 20, createdAt: new Date("2026-05-02T11:00:00Z") },
+      { ...config, resultsWanted: null, createdAt: new Date("2026-05-02T10:00:00Z") },
+    ]);
+
+    const { body } = await getConfig();
+
+    expect(body.run.previousSucceededAt).toBe("2026-05-02T10:00:00.000Z");
+  });
+
+  it("never matches legacy list configs", async () => {
+    fetchRunStore.findUnique.mockResolvedValueOnce({
+      id: RUN_ID,
+      userId: "user-1",
+      userEmail: "user@example.com",
+      market: "AU",
+      status: "QUEUED",
+      error: null,
+      importedCount: 0,
+      resultsWanted: null,
+      createdAt: new Date("2026-05-02T12:00:00Z"),
+      ...config,
+      queries: ["Software Engineer"],
+    });
+
+    const { body } = await getConfig();
+
+    expect(body.run.previousSucceededAt).toBeNull();
+    expect(fetchRunStore.findMany).not.toHaveBeenCalled();
+  });
+
+  it("ignores runs that looked back less far", async () => {
+    fetchRunStore.findMany.mockResolvedValueOnce([
+      { ...config, hoursOld: 24, createdAt: new Date("2026-05-02T11:00:00Z") },
+    ]);
+
+    const { body } = await getConfig();
+
+    expect(body.run.previousSucceededAt).toBeNull();
+  });
+});
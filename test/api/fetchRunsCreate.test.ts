@@ -50,6 +50,27 @@ describe("fetch runs create api", () => {
     expect(payload.queries).toContain("Full Stack Engineer");
   });
 
+  it("stores several locations in queries and the first in the location column", async () => {
+    (getServerSession as unknown as ReturnType<typeof vi.fn>).mockResolvedValue({
+      user: { id: "user-1", email: "user@example.com" },
+    });
+
+    const res = await POST(
+      new Request("http://localhost/api/fetch-runs", {
+        method: "POST",
+        body: JSON.stringify({
+          title: "Software Engineer",
+          location: ["Sydney", " Melbourne ", "sydney", "Remote"],
+        }),
+      }),
+    );
+
+    expect(res.status).toBe(201);
+    const data = fetchRunStore.create.mock.calls[0]?.[0]?.data;
+    expect(data.location).toBe("Sydney");
+    expect(data.queries.locations).toEqual(["Sydney", "Melbourne", "Remote"]);
+  });
+
   it("can disable smart expand to keep only original query", async () => {
     (getServerSession as unknown as ReturnType<typeof vi.fn>).mockResolvedValue({
       user: { id: "user-1", email: "user@example.com" },
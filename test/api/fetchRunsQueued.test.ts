@@ -0,0 +1,76 @@
+import { beforeEach, describe, expect, it, vi } from "vitest";
+
+const prismaMock = vi.hoisted(() => ({
+  $queryRaw: vi.fn(),
+}));
+
+vi.mock("@/lib/server/prisma", () => ({
+  prisma: prismaMock,
+}));
+
+import { GET } from "@/app/api/fetch-runs/queued/route";
+
+function sqlOf(call: unknown[]) {
+  return (call[0] as TemplateStringsArray).join("?");
+}
+
+describe("fetch run queued api", () => {
+  beforeEach(() => {
+    prismaMock.$queryRaw.mockReset();
+    process.env.FETCH_RUN_SECRET = "test-secret";
+  });
+
+  it("rejects wrong secret", async () => {
+    const res = await GET(
+      new Request("http://localhost/api/fetch-runs/queued", {
+        headers: { "x-fetch-run-secret": "wrong" },
+      }),
+    );
+    expect(res.status).toBe(401);
+    expect(prismaMock.$queryRaw).not.toHaveBeenCalled();
+  });
+
+  it("returns 503 when secret is not configured", async () => {
+    delete process.env.FETCH_RUN_SECRET;
+    const res = await GET(new Request("http://localhost/api/fetch-runs/queued"));
+    expect(res.status).toBe(503);
+  });
+
+  it("filters dispatched AU runs in the query, oldest first", async () => {
+    prismaMock.$queryRaw.mockResolvedValue([
+      { id: "run-1", createdAt: new Date("2026-01-01T00:00:00Z") },
+      { id: "run-2", createdAt: new Date("2026-01-01T00:02:00Z") },
+    ]);
+
+    const res = await GET(
+      new Request("http://localhost/api/fetch-runs/queued", {
+        headers: { "x-fetch-run-secret": "test-secret" },
+      }),
+    );
+    const json = await res.json();
+
+    expect(res.status).toBe(200);
+    expect(json.runs.map((r: { id: string }) => r.id)).toEqual(["run-1", "run-2"]);
+    const call = prismaMock.$queryRaw.mock.calls[0];
+    const sql = sqlOf(call);
+    expect(sql).toContain(`"status" = 'QUEUED'`);
+    expect(sql).toContain(`"market" = 'AU'`);
+    expect(sql).toContain("{dispatchMeta,dispatchedAt}");
+    expect(sql).toMatch(/ORDER BY "createdAt" ASC\s+LIMIT \?/);
+    expect(call[1]).toBe(10);
+  });
+
+  it("honours the limit query parameter", async () => {
+    prismaMock.$queryRaw.mockResolvedValue([{ id: "run-1", createdAt: new Date() }]);
+
+    const res = await GET(
+      new Request("http://localhost/api/fetch-runs/queued?limit=1", {
+        headers: { "x-fetch-run-secret": "test-secret" },
+      }),
+    );
+    const json = await res.json();
+
+    expect(json.runs).toHaveLength(1);
+    expect(prismaMock.$queryRaw.mock.calls[0][1]).toBe(1);
+  });
+});
@@ -65,6 +65,7 @@ describe("fetch run trigger api", () => {
     process.env.GITHUB_TOKEN = "t";
     process.env.GITHUB_WORKFLOW_FILE = "jobspy-fetch.yml";
     process.env.GITHUB_REF = "master";
+    delete process.env.FETCH_WORKER_MODE;
   });
 
   it("acquires advisory lock and dispatches GitHub workflow", async () => {
@@ -227,4 +228,34 @@ describe("fetch run trigger api", () => {
     // First updateMany = unlock (reset queries), second is not called after error
     expect(fetchRunStore.updateMany).toHaveBeenCalledTimes(1);
   });
+
+  it("leaves AU runs queued for the resident worker in daemon mode", async () => {
+    process.env.FETCH_WORKER_MODE = "daemon";
+    mockAuthedUser();
+    mockLockAcquired(true);
+    fetchRunStore.findFirstInTx.mockResolvedValueOnce({
+      id: RUN_ID,
+      status: "QUEUED",
+      market: "AU",
+      queries: { title: "SWE", queries: ["SWE"] },
+    });
+    fetchRunStore.updateInTx.mockResolvedValueOnce({});
+    fetchRunStore.updateMany.mockResolvedValue({ count: 1 });
+
+    const fetchMock = vi.fn();
+    vi.stubGlobal("fetch", fetchMock);
+
+    const res = await POST(
+      new Request(`http://localhost/api/fetch-runs/${RUN_ID}/trigger`, { method: "POST" }),
+      { params: Promise.resolve({ id: RUN_ID }) },
+    );
+    const json = await res.json();
+
+    expect(res.status).toBe(200);
+    expect(json.worker).toBe("daemon");
+    expect(fetchMock).not.toHaveBeenCalled();
+    const update = fetchRunStore.updateMany.mock.calls[0][0];
+    expect(update.where).toMatchObject({ id: RUN_ID, status: "QUEUED" });
+    expect(update.data.queries.dispatchMeta.dispatchedAt).toEqual(expect.any(String));
+  });
 });
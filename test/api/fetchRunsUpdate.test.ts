@@ -52,6 +52,48 @@ describe("fetch run update api", () => {
     });
   });
 
+  it("records partial successes in queries.runMeta", async () => {
+    fetchRunStore.findUnique.mockResolvedValueOnce({
+      id: RUN_ID,
+      status: "RUNNING",
+      error: null,
+      importedCount: 0,
+      queries: { title: "Software Engineer", runMeta: { source: "daemon" } },
+    });
+
+    await PATCH(makeReq({ status: "SUCCEEDED", importedCount: 3, error: null, partial: true }), {
+      params: Promise.resolve({ id: RUN_ID }),
+    });
+
+    expect(fetchRunStore.update).toHaveBeenCalledWith({
+      where: { id: RUN_ID },
+      data: {
+        importedCount: 3,
+        status: "SUCCEEDED",
+        queries: { title: "Software Engineer", runMeta: { source: "daemon", partial: true } },
+      },
+    });
+  });
+
+  it("leaves legacy list configs untouched on partial success", async () => {
+    fetchRunStore.findUnique.mockResolvedValueOnce({
+      id: RUN_ID,
+      status: "RUNNING",
+      error: null,
+      importedCount: 0,
+      queries: ["Software Engineer", "Backend Engineer"],
+    });
+
+    await PATCH(makeReq({ status: "SUCCEEDED", importedCount: 3, error: null, partial: true }), {
+      params: Promise.resolve({ id: RUN_ID }),
+    });
+
+    expect(fetchRunStore.update).toHaveBeenCalledWith({
+      where: { id: RUN_ID },
+      data: { importedCount: 3, status: "SUCCEEDED" },
+    });
+  });
+
   it("keeps SUCCEEDED as terminal and ignores status/error changes", async () => {
     fetchRunStore.findUnique.mockResolvedValueOnce({
       id: RUN_ID,
@@ -0,0 +1,25 @@
+import { describe, expect, it } from "vitest";
+import { canonicalizeJobUrl } from "@/lib/shared/canonicalizeJobUrl";
+
+describe("canonicalizeJobUrl", () => {
+  it("drops tracking query and fragment", () => {
+    expect(canonicalizeJobUrl("https://www.example.com/jobs/123/?utm_source=x#top")).toBe(
+      "https://example.com/jobs/123",
+    );
+  });
+
+  it("forces LinkedIn URLs to the job view path", () => {
+    expect(canonicalizeJobUrl("https://au.linkedin.com/jobs/search/?currentJobId=42&trk=abc")).toBe(
+      "https://linkedin.com/jobs/view/42",
+    );
+  });
+
+  it("keeps the posting id of boards that identify jobs by query", () => {
+    expect(canonicalizeJobUrl("https://au.indeed.com/viewjob?from=serp&jk=abc123")).toBe(
+      "https://au.indeed.com/viewjob?jk=abc123",
+    );
+    expect(canonicalizeJobUrl("https://www.glassdoor.com.au/job-listing/j?jl=987&src=GD")).toBe(
+      "https://glassdoor.com.au/job-listing/j?jl=987",
+    );
+  });
+});
@@ -0,0 +1,127 @@
+"""
+AdaptiveConcurrency — AIMD limit on in-flight requests for a thread pool.
+
+fetch_linkedin used to halve its worker count after any failed round and
+never grow it back, so one burst of 429s pinned the rest of the run to a
+single worker. The controller instead adjusts continuously:
+
+  - every request runs inside `slot()`, which blocks while `limit`
+    requests are already in flight
+  - a congestion signal (a 429-style error, or latency above
+    `latency_ratio` x the running average) multiplies the limit by
+    `decrease_factor` — once per limit epoch, so a burst of concurrent
+    429s counts as one signal
+  - `limit` consecutive clean completions add one slot, up to `max_limit`
+
+The pool keeps `max_limit` threads; the controller decides how many of
+them may hold a request at a time. Errors that are not congestion (DNS,
+parse failures, ...) neither grow nor shrink the limit.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+logger = logging.getLogger("jobspy_runner.concurrency")
+
+DEFAULT_DECREASE_FACTOR = 0.5
+LATENCY_WARMUP_SAMPLES = 5
+LATENCY_EWMA_ALPHA = 0.2
+
+
+class AdaptiveConcurrency:
+    def __init__(
+        self,
+        initial: int,
+        max_limit: int,
+        min_limit: int = 1,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        latency_ratio: Optional[float] = None,
+        is_congestion: Optional[Callable[[BaseException], bool]] = None,
+        name: str = "pool",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.limit = max(self.min_limit, min(self.max_limit, int(initial)))
+        self.decrease_factor = min(0.95, max(0.05, decrease_factor))
+        self.latency_ratio = latency_ratio
+        self.is_congestion = is_congestion or (lambda err: False)
+        self.name = name
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._epoch = 0
+        self._clean_streak = 0
+        self._latency_avg: Optional[float] = None
+        self._latency_samples = 0
+        self.increases = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+
+    # ── Slots ───────────────────────────────────────────────────────────
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            epoch = self._epoch
+        start = self._clock()
+        try:
+            yield
+        except BaseException as err:
+            self.record(self._clock() - start, congested=True if self.is_congestion(err) else None, epoch=epoch)
+            raise
+        else:
+            self.record(self._clock() - start, congested=False, epoch=epoch)
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    # ── AIMD ────────────────────────────────────────────────────────────
+
+    def _latency_congested(self, latency: float) -> bool:
+        avg = self._latency_avg
+        self._latency_avg = latency if avg is None else avg + LATENCY_EWMA_ALPHA * (latency - avg)
+        self._latency_samples += 1
+        if self.latency_ratio is None or avg is None or self._latency_samples <= LATENCY_WARMUP_SAMPLES:
+            return False
+        return latency > self.latency_ratio * avg
+
+    def record(self, latency_sec: float, congested: Optional[bool], epoch: Optional[int] = None) -> None:
+        """Feed one completed request; `congested=None` is a neutral outcome."""
+        with self._cond:
+            if congested is False and self._latency_congested(latency_sec):
+                congested = True
+            if congested is None:
+                return
+            before = self.limit
+            if congested:
+                self._clean_streak = 0
+                # Requests issued before the last decrease report stale news.
+                if epoch is not None and epoch != self._epoch:
+                    return
+                self.limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+                self._epoch += 1
+                self.decreases += 1
+                reason = "congestion"
+            else:
+                self._clean_streak += 1
+                if self._clean_streak < self.limit or self.limit >= self.max_limit:
+                    return
+                self._clean_streak = 0
+                self.limit += 1
+                self.increases += 1
+                self.peak_limit = max(self.peak_limit, self.limit)
+                reason = "recovery"
+            after = self.limit
+            self._cond.notify_all()
+        if after != before:
+            logger.info("%s concurrency %s -> %s (%s)", self.name, before, after, reason)
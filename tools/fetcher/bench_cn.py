@@ -0,0 +1,272 @@
+"""
+Offline benchmark for cn_fetcher: result-page parsing and concurrent fetch.
+
+Parsing. `cn_fetcher.parse_results` is timed against ReferenceParser, a
+straightforward html.parser extractor that builds the same results while
+walking every tag. Two pages are used:
+
+  bing_debug.html   the captured Bing page for `全栈工程师 上海
+                    site:zhipin.com`: a Turnstile challenge with no
+                    results, so this times challenge detection
+  synthetic page    the same page with `--results` organic `b_algo`
+                    blocks (zhipin job, company and article hits) put
+                    into its body; both parsers must agree on it
+
+Fetching. A local ThreadingHTTPServer serves the synthetic page with
+`--latency-ms` per response. CnSearchFetcher pulls `--terms` x
+`--pages` queries from it once per worker count in `--workers`, which
+shows what the concurrent fan-out buys when every request waits on the
+network. Usage:
+
+    python tools/fetcher/bench_cn.py
+    python tools/fetcher/bench_cn.py --repeat 200 --workers 1,4,8 --latency-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.dirname(__file__))
+
+from cn_fetcher import CnSearchFetcher, SearchResult, parse_results  # noqa: E402
+
+DEBUG_PAGE_PATH = Path(__file__).parent / "bing_debug.html"
+
+_RESULT_TEMPLATES = [
+    (
+        "https://www.zhipin.com/job_detail/{id}.html?ka=search",
+        "「{role}招聘」_{company}招聘-BOSS直聘",
+        "{company}招聘{role}，薪资15-25K，要求{years}年以上工作经验，本科。职位描述：负责<strong>{role}</strong>相关开发。",
+    ),
+    (
+        "https://www.zhipin.com/gongsi/{id}.html",
+        "{company}怎么样 - BOSS直聘",
+        "{company}公司介绍、在招职位与员工点评。",
+    ),
+    (
+        "https://news.example.cn/articles/{id}",
+        "2025年{role}薪资报告",
+        "{role}平均薪资与城市分布 &amp; 趋势分析。",
+    ),
+]
+_ROLES = ["全栈工程师", "前端开发工程师", "Java开发工程师", "数据工程师", "Go后端工程师"]
+_COMPANIES = ["上海星云科技有限公司", "字节跳动", "米哈游", "上海某某网络科技有限公司"]
+
+
+# ── Pages ───────────────────────────────────────────────────────────────
+
+
+def synthetic_page(results: int, base_html: Optional[str] = None) -> str:
+    base_html = base_html if base_html is not None else DEBUG_PAGE_PATH.read_text(encoding="utf-8")
+    blocks = []
+    for i in range(results):
+        url, title, snippet = _RESULT_TEMPLATES[i % 3 if i % 5 else 0]
+        values = {
+            "id": f"{i:04d}abcXYZ~{i % 7}",
+            "role": _ROLES[i % len(_ROLES)],
+            "company": _COMPANIES[i % len(_COMPANIES)],
+            "years": 1 + i % 5,
+        }
+        blocks.append(
+            '<li class="b_algo" data-tag="" data-id="{i}"><div class="b_tpcn"><a class="tilk" href="{url}">'
+            '<div class="tpic"><img src="data:image/png;base64,AAAA" /></div></a></div>'
+            '<h2 class=""><a target="_blank" href="{url}" h="ID=SERP,{i}.1">{title}</a></h2>'
+            '<div class="b_caption" role="contentinfo"><p class="b_lineclamp2">{snippet}</p></div></li>'.format(
+                i=i,
+                url=url.format(**values).replace("&", "&amp;"),
+                title=title.format(**values),
+                snippet=snippet.format(**values),
+            )
+        )
+    results_html = '<ol id="b_results" class="">' + "".join(blocks) + '<li class="b_pag"></li></ol>'
+    body = base_html.find("<body")
+    body_end = base_html.find(">", body) + 1
+    return base_html[:body_end] + results_html + base_html[body_end:]
+
+
+class ReferenceParser(HTMLParser):
+    """Tag-by-tag extractor kept for comparison with parse_results."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.results: List[SearchResult] = []
+        self._in_algo = 0
+        self._in_h2 = False
+        self._in_link = False
+        self._in_snippet = False
+        self._current: Optional[Dict[str, Any]] = None
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        attrs = dict(attrs)
+        if tag == "li" and "b_algo" in (attrs.get("class") or "").split():
+            self._in_algo = 1
+            self._current = {"url": "", "title": [], "snippet": [], "has_snippet": False}
+            return
+        if not self._in_algo or self._current is None:
+            return
+        if tag == "li":
+            self._in_algo += 1
+        elif tag == "h2":
+            self._in_h2 = True
+        elif tag == "a" and self._in_h2 and not self._current["url"]:
+            self._current["url"] = attrs.get("href") or ""
+            self._in_link = True
+        elif tag == "p" and self._current["url"] and not self._current["has_snippet"]:
+            self._in_snippet = True
+            self._current["has_snippet"] = True
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self._in_algo or self._current is None:
+            return
+        if tag == "a":
+            self._in_link = False
+        elif tag == "h2":
+            self._in_h2 = False
+        elif tag == "p":
+            self._in_snippet = False
+        elif tag == "li":
+            self._in_algo -= 1
+            if not self._in_algo:
+                current, self._current = self._current, None
+                if current["url"]:
+                    self.results.append(
+                        SearchResult(
+                            url=current["url"],
+                            title=" ".join("".join(current["title"]).split()),
+                            snippet=" ".join("".join(current["snippet"]).split()),
+                        )
+                    )
+
+    def handle_data(self, data: str) -> None:
+        if self._current is None:
+            return
+        if self._in_link:
+            self._current["title"].append(data)
+        elif self._in_snippet:
+            self._current["snippet"].append(data)
+
+
+def reference_parse(html: str) -> List[SearchResult]:
+    parser = ReferenceParser()
+    parser.feed(html)
+    parser.close()
+    return parser.results
+
+
+# ── Benchmarks ──────────────────────────────────────────────────────────
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_parse(pages: Dict[str, str], repeat: int, inner: int = 20) -> Dict[str, Dict[str, Any]]:
+    cells: Dict[str, Dict[str, Any]] = {}
+    for name, html in pages.items():
+        fast = parse_results(html)
+        reference = reference_parse(html)
+        fast_sec = _best_of(lambda: [parse_results(html) for _ in range(inner)], repeat) / inner
+        ref_sec = _best_of(lambda: [reference_parse(html) for _ in range(inner)], repeat) / inner
+        cells[name] = {
+            "bytes": len(html.encode("utf-8")),
+            "results": len(fast.results),
+            "blocked": fast.blocked,
+            "agrees": fast.results == reference,
+            "singlePassMs": round(fast_sec * 1000, 3),
+            "referenceMs": round(ref_sec * 1000, 3),
+            "speedup": round(ref_sec / fast_sec, 1) if fast_sec else None,
+            "pagesPerSec": round(1 / fast_sec) if fast_sec else None,
+        }
+    return cells
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    page = b""
+    latency_sec = 0.0
+
+    def do_GET(self) -> None:  # noqa: N802
+        time.sleep(self.latency_sec)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.page)))
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+def bench_fetch(html: str, terms: int, pages: int, workers: List[int], latency_ms: float) -> Dict[str, Dict[str, Any]]:
+    handler = type("PageHandler", (_PageHandler,), {"page": html.encode("utf-8"), "latency_sec": latency_ms / 1000})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    cells: Dict[str, Dict[str, Any]] = {}
+    try:
+        term_list = [f"{_ROLES[i % len(_ROLES)]}{i}" for i in range(terms)]
+        for count in workers:
+            fetcher = CnSearchFetcher(
+                workers=count,
+                max_pages=pages,
+                base_url=f"http://127.0.0.1:{server.server_port}/search",
+            )
+            started = time.perf_counter()
+            rows = sum(len(frame) for _, frame in fetcher.fetch(term_list, "上海", pages * 10))
+            elapsed = time.perf_counter() - started
+            cells[f"workers={count}"] = {
+                "requests": fetcher.requests,
+                "rows": rows,
+                "elapsedSec": round(elapsed, 3),
+                "requestsPerSec": round(fetcher.requests / elapsed, 1) if elapsed else None,
+                "parseSec": round(fetcher.parse_sec, 3),
+            }
+    finally:
+        server.shutdown()
+        server.server_close()
+    return cells
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--results", type=int, default=10, help="organic results on the synthetic page")
+    parser.add_argument("--repeat", type=int, default=20, help="best-of-N timing")
+    parser.add_argument("--terms", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--workers", default="1,4")
+    parser.add_argument("--latency-ms", type=float, default=100.0)
+    parser.add_argument("--skip-fetch", action="store_true")
+    args = parser.parse_args(argv)
+
+    debug_html = DEBUG_PAGE_PATH.read_text(encoding="utf-8")
+    synthetic = synthetic_page(args.results, debug_html)
+    result: Dict[str, Any] = {
+        "parse": bench_parse({"bing_debug.html": debug_html, "synthetic": synthetic}, args.repeat),
+    }
+    if not args.skip_fetch:
+        result["fetch"] = bench_fetch(
+            synthetic,
+            args.terms,
+            args.pages,
+            [int(w) for w in args.workers.split(",") if w.strip()],
+            args.latency_ms,
+        )
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0 if all(cell["agrees"] for cell in result["parse"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+"""
+Offline end-to-end throughput benchmark for run_jobspy.main().
+
+Starts a local stub HTTP server standing in for both LinkedIn's guest
+endpoints and the Joblit API, replaces jobspy.scrape_jobs with a
+synthetic generator that pages through the stub, and runs main() end to
+end: config fetch, scrape, filters, dedupe, import, SUCCEEDED update.
+
+Stub routes:
+  GET   /jobs-guest/jobs/api/seeMoreJobPostings/search   listing page (job ids)
+  GET   /jobs-guest/jobs/api/jobPosting/<id>             detail HTML
+  GET   /api/fetch-runs/<id>/config                      run config
+  PATCH /api/fetch-runs/<id>/update                      status updates
+  POST  /api/admin/import                                import batches
+
+Search/detail responses take `--latency-ms` and fail with 429 at rate
+`--rate-429`. Backoff sleeps are virtual by default (accounted in the run
+report but not waited); pass --real-sleep to wait them out. Each scale
+runs in a fresh interpreter so peak RSS is per scale. Usage:
+
+    python tools/fetcher/bench_fetch.py
+    python tools/fetcher/bench_fetch.py --scales 500,2000,8000 --terms 4 --latency-ms 20 --rate-429 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_memory import COMPANIES, JOB_LEVELS, LOCATIONS, SENTENCES, SIGNAL_RATE, SIGNAL_SENTENCES, TITLES  # noqa: E402
+
+RUN_ID = "00000000-0000-4000-8000-000000000000"
+DEFAULT_TERMS = ["Software Engineer", "Frontend Engineer", "Backend Engineer", "Data Engineer"]
+SHARED_ID_BASE = 4_000_000_000
+
+
+def _description_for(job_id: int, description_chars: int = 3000) -> str:
+    rng = random.Random(job_id)
+    parts: List[str] = []
+    while sum(len(p) for p in parts) < description_chars:
+        parts.append(rng.choice(SENTENCES))
+    parts.extend(sentence for sentence in SIGNAL_SENTENCES if rng.random() < SIGNAL_RATE)
+    return " ".join(parts)
+
+
+# ── Stub server ─────────────────────────────────────────────────────────
+
+
+class StubConfig:
+    def __init__(
+        self,
+        rows_per_term: int = 500,
+        overlap: float = 0.3,
+        page_size: int = 10,
+        latency_sec: float = 0.0,
+        rate_429: float = 0.0,
+        import_latency_sec: float = 0.0,
+        seed: int = 7,
+    ) -> None:
+        self.rows_per_term = rows_per_term
+        self.overlap = overlap
+        self.page_size = page_size
+        self.latency_sec = latency_sec
+        self.rate_429 = rate_429
+        self.import_latency_sec = import_latency_sec
+        self.seed = seed
+
+
+class StubServer:
+    """Threaded local server; `requests` counts hits per route."""
+
+    def __init__(self, config: StubConfig, run: Dict[str, Any]) -> None:
+        self.config = config
+        self.run = run
+        self.requests: Dict[str, int] = {}
+        self.imported = 0
+        self.patches: List[Dict[str, Any]] = []
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _hit(self, route: str) -> bool:
+        # Returns True when this request should be answered with a 429.
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            return self._rng.random() < self.config.rate_429
+
+    def job_ids(self, term: str, start: int, count: int) -> List[int]:
+        # Position p of a term is a job shared by every term with
+        # probability `overlap`, otherwise unique to the term.
+        cfg = self.config
+        term_base = (zlib.crc32(term.lower().encode("utf-8")) % 10_000 + 1) * 1_000_000
+        ids = []
+        for p in range(start, min(start + count, cfg.rows_per_term)):
+            shared = (p * 7919 + cfg.seed) % 100 < cfg.overlap * 100
+            ids.append(SHARED_ID_BASE + p if shared else SHARED_ID_BASE + term_base + p)
+        return ids
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args: Any) -> None:  # keep benchmark output clean
+                return
+
+            def _send(self, status: int, body: Any, content_type: str = "application/json") -> None:
+                data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _read_json(self) -> Any:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                path = parts.path
+                if path.endswith("/seeMoreJobPostings/search"):
+                    throttled = server._hit("search")
+                    time.sleep(server.config.latency_sec)
+                    if throttled:
+                        return self._send(429, {"error": "Too Many Requests"})
+                    qs = parse_qs(parts.query)
+                    ids = server.job_ids(
+                        (qs.get("keywords") or [""])[0],
+                        int((qs.get("start") or ["0"])[0]),
+                        server.config.page_size,
+                    )
+                    return self._send(200, {"ids": ids})
+                if "/jobs-guest/jobs/api/jobPosting/" in path:
+                    throttled = server._hit("jobPosting")
+                    time.sleep(server.config.latency_sec)
+                    if throttled:
+                        return self._send(429, b"", content_type="text/html")
+                    job_id = int(path.rsplit("/", 1)[-1])
+                    html = (
+                        '<html><body><div class="show-more-less-html__markup">'
+                        f"{_description_for(job_id)}</div></body></html>"
+                    )
+                    return self._send(200, html.encode("utf-8"), content_type="text/html")
+                if path.endswith("/config"):
+                    server._hit("config")
+                    return self._send(200, {"run": server.run})
+                return self._send(404, {"error": "NOT_FOUND"})
+
+            def do_PATCH(self) -> None:
+                server._hit("update")
+                body = self._read_json()
+                with server._lock:
+                    server.patches.append(body)
+                    if body.get("status"):
+                        server.run = {**server.run, "status": body["status"]}
+                return self._send(200, {"ok": True})
+
+            def do_POST(self) -> None:
+                server._hit("import")
+                items = self._read_json().get("items") or []
+                time.sleep(server.config.import_latency_sec)
+                with server._lock:
+                    server.imported += len(items)
+                return self._send(200, {"imported": len(items)})
+
+        return Handler
+
+
+# ── Synthetic scrape_jobs ───────────────────────────────────────────────
+
+
+def synthetic_scrape_jobs(server: StubServer):
+    """A scrape_jobs stand-in that pages through the stub like jobspy does."""
+    import pandas as pd
+    import requests
+
+    import run_jobspy as rj
+
+    session = requests.Session()
+    base = server.url
+
+    def scrape_jobs(
+        search_term: str = "",
+        results_wanted: int = 15,
+        offset: int = 0,
+        linkedin_fetch_description: bool = False,
+        **kwargs: Any,
+    ):
+        rows: List[Dict[str, Any]] = []
+        start = offset or 0
+        while len(rows) < results_wanted:
+            res = session.get(
+                f"{base}/jobs-guest/jobs/api/seeMoreJobPostings/search",
+                params={"keywords": search_term, "start": start},
+                timeout=30,
+            )
+            if res.status_code == 429:
+                raise RuntimeError("429 Client Error: Too Many Requests")
+            ids = res.json()["ids"]
+            if not ids:
+                break
+            for job_id in ids[: results_wanted - len(rows)]:
+                rng = random.Random(job_id)
+                description = None
+                if linkedin_fetch_description:
+                    detail = session.get(f"{base}/jobs-guest/jobs/api/jobPosting/{job_id}", timeout=30)
+                    if detail.status_code == 200:
+                        description = rj._extract_description_from_html(detail.text)
+                rows.append(
+                    {
+                        "id": f"li-{job_id}",
+                        "site": "linkedin",
+                        "job_url": f"https://www.linkedin.com/jobs/view/{job_id}",
+                        "title": rng.choice(TITLES),
+                        "company": rng.choice(COMPANIES),
+                        "location": rng.choice(LOCATIONS),
+                        "date_posted": "2026-10-18",
+                        "job_level": rng.choice(JOB_LEVELS),
+                        "company_url": "https://www.linkedin.com/company/example",
+                        "description": description,
+                    }
+                )
+            if len(ids) < server.config.page_size:
+                break
+            start += len(ids)
+        return pd.DataFrame(rows)
+
+    return scrape_jobs
+
+
+# ── Measurement ─────────────────────────────────────────────────────────
+
+
+def _max_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_once(
+    total_rows: int,
+    terms: Optional[List[str]] = None,
+    config: Optional[StubConfig] = None,
+    real_sleep: bool = False,
+    extra_env: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    import run_jobspy as rj
+    from sleep_service import SleepService
+
+    terms = terms or DEFAULT_TERMS
+    config = config or StubConfig()
+    config.rows_per_term = max(1, total_rows // len(terms))
+    run = {
+        "id": RUN_ID,
+        "userEmail": "bench@example.com",
+        "status": "QUEUED",
+        "queries": {
+            "title": terms[0],
+            "queries": terms,
+            "applyExcludes": True,
+            "excludeTitleTerms": ["senior", "lead"],
+            "excludeDescriptionRules": [
+                "identity_requirement",
+                "clearance_requirement",
+                "sponsorship_unavailable",
+                "experience_requirement_4_plus",
+            ],
+        },
+        "location": "Sydney, New South Wales, Australia",
+        "hoursOld": 48,
+        "resultsWanted": config.rows_per_term,
+    }
+
+    with StubServer(config, run) as server, tempfile.TemporaryDirectory() as tmp:
+        report_path = os.path.join(tmp, "report.json")
+        env = {
+            "RUN_ID": RUN_ID,
+            "JOBLIT_WEB_URL": server.url,
+            "FETCH_RUN_SECRET": "bench",
+            "IMPORT_SECRET": "bench",
+            "FETCH_RUN_DEADLINE_SEC": "0",
+            "FETCH_RUN_REPORT_PATH": report_path,
+            **(extra_env or {}),
+        }
+        sleeper = SleepService() if real_sleep else SleepService.virtual()
+        start = time.perf_counter()
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.object(rj, "scrape_jobs", synthetic_scrape_jobs(server)), \
+                mock.patch.object(rj, "LINKEDIN_GUEST_BASE_URL", server.url), \
+                mock.patch.object(rj, "sleeper", sleeper):
+            rj.main()
+        elapsed = time.perf_counter() - start
+        with open(report_path, encoding="utf-8") as fh:
+            report = json.load(fh)
+
+    scraped = report["stages"].get("scrape", {}).get("rowsOut", 0)
+    total_requests = sum(server.requests.values())
+    return {
+        "rows": total_rows,
+        "terms": len(terms),
+        "scrapedRows": scraped,
+        "imported": server.imported,
+        "elapsedSec": round(elapsed, 3),
+        "rowsPerSec": round(scraped / elapsed, 1) if elapsed else 0.0,
+        "requests": dict(sorted(server.requests.items())),
+        "requestsPerSec": round(total_requests / elapsed, 1) if elapsed else 0.0,
+        "sleptSec": report.get("sleep", {}).get("totalSec", 0.0),
+        "stageSec": {name: stage["seconds"] for name, stage in report["stages"].items()},
+        "peakRssMb": round(_max_rss_mb(), 1),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", default="500,2000,8000", help="comma-separated total row counts")
+    parser.add_argument("--terms", type=int, default=len(DEFAULT_TERMS))
+    parser.add_argument("--overlap", type=float, default=0.3, help="share of postings every term returns")
+    parser.add_argument("--page-size", type=int, default=10, help="job cards per search page")
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--import-latency-ms", type=float, default=20.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--real-sleep", action="store_true", help="wait out backoff sleeps")
+    parser.add_argument("--json", action="store_true", help="print raw JSON results")
+    parser.add_argument("--child", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    terms = (DEFAULT_TERMS * (args.terms // len(DEFAULT_TERMS) + 1))[: args.terms]
+    terms = [term if i < len(DEFAULT_TERMS) else f"{term} {i}" for i, term in enumerate(terms)]
+
+    if args.child:
+        import logging
+
+        logging.disable(logging.INFO)
+        config = StubConfig(
+            overlap=args.overlap,
+            page_size=args.page_size,
+            latency_sec=args.latency_ms / 1000,
+            rate_429=args.rate_429,
+            import_latency_sec=args.import_latency_ms / 1000,
+        )
+        print(json.dumps(run_once(args.child, terms, config, real_sleep=args.real_sleep)))
+        return 0
+
+    child_args = [
+        f"--terms={args.terms}",
+        f"--overlap={args.overlap}",
+        f"--page-size={args.page_size}",
+        f"--latency-ms={args.latency_ms}",
+        f"--import-latency-ms={args.import_latency_ms}",
+        f"--rate-429={args.rate_429}",
+        *(["--real-sleep"] if args.real_sleep else []),
+    ]
+    results = []
+    for rows in [int(x) for x in args.scales.split(",") if x.strip()]:
+        proc = subprocess.run(
+            [sys.executable, __file__, *child_args, f"--child={rows}"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for r in results:
+        print(
+            "rows={rows} terms={terms} scraped={scrapedRows} imported={imported} elapsed={elapsedSec}s "
+            "rows/s={rowsPerSec} req/s={requestsPerSec} slept={sleptSec}s peak_rss={peakRssMb}MB".format(**r)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+Throughput benchmark for the description filters in rights_filter.py and
+run_jobspy.py.
+
+`generate_corpus()` builds a seeded corpus of long English and Chinese
+job descriptions. Filler sentences are mixed with the fragments the
+filters look for, and each kind has its own density (expected fragments
+per description):
+
+  anchors      `applicants must`, `is required`, `only open to`, ...
+  regions      per-region identity phrases (`Australian citizen`, `ILR`, ...),
+               half of them placed right after an anchor
+  negations    `regardless of visa status`, `sponsorship is available`, ...
+  years        `5+ years of experience`, `3-5 years`, `3年以上工作经验`, ...
+
+The runner times ExclusionMatcher.match for every region x strictness and
+the experience detector, per language, and reports descriptions/sec and
+drop counts. `--update-baseline` stores the result next to this file;
+later runs compare against it and exit 1 when a cell is slower than the
+baseline by more than `--tolerance`. Rates are scaled by a fixed regex
+calibration loop so a baseline recorded on another machine still means
+something. Usage:
+
+    python tools/fetcher/bench_filters.py
+    python tools/fetcher/bench_filters.py --regions AU,US --strictness balanced --count 500
+    python tools/fetcher/bench_filters.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+sys.path.append(os.path.dirname(__file__))
+
+BASELINE_PATH = Path(__file__).parent / "bench_filters_baseline.json"
+DEFAULT_TOLERANCE = 0.25
+RIGHTS_RULES = ["identity_requirement", "clearance_requirement", "sponsorship_unavailable"]
+EXPERIENCE_RULES = ["experience_requirement_4_plus"]
+
+EN_FILLER = [
+    "You will design, build and operate backend services used by millions of customers.",
+    "Work closely with product managers and designers to ship features end to end.",
+    "Experience with Python, TypeScript, Go or Java in production environments is valuable.",
+    "Familiarity with AWS, GCP or Azure, Docker and Kubernetes is highly valued.",
+    "We offer flexible hybrid working, learning budgets and generous parental leave.",
+    "Join a collaborative team that values code review, testing and observability.",
+    "Responsibilities include on-call rotation, incident response and post-incident reviews.",
+    "You will mentor other engineers and contribute to our engineering culture.",
+    "Our platform processes billions of events per day across several regions.",
+    "We care about accessibility, performance and a consistent design system.",
+    "The role reports to the Engineering Manager of the Payments squad.",
+    "Benefits include health insurance, wellness days and an annual team offsite.",
+    "We are an equal opportunity employer and value diversity at our company.",
+    "You will own services from design documents through to production monitoring.",
+]
+ZH_FILLER = [
+    "负责公司核心业务系统的设计、开发与维护，保障系统稳定运行。",
+    "参与需求分析与技术方案评审，推动项目按时高质量交付。",
+    "熟悉 Python、Java 或 Go 中至少一种语言，具备良好的编码习惯。",
+    "熟悉 MySQL、Redis、Kafka 等常用中间件，有分布式系统经验者优先。",
+    "具备良好的沟通能力和团队协作精神，能够承受一定的工作压力。",
+    "公司提供五险一金、带薪年假、弹性工作时间和年度体检。",
+    "负责数据平台的建设与优化，支持业务团队的数据分析需求。",
+    "参与代码评审，持续改进工程质量和研发效率。",
+    "有大规模高并发系统开发经验者优先考虑。",
+    "本科及以上学历，计算机相关专业。",
+]
+ANCHORS = [
+    "Applicants must be eligible to work here.",
+    "This position is only open to the shortlisted team.",
+    "Attendance at the onsite interview is required.",
+    "A current driver licence is mandatory.",
+    "Candidates must have strong communication skills.",
+    "You must be comfortable with ambiguity.",
+]
+ANCHOR_PREFIXES = ["Applicants must be", "You must be", "Candidates must hold", "This role requires"]
+REGION_PHRASES: Dict[str, List[str]] = {
+    "AU": ["an Australian citizen", "an Australian permanent resident", "work rights in Australia"],
+    "US": ["a U.S. citizen", "a green card holder", "authorized to work in the United States"],
+    "CA": ["a Canadian citizen", "a Canadian permanent resident", "the right to work in Canada"],
+    "UK": ["a British citizen", "indefinite leave to remain", "the right to work in the UK"],
+    "NZ": ["a New Zealand citizen", "a NZ resident", "the right to work in New Zealand"],
+    "EU": ["an EU citizen", "an EEA national", "the right to work in the EU"],
+}
+GLOBAL_SIGNALS = [
+    "Sponsorship is not available; we will not provide sponsorship.",
+    "Baseline clearance is required for this role.",
+    "Citizens only may apply.",
+]
+NEGATIONS = [
+    "We welcome applicants regardless of visa status.",
+    "Visa sponsorship is available for the right candidate.",
+    "No citizenship is required for this role.",
+    "International candidates welcome.",
+    "Experience with Rust is nice to have.",
+]
+EN_YEARS = [
+    "Must have {n}+ years of professional experience.",
+    "{n}+ years of commercial experience building web applications.",
+    "At least {n} years of experience in a similar role.",
+    "{lo}-{n} years of experience is preferred.",
+    "Up to {n} years of experience.",
+]
+ZH_YEARS = [
+    "{n}年以上工作经验。",
+    "至少{zh}年工作经验，熟悉微服务架构。",
+    "{zh}年及以上后端开发经验。",
+    "{lo}-{n}年工作经验优先。",
+]
+ZH_DIGITS = "零一二三四五六七八九十"
+
+
+def _zh_number(n: int) -> str:
+    if n <= 10:
+        return ZH_DIGITS[n]
+    tens, ones = divmod(n, 10)
+    return ("" if tens == 1 else ZH_DIGITS[tens]) + "十" + (ZH_DIGITS[ones] if ones else "")
+
+
+# ── Corpus ──────────────────────────────────────────────────────────────
+
+
+@dataclass
+class CorpusSpec:
+    count: int = 500
+    chars: int = 3000
+    zh_ratio: float = 0.3
+    anchor_density: float = 1.5
+    region_density: float = 0.15
+    negation_density: float = 0.2
+    year_density: float = 0.5
+    seed: int = 7
+
+
+@dataclass
+class Description:
+    lang: str
+    text: str
+
+
+def _draws(rng: random.Random, density: float) -> int:
+    whole = int(density)
+    return whole + (1 if rng.random() < density - whole else 0)
+
+
+def generate_corpus(spec: CorpusSpec) -> List[Description]:
+    rng = random.Random(spec.seed)
+    regions = sorted(REGION_PHRASES)
+    corpus: List[Description] = []
+    for _ in range(spec.count):
+        lang = "zh" if rng.random() < spec.zh_ratio else "en"
+        filler = ZH_FILLER if lang == "zh" else EN_FILLER
+        # Chinese characters carry ~3x the content of English ones.
+        target = spec.chars // 3 if lang == "zh" else spec.chars
+        parts: List[str] = []
+        size = 0
+        while size < target:
+            sentence = rng.choice(filler)
+            parts.append(sentence)
+            size += len(sentence)
+
+        signals: List[str] = []
+        signals.extend(rng.choice(ANCHORS) for _ in range(_draws(rng, spec.anchor_density)))
+        for _ in range(_draws(rng, spec.region_density)):
+            if rng.random() < 0.2:
+                signals.append(rng.choice(GLOBAL_SIGNALS))
+                continue
+            phrase = rng.choice(REGION_PHRASES[rng.choice(regions)])
+            if rng.random() < 0.5:
+                signals.append(f"{rng.choice(ANCHOR_PREFIXES)} {phrase}.")
+            else:
+                signals.append(f"Candidates with {phrase} status are encouraged to apply.")
+        signals.extend(rng.choice(NEGATIONS) for _ in range(_draws(rng, spec.negation_density)))
+        for _ in range(_draws(rng, spec.year_density)):
+            n = rng.randint(1, 12)
+            template = rng.choice(ZH_YEARS if lang == "zh" else EN_YEARS)
+            signals.append(template.format(n=n, lo=max(0, n - 2), zh=_zh_number(n)))
+
+        for signal in signals:
+            parts.insert(rng.randint(0, len(parts)), signal)
+        corpus.append(Description(lang, ("" if lang == "zh" else " ").join(parts)))
+    return corpus
+
+
+# ── Timing ──────────────────────────────────────────────────────────────
+
+
+def _time_best(fn: Callable[[], int], repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    hits = 0
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        hits = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, hits
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Seconds for a fixed regex workload; used to scale baselines across machines."""
+    text = " ".join(EN_FILLER) * 40
+    pattern = re.compile(r"(?i)\b(?:must|required|citizen\w*|\d+\s*\+?\s*years?)\b")
+
+    def work() -> int:
+        return sum(len(pattern.findall(text)) for _ in range(50))
+
+    seconds, _ = _time_best(work, repeat)
+    return seconds
+
+
+def run_benchmark(
+    corpus: Sequence[Description],
+    regions: Sequence[str],
+    strictness_levels: Sequence[str],
+    repeat: int = 1,
+) -> Dict[str, Dict[str, Any]]:
+    import run_jobspy as rj
+    from rights_filter import ExclusionMatcher
+
+    by_lang: Dict[str, List[str]] = {}
+    for item in corpus:
+        by_lang.setdefault(item.lang, []).append(item.text)
+
+    cells: Dict[str, Dict[str, Any]] = {}
+    for region in regions:
+        for strictness in strictness_levels:
+            matcher = ExclusionMatcher(region=region, strictness=strictness, rules=RIGHTS_RULES)
+            for lang, texts in sorted(by_lang.items()):
+                seconds, dropped = _time_best(lambda: sum(matcher.match(t).dropped for t in texts), repeat)
+                cells[f"{region}/{strictness}/{lang}"] = {
+                    "descriptions": len(texts),
+                    "dropped": dropped,
+                    "descPerSec": round(len(texts) / seconds, 1) if seconds else 0.0,
+                }
+
+    thresholds = rj._active_experience_thresholds(EXPERIENCE_RULES)
+    for lang, texts in sorted(by_lang.items()):
+        seconds, dropped = _time_best(
+            lambda: sum(rj._find_experience_requirement(t, thresholds) is not None for t in texts),
+            repeat,
+        )
+        cells[f"experience/{lang}"] = {
+            "descriptions": len(texts),
+            "dropped": dropped,
+            "descPerSec": round(len(texts) / seconds, 1) if seconds else 0.0,
+        }
+    return cells
+
+
+# ── Baseline ────────────────────────────────────────────────────────────
+
+
+def compare_to_baseline(
+    result: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Return {"regressions": [...], "changedDrops": [...]} for cells present in both."""
+    out: Dict[str, List[Dict[str, Any]]] = {"regressions": [], "changedDrops": []}
+    if result.get("corpus") != baseline.get("corpus"):
+        return out
+    # A machine twice as slow on the calibration loop gets half the expected rate.
+    speed = baseline.get("calibrationSec", 0) / result["calibrationSec"] if result.get("calibrationSec") else 1.0
+    speed = speed or 1.0
+    for key, cell in result["cells"].items():
+        base = baseline.get("cells", {}).get(key)
+        if not base:
+            continue
+        expected = base["descPerSec"] * speed
+        if expected and cell["descPerSec"] < expected * (1 - tolerance):
+            out["regressions"].append(
+                {
+                    "cell": key,
+                    "descPerSec": cell["descPerSec"],
+                    "expected": round(expected, 1),
+                    "ratio": round(cell["descPerSec"] / expected, 3),
+                }
+            )
+        if cell["dropped"] != base["dropped"]:
+            out["changedDrops"].append({"cell": key, "dropped": cell["dropped"], "baseline": base["dropped"]})
+    return out
+
+
+def load_baseline(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+def _print_table(result: Dict[str, Any]) -> None:
+    print(f"calibration={result['calibrationSec']:.4f}s python={result['python']}")
+    for key, cell in result["cells"].items():
+        print(f"{key:<28} desc/s={cell['descPerSec']:>9.1f} dropped={cell['dropped']}/{cell['descriptions']}")
+
+
+def main(argv: List[str] | None = None) -> int:
+    from rights_filter import _STRICTNESS, _VALID_REGIONS
+
+    defaults = CorpusSpec()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--count", type=int, default=defaults.count)
+    parser.add_argument("--chars", type=int, default=defaults.chars, help="approximate English description length")
+    parser.add_argument("--zh-ratio", type=float, default=defaults.zh_ratio)
+    parser.add_argument("--anchor-density", type=float, default=defaults.anchor_density)
+    parser.add_argument("--region-density", type=float, default=defaults.region_density)
+    parser.add_argument("--negation-density", type=float, default=defaults.negation_density)
+    parser.add_argument("--year-density", type=float, default=defaults.year_density)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--regions", default=",".join(_VALID_REGIONS))
+    parser.add_argument("--strictness", default=",".join(_STRICTNESS))
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--json", action="store_true", help="print raw JSON results")
+    args = parser.parse_args(argv)
+
+    spec = CorpusSpec(
+        count=args.count,
+        chars=args.chars,
+        zh_ratio=args.zh_ratio,
+        anchor_density=args.anchor_density,
+        region_density=args.region_density,
+        negation_density=args.negation_density,
+        year_density=args.year_density,
+        seed=args.seed,
+    )
+    corpus = generate_corpus(spec)
+    result: Dict[str, Any] = {
+        "corpus": asdict(spec),
+        "python": platform.python_version(),
+        "calibrationSec": round(calibrate(), 5),
+        "cells": run_benchmark(
+            corpus,
+            [r.strip() for r in args.regions.split(",") if r.strip()],
+            [s.strip() for s in args.strictness.split(",") if s.strip()],
+            repeat=args.repeat,
+        ),
+    }
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline) or {}
+        if baseline.get("corpus") == result["corpus"]:
+            # Keep cells from earlier partial runs (e.g. --regions AU).
+            result["cells"] = {**baseline.get("cells", {}), **result["cells"]}
+        args.baseline.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+
+    baseline = None if args.update_baseline else load_baseline(args.baseline)
+    comparison = compare_to_baseline(result, baseline, args.tolerance) if baseline else None
+
+    if args.json:
+        print(json.dumps({**result, "comparison": comparison}, indent=2, ensure_ascii=False))
+    else:
+        _print_table(result)
+        if baseline is None:
+            print("no baseline comparison")
+        elif baseline.get("corpus") != result["corpus"]:
+            print("baseline was recorded with a different corpus spec; not compared")
+        else:
+            for item in comparison["changedDrops"]:
+                print(f"DROPS CHANGED {item['cell']}: {item['baseline']} -> {item['dropped']}")
+            for item in comparison["regressions"]:
+                print(f"REGRESSION {item['cell']}: {item['descPerSec']} desc/s, expected ~{item['expected']}")
+    return 1 if comparison and comparison["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
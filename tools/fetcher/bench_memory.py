@@ -0,0 +1,298 @@
+"""
+Peak-memory benchmark for the post-scrape pipeline in run_jobspy.py.
+
+Builds a synthetic jobspy-shaped frame (default 10k rows with ~3 KB
+descriptions and the extra columns jobspy returns), then runs the same
+stage sequence as main(): title filter -> keep_columns -> clean ->
+rights filter -> experience filter -> dedupe -> to_dict.
+
+`--stage fetch` measures the scrape stage instead: fetch_linkedin over
+`--terms` terms against a stubbed scrape_jobs that returns jobspy's full
+column set (salary, company metadata, skills, ...), once with the column
+projection run_jobspy applies after every scrape_jobs call and once
+without it.
+
+Each measurement runs in a fresh interpreter so ru_maxrss is not polluted
+by earlier runs. Usage:
+
+    python tools/fetcher/bench_memory.py --rows 10000
+    python tools/fetcher/bench_memory.py --rows 10000 --json
+    python tools/fetcher/bench_memory.py --stage fetch --rows 20000 --terms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.append(os.path.dirname(__file__))
+
+COMPANIES = [f"Company {i}" for i in range(250)]
+LOCATIONS = [
+    "Sydney, New South Wales, Australia",
+    "Melbourne, Victoria, Australia",
+    "Brisbane, Queensland, Australia",
+    "Remote",
+    "Canberra, Australian Capital Territory, Australia",
+]
+TITLES = [
+    "Software Engineer",
+    "Senior Software Engineer",
+    "Frontend Engineer",
+    "Backend Engineer",
+    "Full Stack Developer",
+    "Lead Data Engineer",
+    "Graduate Software Engineer",
+    "Platform Engineer",
+]
+JOB_TYPES = ["fulltime", "contract", "parttime", ""]
+JOB_LEVELS = ["Entry level", "Associate", "Mid-Senior level", "Not Applicable"]
+SENTENCES = [
+    "You will design, build and operate backend services used by millions of customers.",
+    "Work closely with product managers and designers to ship features end to end.",
+    "Experience with Python, TypeScript, Go or Java in production environments.",
+    "Familiarity with AWS, GCP or Azure, Docker and Kubernetes is highly valued.",
+    "We offer flexible hybrid working, learning budgets and generous parental leave.",
+    "Join a collaborative team that values code review, testing and observability.",
+    "<p>Responsibilities include on-call rotation and incident response.</p>",
+]
+# Each appears in roughly `SIGNAL_RATE` of descriptions so the filters drop
+# a realistic share of rows instead of everything.
+SIGNAL_SENTENCES = [
+    "Must have 5+ years of professional experience with distributed systems.",
+    "Applicants must be an Australian citizen or permanent resident.",
+    "Sponsorship is not available for this role.",
+    "Baseline clearance required.",
+    "至少4年工作经验，熟悉 Python 和数据平台。",
+]
+SIGNAL_RATE = 0.04
+COMPANY_BLURB = (
+    "We are a fast-growing technology company building products for customers across "
+    "Australia and New Zealand, with offices in Sydney, Melbourne and Brisbane. "
+)
+
+
+def synthetic_frame(rows: int, seed: int = 7, description_chars: int = 3000, first_id: int = 0):
+    import pandas as pd
+
+    rng = random.Random(seed)
+    records: List[Dict[str, Any]] = []
+    for i in range(rows):
+        # ~5% of rows are tracking-parameter variants of an earlier posting.
+        job_id = first_id + (rng.randrange(max(1, i)) if i and rng.random() < 0.05 else i)
+        parts: List[str] = []
+        while sum(len(p) for p in parts) < description_chars:
+            parts.append(rng.choice(SENTENCES))
+        parts.extend(sentence for sentence in SIGNAL_SENTENCES if rng.random() < SIGNAL_RATE)
+        parts.append(f"Reference {i}-{rng.random():.6f}.")
+        records.append(
+            {
+                "id": f"li-{job_id}",
+                "site": "linkedin",
+                "job_url": f"https://www.linkedin.com/jobs/view/{4000000000 + job_id}/?trk={i}",
+                "job_url_direct": f"https://careers.example.com/jobs/{job_id}",
+                "title": rng.choice(TITLES),
+                "company": rng.choice(COMPANIES),
+                "location": rng.choice(LOCATIONS),
+                "date_posted": "2026-10-18",
+                "job_type": rng.choice(JOB_TYPES),
+                "job_level": rng.choice(JOB_LEVELS),
+                "company_url": "https://www.linkedin.com/company/example",
+                "company_logo": "https://media.licdn.com/logo.png",
+                "emails": None,
+                "min_amount": None,
+                "max_amount": None,
+                "description": " ".join(parts),
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def jobspy_frame(rows: int, seed: int = 7, description_chars: int = 3000, first_id: int = 0):
+    """synthetic_frame plus the rest of the columns scrape_jobs returns."""
+    df = synthetic_frame(rows, seed=seed, description_chars=description_chars, first_id=first_id)
+    ids = range(first_id, first_id + rows)
+    return df.assign(
+        salary_source="direct_data",
+        interval="yearly",
+        currency="AUD",
+        is_remote=[i % 4 == 0 for i in ids],
+        job_function="Engineering and Information Technology",
+        listing_type=None,
+        company_industry="Software Development",
+        company_url_direct=[f"https://www.company{i % 250}.example.com" for i in ids],
+        company_addresses=[f"{i % 400} George Street, Sydney NSW 2000" for i in ids],
+        company_num_employees="1001-5000",
+        company_revenue=None,
+        company_description=[COMPANY_BLURB * 3 + f"Ref {i}." for i in ids],
+        skills=[f"Python, AWS, Kubernetes, SQL, skill-{i % 97}" for i in ids],
+        experience_range=None,
+        company_rating=None,
+        company_reviews_count=None,
+        vacancy_count=None,
+        work_from_home_type=None,
+    )
+
+
+def _max_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_pipeline(df) -> Dict[str, Any]:
+    import run_jobspy as rj
+    from rights_filter import filter_description_v2
+
+    df = rj.filter_title(df, ["Software Engineer"], enforce_include=False, exclude_terms=["senior", "lead"])
+    df = rj.keep_columns(df)
+    # Deep size of the import-schema frame excluding description, i.e. the
+    # short repetitive columns that categoricals are meant to shrink.
+    short_column_bytes = int(df.drop(columns=["description"]).memory_usage(deep=True).sum())
+    df = rj.clean_description(df)
+    df, _ = filter_description_v2(
+        df,
+        rules=["identity_requirement", "clearance_requirement", "sponsorship_unavailable"],
+    )
+    df, _ = rj.filter_experience_requirements(df, rules=["experience_requirement_4_plus"])
+    dedupe_start = time.perf_counter()
+    df = rj.dedupe_jobs(df)
+    dedupe_sec = time.perf_counter() - dedupe_start
+    return {
+        "items": len(df.to_dict(orient="records")),
+        "shortColumnsMb": round(short_column_bytes / (1024 * 1024), 2),
+        "dedupeSec": round(dedupe_sec, 3),
+    }
+
+
+def measure(rows: int) -> Dict[str, Any]:
+    import pandas as pd
+    import run_jobspy  # noqa: F401  (import cost is excluded from the delta)
+
+    df = synthetic_frame(rows)
+    setup_rss = _max_rss_mb()
+    start = time.perf_counter()
+    stats = run_pipeline(df)
+    elapsed = time.perf_counter() - start
+    peak_rss = _max_rss_mb()
+    return {
+        "rows": rows,
+        **stats,
+        "pandas": pd.__version__,
+        "setupRssMb": round(setup_rss, 1),
+        "peakRssMb": round(peak_rss, 1),
+        "pipelineRssDeltaMb": round(peak_rss - setup_rss, 1),
+        "elapsedSec": round(elapsed, 2),
+    }
+
+
+def measure_fetch(rows: int, terms: int, project: bool) -> Dict[str, Any]:
+    import pandas as pd
+    import run_jobspy as rj
+    from sleep_service import SleepService
+
+    rj.sleeper = SleepService.virtual()
+    if not project:
+        rj._project_scrape_columns = lambda df: df
+    per_term = max(1, rows // max(1, terms))
+    term_list = [f"Term {i}" for i in range(max(1, terms))]
+
+    def scrape_jobs(search_term: str, **_kwargs):
+        index = term_list.index(search_term)
+        return jobspy_frame(per_term, seed=index, first_id=index * per_term)
+
+    rj.scrape_jobs = scrape_jobs
+    sample_columns = len(jobspy_frame(1).columns)
+    setup_rss = _max_rss_mb()
+    start = time.perf_counter()
+    df = rj.fetch_linkedin(term_list, "Sydney", 24, per_term, fetch_description=False)
+    elapsed = time.perf_counter() - start
+    peak_rss = _max_rss_mb()
+    return {
+        "rows": len(df),
+        "terms": len(term_list),
+        "project": project,
+        "scrapedColumns": sample_columns,
+        "keptColumns": len(df.columns),
+        "frameMb": round(int(df.memory_usage(deep=True).sum()) / (1024 * 1024), 1),
+        "pandas": pd.__version__,
+        "setupRssMb": round(setup_rss, 1),
+        "peakRssMb": round(peak_rss, 1),
+        "fetchRssDeltaMb": round(peak_rss - setup_rss, 1),
+        "elapsedSec": round(elapsed, 2),
+    }
+
+
+def _child(args: List[str]) -> Dict[str, Any]:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--stage", choices=["pipeline", "fetch"], default="pipeline")
+    parser.add_argument("--terms", type=int, default=20, help="terms for --stage fetch")
+    parser.add_argument("--no-project", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help="print the raw JSON result")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        if args.stage == "fetch":
+            print(json.dumps(measure_fetch(args.rows, args.terms, project=not args.no_project)))
+        else:
+            print(json.dumps(measure(args.rows)))
+        return 0
+
+    if args.stage == "fetch":
+        common = ["--stage", "fetch", "--rows", str(args.rows), "--terms", str(args.terms)]
+        full = _child(common + ["--no-project"])
+        projected = _child(common)
+        result = {
+            "full": full,
+            "projected": projected,
+            "frameReduction": round(1 - projected["frameMb"] / full["frameMb"], 3) if full["frameMb"] else None,
+            "rssDeltaReduction": (
+                round(1 - projected["fetchRssDeltaMb"] / full["fetchRssDeltaMb"], 3) if full["fetchRssDeltaMb"] else None
+            ),
+        }
+        if args.json:
+            print(json.dumps(result, indent=2))
+            return 0
+        for label in ("full", "projected"):
+            print(
+                "{label}: rows={rows} columns={keptColumns}/{scrapedColumns} frame={frameMb}MB "
+                "peak_rss={peakRssMb}MB fetch_delta={fetchRssDeltaMb}MB elapsed={elapsedSec}s".format(
+                    label=label, **result[label]
+                )
+            )
+        print("frame_reduction={frameReduction} rss_delta_reduction={rssDeltaReduction}".format(**result))
+        return 0
+
+    result = _child(["--rows", str(args.rows)])
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(
+            "rows={rows} items={items} pandas={pandas} setup_rss={setupRssMb}MB "
+            "peak_rss={peakRssMb}MB pipeline_delta={pipelineRssDeltaMb}MB "
+            "short_columns={shortColumnsMb}MB dedupe={dedupeSec}s elapsed={elapsedSec}s".format(**result)
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Benchmark for per-term scraping on threads vs worker processes.
+
+Each term runs a synthetic stand-in for jobspy's LinkedIn scrape:
+`--latency-ms` of network wait per result page, BeautifulSoup over a
+page of 25 job cards (what jobspy does with every page), then a
+jobspy-shaped DataFrame with ~3 KB descriptions. With low latency the
+parse and frame build dominate, which is the case where threads queue on
+the GIL.
+
+Both modes schedule terms on `workers` threads, like fetch_linkedin:
+
+  threads    the thread runs the scrape and projects the frame itself
+  processes  the thread hands the scrape to a ProcessScraper with the
+             same number of workers and decodes the projected frame it
+             sends back (Arrow IPC when pyarrow is installed, otherwise
+             pickle protocol 5)
+
+The process pool is started and warmed up before timing, as the resident
+daemon keeps it. Speedup needs as many free cores as workers; `cpus` in
+the output says what the machine had. Usage:
+
+    python tools/fetcher/bench_scrape_pool.py
+    python tools/fetcher/bench_scrape_pool.py --terms 24 --results 100 --workers 2,4,6 --latency-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(__file__))
+
+from process_scrape import DEFAULT_FORMAT, ProcessScraper, scrape_encoded  # noqa: E402
+
+CARDS_PER_PAGE = 25
+# The columns run_jobspy.SCRAPE_COLUMNS keeps from a LinkedIn frame.
+PIPELINE_COLUMNS = (
+    "id",
+    "site",
+    "job_url",
+    "title",
+    "company",
+    "location",
+    "date_posted",
+    "job_type",
+    "job_level",
+    "description",
+)
+_DESCRIPTION = (
+    "We are looking for a software engineer to design, build and operate services "
+    "in Python and TypeScript on AWS. You will work with product and design, own "
+    "features end to end, review code and mentor others. "
+)
+
+
+# ── Synthetic scrape ────────────────────────────────────────────────────
+
+
+def _card_page(term: str, page: int) -> str:
+    cards = []
+    for i in range(CARDS_PER_PAGE):
+        job_id = f"{abs(hash(term)) % 10_000:04d}{page:03d}{i:03d}"
+        cards.append(
+            '<li><div class="base-card base-search-card" data-entity-urn="urn:li:jobPosting:{id}">'
+            '<a class="base-card__full-link" href="https://au.linkedin.com/jobs/view/{id}?refId=x&amp;trk=y">'
+            '<span class="sr-only">{term} {i}</span></a>'
+            '<div class="base-search-card__info"><h3 class="base-search-card__title">{term} {i}</h3>'
+            '<h4 class="base-search-card__subtitle"><a href="https://au.linkedin.com/company/c{c}">Company {c}</a></h4>'
+            '<div class="base-search-card__metadata"><span class="job-search-card__location">Sydney, New South Wales, Australia</span>'
+            '<time class="job-search-card__listdate" datetime="2026-10-{day:02d}">1 day ago</time></div></div>'
+            "</div></li>".format(id=job_id, term=term, i=i, c=i % 50, day=1 + i % 28)
+        )
+    return "<html><body><ul class=\"jobs-search__results-list\">" + "".join(cards) + "</ul></body></html>"
+
+
+def synthetic_scrape(
+    search_term: str = "",
+    results_wanted: int = 50,
+    latency_ms: float = 0.0,
+    description_chars: int = 3000,
+    **_: Any,
+) -> pd.DataFrame:
+    """A module-level (picklable) stand-in for scrape_jobs(site_name=["linkedin"])."""
+    from bs4 import BeautifulSoup
+
+    rows: List[Dict[str, Any]] = []
+    page = 0
+    while len(rows) < results_wanted:
+        time.sleep(latency_ms / 1000)
+        soup = BeautifulSoup(_card_page(search_term, page), "html.parser")
+        for card in soup.find_all("div", class_="base-search-card"):
+            link = card.find("a", class_="base-card__full-link")
+            company = card.find("h4", class_="base-search-card__subtitle")
+            place = card.find("span", class_="job-search-card__location")
+            posted = card.find("time")
+            job_id = card["data-entity-urn"].rsplit(":", 1)[-1]
+            rows.append(
+                {
+                    "id": f"li-{job_id}",
+                    "site": "linkedin",
+                    "job_url": link["href"].split("?")[0],
+                    "job_url_direct": None,
+                    "title": card.find("h3").get_text(strip=True),
+                    "company": company.get_text(strip=True),
+                    "location": place.get_text(strip=True),
+                    "date_posted": posted["datetime"],
+                    "job_type": "fulltime",
+                    "salary_source": None,
+                    "interval": None,
+                    "min_amount": None,
+                    "max_amount": None,
+                    "currency": None,
+                    "is_remote": False,
+                    "job_level": "mid-senior level",
+                    "job_function": "Engineering and Information Technology",
+                    "listing_type": None,
+                    "emails": None,
+                    "description": (_DESCRIPTION * (description_chars // len(_DESCRIPTION) + 1))[:description_chars]
+                    + job_id,
+                    "company_industry": "Software Development",
+                    "company_url": company.find("a")["href"],
+                    "company_logo": None,
+                    "company_url_direct": None,
+                    "company_addresses": None,
+                    "company_num_employees": None,
+                    "company_revenue": None,
+                    "company_description": None,
+                    "skills": None,
+                }
+            )
+        page += 1
+    return pd.DataFrame(rows[:results_wanted])
+
+
+# ── Benchmark ───────────────────────────────────────────────────────────
+
+
+def _project(df: pd.DataFrame) -> pd.DataFrame:
+    return df[[c for c in df.columns if c in PIPELINE_COLUMNS]]
+
+
+def _run(scrape, terms: List[str], workers: int, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(lambda term: scrape(search_term=term, **kwargs), terms))
+    elapsed = time.perf_counter() - started
+    return {
+        "elapsedSec": round(elapsed, 3),
+        "termsPerSec": round(len(terms) / elapsed, 2) if elapsed else None,
+        "rows": sum(len(frame) for frame in frames),
+    }
+
+
+def bench(terms: int, results: int, workers: List[int], latency_ms: float, fmt: str) -> Dict[str, Any]:
+    term_list = [f"Software Engineer {i}" for i in range(terms)]
+    kwargs = {"results_wanted": results, "latency_ms": latency_ms}
+    sample = synthetic_scrape(search_term=term_list[0], **kwargs)
+    payload, _ = scrape_encoded(synthetic_scrape, {"search_term": term_list[0], **kwargs}, PIPELINE_COLUMNS, fmt)
+    cells: Dict[str, Any] = {
+        "cpus": os.cpu_count(),
+        "format": fmt,
+        "frameMbPerTerm": round(int(sample.memory_usage(deep=True).sum()) / (1024 * 1024), 3),
+        "payloadMbPerTerm": round(len(payload) / (1024 * 1024), 3),
+    }
+    for count in workers:
+        threads = _run(lambda **kw: _project(synthetic_scrape(**kw)), term_list, count, kwargs)
+        scraper = ProcessScraper(count, target=synthetic_scrape, columns=PIPELINE_COLUMNS, fmt=fmt)
+        try:
+            # Start every worker and import bs4 there before timing.
+            _run(scraper.scrape, term_list[:count], count, {"results_wanted": 1})
+            scraper.reset_stats()
+            processes = _run(scraper.scrape, term_list, count, kwargs)
+            processes["decodeSec"] = scraper.summary()["decodeSec"]
+        finally:
+            scraper.shutdown()
+        cells[f"workers={count}"] = {
+            "threads": threads,
+            "processes": processes,
+            "speedup": round(threads["elapsedSec"] / processes["elapsedSec"], 2) if processes["elapsedSec"] else None,
+        }
+    return cells
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--terms", type=int, default=12)
+    parser.add_argument("--results", type=int, default=100, help="results_wanted per term")
+    parser.add_argument("--workers", default="2,4,6")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="network wait per result page")
+    parser.add_argument("--format", default=DEFAULT_FORMAT, choices=("arrow", "pickle"))
+    args = parser.parse_args(argv)
+
+    result = bench(
+        args.terms,
+        args.results,
+        [int(w) for w in args.workers.split(",") if w.strip()],
+        args.latency_ms,
+        args.format,
+    )
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,303 @@
+"""
+cn_fetcher — CN job listings from search-engine result pages.
+
+jobspy has no CN boards, and BOSS直聘 (zhipin.com) blocks direct
+scraping, but its job pages are indexed. CnSearchFetcher asks Bing for
+`<term> <city> site:zhipin.com`, one request per result page, and turns
+each `job_detail` hit into a listing row:
+
+  job_url      https://www.zhipin.com/job_detail/<id>.html
+  title        role, from the result title (「全栈工程师招聘」_某公司招聘-BOSS直聘)
+  company      company, from the same title when present
+  location     the run location
+  description  the result snippet (salary, 经验, 学历 lines usually
+               included, which is what the experience filter reads)
+
+run_jobspy.fetch_sources runs it as the `zhipin` source for CN-market
+runs, so rows go through the same clean/filter/dedupe/import pipeline as
+jobspy's. This is not the production CN path: the trigger route runs CN
+FetchRuns in-process through processCnFetchRun and never dispatches them
+to this worker.
+
+Concurrency: every (term, location, page) query goes into one pool of
+`workers` threads, spaced by the source's RateLimiter. A (term, location)
+unit is yielded as soon as all of its pages are in. A page that was
+fetched and came back shorter than a full page marks the unit exhausted,
+and its pages that have not started are skipped. A page whose fetch
+failed counts in `failed_pages` and does not end the unit.
+
+Blocking: Bing answers scripted traffic with a Turnstile challenge page
+(tools/fetcher/bing_debug.html is one). Retrying a challenge only
+escalates it, so the first challenge stops every query that has not
+started; terms finished before that are still returned.
+
+Parsing is a single pass over the page. A string scan finds each
+`b_algo` block, and small anchored regexes pull out the link, title and
+snippet inside it. No DOM is built. bench_cn.py measures it against an
+html.parser extractor.
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+import math
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from html import unescape
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+import requests
+
+logger = logging.getLogger("jobspy_runner.cn")
+
+BING_SEARCH_URL = "https://www.bing.com/search"
+ZHIPIN_SITE = "zhipin.com"
+RESULTS_PER_PAGE = 10
+DEFAULT_MAX_PAGES = 5
+DEFAULT_TIMEOUT_SEC = 12.0
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+)
+
+# ── Parsing ─────────────────────────────────────────────────────────────
+
+_ALGO_MARKER = 'class="b_algo'
+_BLOCK_END_MARKERS = ("</ol>", 'id="b_context"', 'class="b_pag')
+_CHALLENGE_MARKERS = ('id="turnstile-widget"', "b_captcha", "请解决以下难题以继续")
+_LINK_RE = re.compile(r'<h2[^>]*>\s*<a\b[^>]*?\bhref="([^"]+)"[^>]*>(.*?)</a>', re.S)
+_SNIPPET_RE = re.compile(r"<p\b[^>]*>(.*?)</p>", re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+_ZHIPIN_JOB_RE = re.compile(r"zhipin\.com/job_detail/([A-Za-z0-9_~\-]+)\.html", re.I)
+_TITLE_SUFFIX_RE = re.compile(r"\s*[-_|–—]\s*BOSS直聘.*$")
+_TITLE_SPLIT_RE = re.compile(r"[」】]\s*[_\-|]?\s*|\s*[_|]\s*")
+
+
+@dataclass
+class SearchResult:
+    url: str
+    title: str
+    snippet: str
+
+
+@dataclass
+class SearchPage:
+    results: List[SearchResult] = field(default_factory=list)
+    blocked: bool = False
+
+
+def _text(fragment: str) -> str:
+    return _SPACE_RE.sub(" ", unescape(_TAG_RE.sub("", fragment))).strip()
+
+
+def _unwrap_bing_link(href: str) -> str:
+    # Click-tracking links carry the target base64-encoded in `u`
+    # ("a1" + urlsafe base64, unpadded).
+    href = unescape(href)
+    parts = urlsplit(href)
+    if not parts.netloc.endswith("bing.com") or not parts.path.startswith("/ck/"):
+        return href
+    encoded = (parse_qs(parts.query).get("u") or [""])[0]
+    if not encoded.startswith("a1"):
+        return href
+    payload = encoded[2:]
+    try:
+        return base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        return href
+
+
+def parse_results(html: str) -> SearchPage:
+    """Organic results of one Bing page; `blocked` for challenge pages."""
+    html = html or ""
+    starts: List[int] = []
+    pos = html.find(_ALGO_MARKER)
+    while pos != -1:
+        starts.append(pos)
+        pos = html.find(_ALGO_MARKER, pos + len(_ALGO_MARKER))
+    if not starts:
+        return SearchPage(blocked=any(marker in html for marker in _CHALLENGE_MARKERS))
+
+    tail = len(html)
+    for marker in _BLOCK_END_MARKERS:
+        end = html.find(marker, starts[-1])
+        if end != -1:
+            tail = min(tail, end)
+    results: List[SearchResult] = []
+    for start, end in zip(starts, starts[1:] + [tail]):
+        block = html[start:end]
+        link = _LINK_RE.search(block)
+        if link is None:
+            continue
+        snippet = _SNIPPET_RE.search(block, link.end())
+        results.append(
+            SearchResult(
+                url=_unwrap_bing_link(link.group(1)),
+                title=_text(link.group(2)),
+                snippet=_text(snippet.group(1)) if snippet else "",
+            )
+        )
+    return SearchPage(results=results)
+
+
+def split_zhipin_title(raw: str) -> Tuple[str, str]:
+    """(role, company) from a zhipin result title; company may be ""."""
+    text = _TITLE_SUFFIX_RE.sub("", raw or "").strip()
+    parts = [part.strip(" 「」【】") for part in _TITLE_SPLIT_RE.split(text.lstrip(" 「【"), maxsplit=1)]
+    role = re.sub(r"招聘$", "", parts[0]).strip()
+    company = re.sub(r"招聘$", "", parts[1]).strip() if len(parts) > 1 else ""
+    return role, company
+
+
+def results_to_rows(results: List[SearchResult], location: str) -> List[Dict[str, str]]:
+    rows: List[Dict[str, str]] = []
+    for result in results:
+        match = _ZHIPIN_JOB_RE.search(result.url)
+        if match is None:
+            continue  # company, listing and article pages
+        title, company = split_zhipin_title(result.title)
+        rows.append(
+            {
+                "job_url": f"https://www.zhipin.com/job_detail/{match.group(1)}.html",
+                "title": title,
+                "company": company,
+                "location": location,
+                "description": result.snippet,
+            }
+        )
+    return rows
+
+
+# ── Fetching ────────────────────────────────────────────────────────────
+
+
+class CnSearchFetcher:
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        workers: int = 4,
+        acquire: Optional[Callable[[], object]] = None,
+        retries: int = 1,
+        backoff_sec: float = 10.0,
+        sleep: Callable[[float], None] = time.sleep,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        timeout_sec: float = DEFAULT_TIMEOUT_SEC,
+        base_url: str = BING_SEARCH_URL,
+        site: str = ZHIPIN_SITE,
+        expired: Callable[[], bool] = lambda: False,
+    ) -> None:
+        self.session = session or requests.Session()
+        self.workers = max(1, workers)
+        self._acquire = acquire or (lambda: None)
+        self.retries = max(0, retries)
+        self.backoff_sec = max(0.0, backoff_sec)
+        self._sleep = sleep
+        self.max_pages = max(1, max_pages)
+        self.timeout_sec = timeout_sec
+        self.base_url = base_url
+        self.site = site
+        self._expired = expired
+        self._lock = threading.Lock()
+        self._blocked = threading.Event()
+        self.requests = 0
+        self.failed_pages = 0
+        self.parse_sec = 0.0
+        self.term_seconds: Dict[Tuple[str, str], float] = {}
+
+    @property
+    def blocked(self) -> bool:
+        return self._blocked.is_set()
+
+    def _query(self, term: str, location: str) -> str:
+        return " ".join(part for part in (term, location, f"site:{self.site}") if part)
+
+    def _fetch_page(self, term: str, location: str, page: int) -> Optional[SearchPage]:
+        # None when every attempt failed, so a failure is never read as the
+        # end of the results.
+        params = {"q": self._query(term, location), "first": page * RESULTS_PER_PAGE + 1, "count": RESULTS_PER_PAGE}
+        headers = {"User-Agent": USER_AGENT, "Accept-Language": "zh-CN,zh;q=0.9"}
+        for attempt in range(self.retries + 1):
+            self._acquire()
+            with self._lock:
+                self.requests += 1
+            try:
+                res = self.session.get(self.base_url, params=params, headers=headers, timeout=self.timeout_sec)
+                if res.status_code >= 400:
+                    raise RuntimeError(f"http_{res.status_code}")
+                started = time.perf_counter()
+                parsed = parse_results(res.text or "")
+                with self._lock:
+                    self.parse_sec += time.perf_counter() - started
+                return parsed
+            except Exception as err:
+                if attempt >= self.retries or self._expired():
+                    logger.warning("cn search failed term=%s page=%s error=%s", term, page, err)
+                    with self._lock:
+                        self.failed_pages += 1
+                    return None
+                self._sleep(self.backoff_sec * (2**attempt))
+        return None
+
+    def fetch(self, terms: List[str], location: str, results_wanted: int) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Yield (term, frame) as each term's pages complete; empty terms are skipped."""
+        for term, _location, frame in self.fetch_units([(term, location) for term in terms], results_wanted):
+            yield term, frame
+
+    def fetch_units(
+        self, units: List[Tuple[str, str]], results_wanted: int
+    ) -> Iterator[Tuple[str, str, pd.DataFrame]]:
+        """fetch() over (term, location) units; yields (term, location, frame)."""
+        pages = min(self.max_pages, max(1, math.ceil(max(1, results_wanted) / RESULTS_PER_PAGE)))
+        exhausted: Dict[Tuple[str, str], int] = {}
+        remaining = {unit: pages for unit in units}
+        collected: Dict[Tuple[str, str], Dict[int, List[SearchResult]]] = {unit: {} for unit in units}
+
+        def run(unit: Tuple[str, str], page: int) -> Tuple[Tuple[str, str], int, Optional[SearchPage], float]:
+            # Skip pages past a unit's last partial page, and everything
+            # once the engine served a challenge or the run ran out of time.
+            with self._lock:
+                past_end = page > exhausted.get(unit, pages)
+            if past_end or self.blocked or self._expired():
+                return unit, page, None, 0.0
+            started = time.perf_counter()
+            result = self._fetch_page(unit[0], unit[1], page)
+            elapsed = time.perf_counter() - started
+            if result is None:
+                return unit, page, None, elapsed
+            if result.blocked:
+                self._blocked.set()
+            elif len(result.results) < RESULTS_PER_PAGE:
+                with self._lock:
+                    exhausted[unit] = min(exhausted.get(unit, pages), page)
+            return unit, page, result, elapsed
+
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        running = {pool.submit(run, unit, page) for unit in units for page in range(pages)}
+        try:
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    unit, page, result, elapsed = future.result()
+                    self.term_seconds[unit] = self.term_seconds.get(unit, 0.0) + elapsed
+                    if result is not None and not result.blocked:
+                        collected[unit][page] = result.results
+                    remaining[unit] -= 1
+                    if remaining[unit]:
+                        continue
+                    ordered = [hit for index in sorted(collected[unit]) for hit in collected[unit][index]]
+                    rows = results_to_rows(ordered, unit[1])
+                    if rows:
+                        yield unit[0], unit[1], pd.DataFrame(rows).drop_duplicates(subset=["job_url"], keep="first")
+        finally:
+            for future in running:
+                future.cancel()
+            pool.shutdown(wait=True)
+        if self.blocked:
+            logger.warning("cn search hit a challenge page; remaining queries skipped")
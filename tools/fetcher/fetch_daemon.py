@@ -0,0 +1,233 @@
+"""
+fetch_daemon — resident worker that serves QUEUED FetchRuns.
+
+The GitHub Actions path pays a cold start per run: runner boot, checkout,
+pip install, importing pandas/jobspy, compiling the rights matchers and
+opening fresh TLS connections to LinkedIn and the API. On one always-on
+box the daemon pays that once and then loops:
+
+  1. poll the queue for runs that were triggered but not started
+  2. serve them through run_jobspy.run_fetch_runs (several at once go
+     through batch mode, so shared terms are scraped once)
+  3. sleep `poll_sec` when the queue is empty
+
+State that survives between runs:
+
+  - imported modules and the compiled ExclusionMatchers
+    (rights_filter.get_matcher)
+  - run_jobspy.http, the pooled requests session (keep-alive connections
+    to LinkedIn and the API)
+  - proxy health (run_jobspy._mark_proxy_failed cooldowns)
+  - on-disk caches: with FETCH_DAEMON_STATE_DIR set, the scrape cache,
+    known-jobs sets and query plans default to directories under it
+    instead of being restored/saved by the workflow
+
+Queues:
+
+  - HttpRunQueue polls GET /api/fetch-runs/queued (set
+    FETCH_WORKER_MODE=daemon on the web app so triggers stop dispatching
+    the workflow). A run stays listed until the worker marks it RUNNING,
+    which happens before the next poll, so run a single daemon per
+    deployment.
+  - DirRunQueue is the local stand-in: one `<run id>.queued` file per
+    run in FETCH_QUEUE_DIR, claimed by renaming it to `.claimed`.
+
+A run that raises is marked FAILED and the loop carries on; cancelled
+runs and batch failures are already recorded by run_jobspy itself.
+
+Usage:
+  python tools/fetcher/fetch_daemon.py            # poll until SIGTERM
+  python tools/fetcher/fetch_daemon.py --once     # drain one poll and exit
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional
+
+sys.path.append(os.path.dirname(__file__))
+
+import run_jobspy as rj  # noqa: E402
+
+logger = logging.getLogger("jobspy_runner.daemon")
+
+DEFAULT_POLL_SEC = 15.0
+DEFAULT_MAX_BATCH = 5
+
+# Per-run state directories that default under FETCH_DAEMON_STATE_DIR.
+STATE_DIR_ENV = {
+    "FETCH_SCRAPE_CACHE_DIR": "scrape-cache",
+    "FETCH_KNOWN_JOBS_DIR": "known-jobs",
+    "FETCH_QUERY_PLAN_DIR": "query-plans",
+}
+
+
+# ── Queues ──────────────────────────────────────────────────────────────
+
+
+class DirRunQueue:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def enqueue(self, run_id: str) -> None:
+        (self.root / f"{run_id}.queued").touch()
+
+    def claim(self, limit: int) -> List[str]:
+        queued = sorted(self.root.glob("*.queued"), key=lambda path: (path.stat().st_mtime, path.name))
+        claimed: List[str] = []
+        for path in queued:
+            if len(claimed) >= limit:
+                break
+            try:
+                path.rename(path.with_suffix(".claimed"))
+            except FileNotFoundError:
+                continue  # claimed by another worker since the glob
+            claimed.append(path.stem)
+        return claimed
+
+    def done(self, run_id: str) -> None:
+        try:
+            (self.root / f"{run_id}.claimed").unlink()
+        except FileNotFoundError:
+            pass
+
+
+class HttpRunQueue:
+    def __init__(self, base: str, headers: dict) -> None:
+        self.base = base
+        self.headers = headers
+
+    def claim(self, limit: int) -> List[str]:
+        res = rj.http.get(
+            f"{self.base}/api/fetch-runs/queued",
+            params={"limit": limit},
+            headers=self.headers,
+            timeout=30,
+        )
+        res.raise_for_status()
+        return [run["id"] for run in res.json().get("runs") or []]
+
+    def done(self, run_id: str) -> None:
+        pass  # the run's own status update is the acknowledgement
+
+
+# ── Daemon ──────────────────────────────────────────────────────────────
+
+
+def _float_env(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def apply_state_dir(state_dir: Optional[str]) -> None:
+    """Point unset per-run state directories at the daemon's state dir."""
+    if not state_dir:
+        return
+    for env_name, sub in STATE_DIR_ENV.items():
+        if not os.environ.get(env_name, "").strip():
+            os.environ[env_name] = str(Path(state_dir) / sub)
+
+
+class FetchDaemon:
+    def __init__(
+        self,
+        queue,
+        poll_sec: float = DEFAULT_POLL_SEC,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        runner: Optional[Callable[[List[str]], None]] = None,
+        mark_failed: Optional[Callable[[List[str], str], None]] = None,
+    ) -> None:
+        self.queue = queue
+        self.poll_sec = max(0.0, poll_sec)
+        self.max_batch = max(1, max_batch)
+        self._runner = runner or rj.run_fetch_runs
+        self._mark_failed = mark_failed or rj._mark_runs_failed
+        self.stop_event = threading.Event()
+        self.served = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls, queue) -> "FetchDaemon":
+        raw_batch = os.environ.get("FETCH_DAEMON_MAX_BATCH", "").strip()
+        try:
+            max_batch = int(raw_batch) if raw_batch else DEFAULT_MAX_BATCH
+        except ValueError:
+            max_batch = DEFAULT_MAX_BATCH
+        return cls(queue, poll_sec=_float_env("FETCH_DAEMON_POLL_SEC", DEFAULT_POLL_SEC), max_batch=max_batch)
+
+    def run_once(self) -> int:
+        """Serve whatever the queue hands out now; returns the number of runs."""
+        try:
+            run_ids = self.queue.claim(self.max_batch)
+        except Exception as err:
+            logger.warning("queue poll failed: %s", err)
+            return 0
+        if not run_ids:
+            return 0
+
+        logger.info("Serving runs=%s", ",".join(run_ids))
+        try:
+            self._runner(run_ids)
+        except SystemExit as exit_:
+            # Cancelled (0) or batch runs already marked FAILED (1).
+            if exit_.code not in (None, 0):
+                self.failed += 1
+        except Exception as err:
+            logger.exception("runs failed ids=%s", ",".join(run_ids))
+            self._mark_failed(run_ids, str(err))
+            self.failed += 1
+        finally:
+            for run_id in run_ids:
+                self.queue.done(run_id)
+        self.served += len(run_ids)
+        return len(run_ids)
+
+    def serve(self, max_runs: Optional[int] = None) -> None:
+        while not self.stop_event.is_set():
+            served = self.run_once()
+            if max_runs is not None and self.served >= max_runs:
+                break
+            if not served:
+                self.stop_event.wait(self.poll_sec)
+        logger.info("Daemon stopped served=%s failed=%s", self.served, self.failed)
+
+    def stop(self, *_args) -> None:
+        self.stop_event.set()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0].strip())
+    parser.add_argument("--queue-dir", default=os.environ.get("FETCH_QUEUE_DIR", "").strip() or None)
+    parser.add_argument("--once", action="store_true", help="serve one poll and exit")
+    parser.add_argument("--max-runs", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    apply_state_dir(os.environ.get("FETCH_DAEMON_STATE_DIR", "").strip())
+    if args.queue_dir:
+        queue = DirRunQueue(Path(args.queue_dir))
+    else:
+        queue = HttpRunQueue(rj.api_base(), rj.headers_secret("FETCH_RUN_SECRET", "x-fetch-run-secret"))
+
+    daemon = FetchDaemon.from_env(queue)
+    if args.once:
+        daemon.run_once()
+        return 0
+    # Finish the run in flight, then exit.
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    daemon.serve(max_runs=args.max_runs)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
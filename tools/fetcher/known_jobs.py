@@ -0,0 +1,115 @@
+"""
+KnownJobs — canonical job URLs a user has already had imported.
+
+Paged fetch mode in run_jobspy.py checks every scraped page against this
+set (plus the URLs seen earlier in the same run) and stops a term once
+`FETCH_EARLY_STOP_KNOWN` consecutive known postings come back: LinkedIn
+returns recent postings first, so a long streak of known jobs means the
+rest of the term was imported by an earlier run.
+
+With FETCH_KNOWN_JOBS_DIR set, the set persists between runs as one file
+per user (`<sha1(email)[:16]>.tsv`, "url<TAB>epoch" per line). Entries
+older than `max_age_days` are dropped on save so the file tracks the
+schedule's look-back window rather than growing forever.
+
+Batch mode scrapes one term for several users at once, so it stops on
+`KnownJobs.common(...)`: only the URLs every one of those users already
+had, which never cuts a term short for a user who lacks them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Optional
+
+logger = logging.getLogger("jobspy_runner.known_jobs")
+
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+class KnownJobs:
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_age_sec = max(0.0, max_age_days) * 86400
+        self._lock = threading.Lock()
+        self._seen_at: Dict[str, float] = {}
+        self._previous: FrozenSet[str] = frozenset()
+        self.loaded = 0
+        if self.path is not None:
+            self._load()
+
+    @classmethod
+    def from_env(cls, user_email: str) -> "KnownJobs":
+        # Without FETCH_KNOWN_JOBS_DIR the set only spans the current run.
+        raw_dir = os.environ.get("FETCH_KNOWN_JOBS_DIR", "").strip()
+        raw_age = os.environ.get("FETCH_KNOWN_JOBS_MAX_AGE_DAYS", "").strip()
+        try:
+            max_age_days = float(raw_age) if raw_age else DEFAULT_MAX_AGE_DAYS
+        except ValueError:
+            max_age_days = DEFAULT_MAX_AGE_DAYS
+        if not raw_dir:
+            return cls(max_age_days=max_age_days)
+        digest = hashlib.sha1((user_email or "").strip().lower().encode("utf-8")).hexdigest()[:16]
+        return cls(Path(raw_dir) / f"{digest}.tsv", max_age_days=max_age_days)
+
+    @classmethod
+    def common(cls, sets: Iterable["KnownJobs"]) -> "KnownJobs":
+        # An unpersisted set whose "known before the run" URLs are the ones
+        # all of `sets` had loaded.
+        previous = [known._previous for known in sets]
+        shared = cls()
+        shared._previous = frozenset.intersection(*previous) if previous else frozenset()
+        shared.loaded = len(shared._previous)
+        return shared
+
+    def __contains__(self, url: object) -> bool:
+        return url in self._seen_at
+
+    def __len__(self) -> int:
+        return len(self._seen_at)
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            url, _, stamp = line.partition("\t")
+            try:
+                self._seen_at[url] = float(stamp)
+            except ValueError:
+                continue  # torn line from an interrupted write
+        self._previous = frozenset(self._seen_at)
+        self.loaded = len(self._previous)
+
+    def known_before_run(self, url: str) -> bool:
+        # Membership in the persisted set as loaded, ignoring this run's adds.
+        return url in self._previous
+
+    def add_many(self, urls: Iterable[str], now: Optional[float] = None) -> None:
+        stamp = time.time() if now is None else now
+        with self._lock:
+            for url in urls:
+                if url:
+                    self._seen_at[url] = stamp
+
+    def save(self, now: Optional[float] = None) -> None:
+        if self.path is None:
+            return
+        cutoff = (time.time() if now is None else now) - self.max_age_sec
+        with self._lock:
+            lines = [f"{url}\t{stamp:.0f}" for url, stamp in self._seen_at.items() if stamp >= cutoff]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tsv.tmp")
+        tmp.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        os.replace(tmp, self.path)
+        logger.info("Saved known jobs path=%s urls=%s", self.path, len(lines))
@@ -0,0 +1,200 @@
+"""
+NearDuplicateIndex — MinHash + LSH detection of reposted / cross-query
+duplicate job postings whose URLs differ.
+
+Pipeline (per row):
+  1. Normalize title + company + description to lowercase alnum tokens
+  2. Word 3-gram shingles, hashed with crc32 (deterministic across runs)
+  3. MinHash signature (`num_perm` universal hashes, numpy-vectorized)
+  4. LSH banding: `bands` buckets keyed by (company, band index, band hash)
+  5. Candidates are verified against the bucket's first member by
+     signature agreement (estimated Jaccard) >= threshold
+
+Each row is compared with at most one representative per band, so the
+stage stays linear in row count. Rows whose descriptions are too short to
+fingerprint are never merged — exact URL dedupe remains responsible for
+them (see run_jobspy.dedupe_jobs).
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.85
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_MIN_DESCRIPTION_TOKENS = 20
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TOKEN_SPLIT_RE = re.compile(r"[^0-9a-z\u4e00-\u9fff]+")
+
+
+@dataclass
+class NearDuplicateMatch:
+    key: Hashable
+    similarity: float
+
+
+def _tokens(text: str) -> List[str]:
+    return [tok for tok in _TOKEN_SPLIT_RE.split(str(text or "").lower()) if tok]
+
+
+def _text_column(df: pd.DataFrame, name: str) -> pd.Series:
+    if name not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    # astype(object) first so categorical columns accept the "" fill value.
+    return df[name].astype(object).fillna("").astype(str)
+
+
+class NearDuplicateIndex:
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        min_description_tokens: int = DEFAULT_MIN_DESCRIPTION_TOKENS,
+        seed: int = 1,
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold!r}")
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a positive multiple of bands ({bands})")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.shingle_size = max(1, shingle_size)
+        self.min_description_tokens = max(1, min_description_tokens)
+
+        rng = np.random.RandomState(seed)
+        # a < 2**31 and x < 2**32 keep a*x + b inside uint64 before the modulus.
+        self._a = rng.randint(1, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+        self.rows_seen = 0
+        self._buckets: Dict[Tuple[str, int, bytes], Hashable] = {}
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    # ── Fingerprinting ──────────────────────────────────────────────────
+
+    def signature(self, title: str, company: str, description: str) -> Optional[np.ndarray]:
+        desc_tokens = _tokens(description)
+        if len(desc_tokens) < self.min_description_tokens:
+            return None
+        tokens = _tokens(title) + _tokens(company) + desc_tokens
+        k = self.shingle_size
+        shingles = {" ".join(tokens[i : i + k]) for i in range(max(1, len(tokens) - k + 1))}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def _band_keys(self, company_key: str, sig: np.ndarray) -> List[Tuple[str, int, bytes]]:
+        r = self.rows_per_band
+        return [(company_key, band, sig[band * r : (band + 1) * r].tobytes()) for band in range(self.bands)]
+
+    # ── Main entrypoint ─────────────────────────────────────────────────
+
+    def add(
+        self,
+        key: Hashable,
+        title: str,
+        company: str,
+        description: str,
+    ) -> Optional[NearDuplicateMatch]:
+        """Insert a row; return the earlier row it duplicates, if any.
+
+        Duplicates are not inserted, so every bucket stays anchored on the
+        first-seen posting of its cluster.
+        """
+        self.rows_seen += 1
+        sig = self.signature(title, company, description)
+        if sig is None:
+            return None
+        company_key = " ".join(_tokens(company))
+        band_keys = self._band_keys(company_key, sig)
+
+        best: Optional[NearDuplicateMatch] = None
+        checked = set()
+        for band_key in band_keys:
+            anchor = self._buckets.get(band_key)
+            if anchor is None or anchor in checked:
+                continue
+            checked.add(anchor)
+            similarity = float(np.mean(self._signatures[anchor] == sig))
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = NearDuplicateMatch(anchor, similarity)
+        if best is not None:
+            return best
+
+        self._signatures[key] = sig
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, key)
+        return None
+
+
+# ── DataFrame facade (used by run_jobspy.py and tests) ─────────────────
+
+
+def filter_near_duplicates(
+    df: pd.DataFrame,
+    threshold: float = DEFAULT_THRESHOLD,
+    index: Optional[NearDuplicateIndex] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Return (kept_df, audit_df).
+
+    Audit df contains the merged rows with `duplicate_of` (job_url of the
+    kept row) and `similarity` columns appended. Rows keep their original
+    order; the first posting of each cluster wins. Pass a shared `index` to
+    dedupe a stream of frames against everything seen so far.
+    """
+    audit_cols = list(df.columns) + ["duplicate_of", "similarity"]
+    if df.empty or "description" not in df.columns:
+        return df, pd.DataFrame(columns=audit_cols)
+
+    index = index or NearDuplicateIndex(threshold=threshold)
+    titles = _text_column(df, "title")
+    companies = _text_column(df, "company")
+    urls = _text_column(df, "job_url")
+    descriptions = _text_column(df, "description")
+
+    keep = np.ones(len(df), dtype=bool)
+    audit_rows: List[dict] = []
+    for pos in range(len(df)):
+        # Keys must stay unique across frames when the index is shared.
+        key = urls.iat[pos] or f"row-{index.rows_seen}"
+        match = index.add(key, titles.iat[pos], companies.iat[pos], descriptions.iat[pos])
+        if match is None:
+            continue
+        keep[pos] = False
+        entry = df.iloc[pos].to_dict()
+        entry.update(
+            {
+                "duplicate_of": match.key,
+                "similarity": round(match.similarity, 3),
+            }
+        )
+        audit_rows.append(entry)
+
+    audit = (
+        pd.DataFrame(audit_rows, columns=audit_cols)
+        if audit_rows
+        else pd.DataFrame(columns=audit_cols)
+    )
+    return df[keep], audit
@@ -0,0 +1,199 @@
+"""
+ProcessScraper — scrape_jobs calls in a pool of worker processes.
+
+fetch_linkedin and the per-site fetchers run terms on threads. That is
+fine while requests wait on the network, but jobspy parses every result
+page with BeautifulSoup and builds its DataFrame in Python, so behind fast
+proxies the threads mostly queue on the GIL. With FETCH_SCRAPE_PROCESSES=N
+the threads keep scheduling, retries, the adaptive controller and the
+scrape cache, and only hand the scrape_jobs call itself to one of N
+processes.
+
+Results do not come back as pickled DataFrames. The worker projects the
+frame to the columns the pipeline reads, then encodes it:
+
+  arrow   Arrow IPC stream bytes (pyarrow installed): columnar buffers,
+          one copy on each side, no per-object pickling
+  pickle  pickle protocol 5, the fallback when pyarrow is missing
+
+Exceptions cross the process boundary as they are, so the callers'
+rate-limit detection and retries behave the same in both modes.
+
+Workers are started with `spawn`: the parent already runs threads, and
+forking a threaded process can copy held locks into the child. The pool is
+created on first use and kept for the life of the process, so the resident
+daemon pays the jobspy/pandas import per worker once. A worker that dies
+(OOM kill, segfault in a parser) breaks the whole pool, so a call that
+finds the pool broken replaces it once and retries; otherwise every later
+scrape in the daemon would fail.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger("jobspy_runner.process_scrape")
+
+try:  # pragma: no cover - depends on the runner image
+    import pyarrow as pa
+
+    DEFAULT_FORMAT = "arrow"
+except ImportError:  # pragma: no cover
+    pa = None
+    DEFAULT_FORMAT = "pickle"
+
+FORMATS = ("arrow", "pickle")
+
+
+# ── Encoding ────────────────────────────────────────────────────────────
+
+
+def encode_frame(df: pd.DataFrame, fmt: str = DEFAULT_FORMAT) -> bytes:
+    if fmt == "arrow":
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    return pickle.dumps(df.reset_index(drop=True), protocol=5)
+
+
+def decode_frame(payload: bytes, fmt: str = DEFAULT_FORMAT) -> pd.DataFrame:
+    if fmt == "arrow":
+        with pa.ipc.open_stream(io.BytesIO(payload)) as reader:
+            return reader.read_all().to_pandas()
+    return pickle.loads(payload)
+
+
+def scrape_encoded(
+    target: Callable[..., pd.DataFrame],
+    kwargs: Dict[str, Any],
+    columns: Optional[Tuple[str, ...]],
+    fmt: str,
+) -> Tuple[bytes, float]:
+    """Worker side: scrape, project, encode. Returns (payload, worker seconds)."""
+    started = time.perf_counter()
+    df = target(**kwargs)
+    if df is None:
+        df = pd.DataFrame()
+    if columns is not None:
+        df = df[[c for c in df.columns if c in columns]]
+    return encode_frame(df, fmt), time.perf_counter() - started
+
+
+def _default_target(**kwargs: Any) -> pd.DataFrame:
+    from jobspy import scrape_jobs
+
+    return scrape_jobs(**kwargs)
+
+
+# ── Pool ────────────────────────────────────────────────────────────────
+
+
+class ProcessScraper:
+    def __init__(
+        self,
+        workers: int,
+        target: Callable[..., pd.DataFrame] = _default_target,
+        columns: Optional[Iterable[str]] = None,
+        fmt: Optional[str] = None,
+        start_method: str = "spawn",
+    ) -> None:
+        fmt = fmt or DEFAULT_FORMAT
+        if fmt not in FORMATS:
+            raise ValueError(f"fmt must be one of {FORMATS}, got {fmt!r}")
+        if fmt == "arrow" and pa is None:
+            raise ValueError("fmt='arrow' needs pyarrow")
+        self.workers = max(1, workers)
+        self.target = target
+        self.columns = tuple(sorted(columns)) if columns is not None else None
+        self.fmt = fmt
+        self._context = multiprocessing.get_context(start_method)
+        self._pool = self._new_pool()
+        self._lock = threading.Lock()
+        self.restarts = 0
+        self.calls = 0
+        self.payload_bytes = 0
+        self.worker_sec = 0.0
+        self.decode_sec = 0.0
+
+    @classmethod
+    def from_env(cls, columns: Optional[Iterable[str]] = None) -> Optional["ProcessScraper"]:
+        """FETCH_SCRAPE_PROCESSES workers; None (thread mode) when unset or 0."""
+        raw = os.environ.get("FETCH_SCRAPE_PROCESSES", "").strip()
+        try:
+            workers = int(raw) if raw else 0
+        except ValueError:
+            workers = 0
+        if workers <= 0:
+            return None
+        fmt = os.environ.get("FETCH_SCRAPE_PROCESS_FORMAT", "").strip().lower() or None
+        if fmt is not None and (fmt not in FORMATS or (fmt == "arrow" and pa is None)):
+            fmt = None
+        return cls(workers, columns=columns, fmt=fmt)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=self._context)
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        # Several threads see the same broken pool; only the first replaces it.
+        with self._lock:
+            if self._pool is not broken:
+                return
+            self._pool = self._new_pool()
+            self.restarts += 1
+        logger.warning("Process scrape pool broken (worker died); restarted pool restarts=%s", self.restarts)
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def scrape(self, **kwargs: Any) -> pd.DataFrame:
+        """scrape_jobs(**kwargs) in a worker; blocks the calling thread."""
+        for attempt in range(2):
+            pool = self._pool
+            try:
+                payload, worker_sec = pool.submit(scrape_encoded, self.target, kwargs, self.columns, self.fmt).result()
+                break
+            except BrokenProcessPool:
+                self._replace_pool(pool)
+                if attempt:
+                    raise
+        started = time.perf_counter()
+        df = decode_frame(payload, self.fmt)
+        with self._lock:
+            self.calls += 1
+            self.payload_bytes += len(payload)
+            self.worker_sec += worker_sec
+            self.decode_sec += time.perf_counter() - started
+        return df
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "format": self.fmt,
+            "calls": self.calls,
+            "restarts": self.restarts,
+            "payloadMb": round(self.payload_bytes / (1024 * 1024), 2),
+            "workerSec": round(self.worker_sec, 3),
+            "decodeSec": round(self.decode_sec, 3),
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.restarts = 0
+            self.payload_bytes = 0
+            self.worker_sec = 0.0
+            self.decode_sec = 0.0
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
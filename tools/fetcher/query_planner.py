@@ -0,0 +1,175 @@
+"""
+QueryPlanner — per-term budgets and ordering learned from earlier runs.
+
+Overlapping search terms ("Software Engineer", "Frontend Engineer",
+"Full Stack Developer") largely return the same postings, yet
+_build_results_budget_by_term gives every term the full results budget.
+After each run the planner records, per (term, location), the rows that
+term scraped, how many were new to the user (not in KnownJobs before the
+run) and how many of those no other term of the run found ("exclusive").
+Stats are smoothed with an EWMA across runs.
+
+Planning a run:
+  - terms without history keep the full budget and are scheduled first,
+    so they get measured even when the run deadline cuts the tail
+  - other terms get `total * exclusive/rows` (floored at `min_budget`),
+    ordered by exclusive yield per LinkedIn search request
+  - predicted exclusive yield is logged next to the actual yield once
+    the scrape finishes
+
+With FETCH_QUERY_PLAN_DIR set, stats persist as one JSON file per user
+(`<sha1(email)[:16]>.plan.json`); without it every run plans from scratch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("jobspy_runner.planner")
+
+STATE_VERSION = 1
+DEFAULT_MIN_BUDGET = 100
+DEFAULT_EWMA_ALPHA = 0.5
+# jobspy's LinkedIn scraper reads 10 cards per search request.
+RESULTS_PER_REQUEST = 10
+
+
+def _term_key(term: str, location: str) -> str:
+    return f"{' '.join((term or '').lower().split())}|{' '.join((location or '').lower().split())}"
+
+
+@dataclass
+class QueryPlan:
+    order: List[str]
+    budgets: Dict[str, int]
+    predicted: Dict[str, Optional[float]] = field(default_factory=dict)
+
+
+class QueryPlanner:
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        min_budget: int = DEFAULT_MIN_BUDGET,
+        alpha: float = DEFAULT_EWMA_ALPHA,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.min_budget = max(1, int(min_budget))
+        self.alpha = min(1.0, max(0.0, alpha))
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._observed: Dict[str, List[str]] = {}
+        self._plan: Optional[QueryPlan] = None
+        if self.path is not None:
+            self._load()
+
+    @classmethod
+    def from_env(cls, user_email: str) -> "QueryPlanner":
+        raw_dir = os.environ.get("FETCH_QUERY_PLAN_DIR", "").strip()
+        raw_min = os.environ.get("FETCH_QUERY_PLAN_MIN_BUDGET", "").strip()
+        try:
+            min_budget = int(raw_min) if raw_min else DEFAULT_MIN_BUDGET
+        except ValueError:
+            min_budget = DEFAULT_MIN_BUDGET
+        if not raw_dir:
+            return cls(min_budget=min_budget)
+        digest = hashlib.sha1((user_email or "").strip().lower().encode("utf-8")).hexdigest()[:16]
+        return cls(Path(raw_dir) / f"{digest}.plan.json", min_budget=min_budget)
+
+    def _load(self) -> None:
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return
+        if state.get("version") == STATE_VERSION:
+            self.stats = state.get("terms") or {}
+
+    # ── Planning ────────────────────────────────────────────────────────
+
+    def plan(self, search_terms: List[str], location: str, total_budget: int) -> QueryPlan:
+        total = max(1, int(total_budget or 1))
+        fresh: List[str] = []
+        scored: List[tuple[float, int, str]] = []
+        budgets: Dict[str, int] = {}
+        predicted: Dict[str, Optional[float]] = {}
+        for position, term in enumerate(search_terms):
+            stats = self.stats.get(_term_key(term, location))
+            if not stats or stats.get("rows", 0) <= 0:
+                fresh.append(term)
+                budgets[term] = total
+                predicted[term] = None
+                continue
+            rows = stats["rows"]
+            exclusive = stats.get("exclusive", 0.0)
+            share = min(1.0, exclusive / rows)
+            budgets[term] = min(total, max(self.min_budget, math.ceil(total * share)))
+            # A smaller budget only trims the tail, where the overlap is.
+            predicted[term] = round(exclusive * min(1.0, budgets[term] / rows), 1)
+            per_request = exclusive / max(1.0, math.ceil(rows / RESULTS_PER_REQUEST))
+            scored.append((-per_request, position, term))
+        order = fresh + [term for _, _, term in sorted(scored)]
+        self._plan = QueryPlan(order=order, budgets=budgets, predicted=predicted)
+        for term in order:
+            logger.info(
+                "Query plan term=%s budget=%s predicted_exclusive=%s",
+                term,
+                budgets[term],
+                "unknown" if predicted[term] is None else predicted[term],
+            )
+        return self._plan
+
+    # ── Learning ────────────────────────────────────────────────────────
+
+    def observe(self, term: str, urls: Iterable[str]) -> None:
+        with self._lock:
+            self._observed.setdefault(term, []).extend(url for url in urls if url)
+
+    def finish(self, location: str, known_before: Callable[[str], bool]) -> Dict[str, Dict[str, float]]:
+        """Fold this run's observations into the stats; return per-term actuals."""
+        per_term = {term: set(urls) for term, urls in self._observed.items()}
+        found_by = Counter(url for urls in per_term.values() for url in urls)
+        actual: Dict[str, Dict[str, float]] = {}
+        for term, urls in per_term.items():
+            new = [url for url in urls if not known_before(url)]
+            exclusive = sum(1 for url in new if found_by[url] == 1)
+            actual[term] = {"rows": len(urls), "new": len(new), "exclusive": exclusive}
+            key = _term_key(term, location)
+            prev = self.stats.get(key)
+            if prev is None:
+                self.stats[key] = {**actual[term], "runs": 1}
+            else:
+                a = self.alpha
+                self.stats[key] = {
+                    name: round(a * actual[term][name] + (1 - a) * prev.get(name, 0.0), 2)
+                    for name in ("rows", "new", "exclusive")
+                }
+                self.stats[key]["runs"] = prev.get("runs", 0) + 1
+
+            predicted = self._plan.predicted.get(term) if self._plan else None
+            logger.info(
+                "Query yield term=%s predicted_exclusive=%s actual_exclusive=%s new=%s rows=%s overlap=%.2f",
+                term,
+                "unknown" if predicted is None else predicted,
+                exclusive,
+                len(new),
+                len(urls),
+                1 - exclusive / len(new) if new else 0.0,
+            )
+        self._observed = {}
+        return actual
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"version": STATE_VERSION, "terms": self.stats}), encoding="utf-8")
+        os.replace(tmp, self.path)
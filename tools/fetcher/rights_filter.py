@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
@@ -258,6 +259,33 @@ class ExclusionMatcher:
 # ── DataFrame facade (used by run_jobspy.py and tests) ─────────────────
 
 
+@lru_cache(maxsize=32)
+def _cached_matcher(
+    region: str,
+    strictness: str,
+    rules: Tuple[str, ...],
+    rules_path: Optional[Path],
+) -> ExclusionMatcher:
+    return ExclusionMatcher(region=region, strictness=strictness, rules=rules, rules_path=rules_path)
+
+
+def get_matcher(
+    region: str = "GLOBAL",
+    strictness: str = "balanced",
+    rules: Optional[Sequence[str]] = None,
+    rules_path: Optional[Path] = None,
+) -> ExclusionMatcher:
+    """Shared compiled matcher per configuration.
+
+    Compiling the rule unions costs far more than matching one description,
+    and a resident worker sees the same few configurations run after run.
+    Matchers are read-only after __init__, so sharing them across threads
+    is safe.
+    """
+    key_rules = tuple(sorted(set(rules))) if rules is not None else ("identity_requirement",)
+    return _cached_matcher(region, strictness, key_rules, Path(rules_path) if rules_path else None)
+
+
 def filter_description_v2(
     df: pd.DataFrame,
     rules: Sequence[str],
@@ -273,38 +301,30 @@ def filter_description_v2(
     audit_cols = list(df.columns) + ["rule", "score", "evidence", "snippet"]
 
     if df.empty or "description" not in df.columns or not rules:
-        return df.copy(), pd.DataFrame(columns=audit_cols)
+        return df, pd.DataFrame(columns=audit_cols)
 
-    matcher = ExclusionMatcher(
-        region=region,
-        strictness=strictness,
-        rules=rules,
-        rules_path=rules_path,
-    )
+    matcher = get_matcher(region=region, strictness=strictness, rules=rules, rules_path=rules_path)
 
-    keep_idx: List[int] = []
-    drop_idx: List[int] = []
+    keep = [True] * len(df)
     audit_rows: List[dict] = []
 
-    for pos, (idx, row) in enumerate(df.iterrows()):
-        desc = row["description"] if pd.notna(row["description"]) else ""
+    for pos, desc in enumerate(df["description"].fillna("")):
         result = matcher.match(str(desc))
-        if result.dropped:
-            drop_idx.append(idx)
-            entry = row.to_dict()
-            entry.update(
-                {
-                    "rule": result.rule,
-                    "score": result.score,
-                    "evidence": "; ".join(result.evidence),
-                    "snippet": result.snippet,
-                }
-            )
-            audit_rows.append(entry)
-        else:
-            keep_idx.append(idx)
-
-    kept = df.loc[keep_idx].copy()
+        if not result.dropped:
+            continue
+        keep[pos] = False
+        entry = df.iloc[pos].to_dict()
+        entry.update(
+            {
+                "rule": result.rule,
+                "score": result.score,
+                "evidence": "; ".join(result.evidence),
+                "snippet": result.snippet,
+            }
+        )
+        audit_rows.append(entry)
+
+    kept = df[keep]
     audit = (
         pd.DataFrame(audit_rows, columns=audit_cols)
         if audit_rows
@@ -0,0 +1,164 @@
+"""
+RunCheckpoint — resumable state for an interrupted FetchRun.
+
+A run that dies after scraping (timeout, runner eviction, crash before
+the SUCCEEDED update) used to lose everything. With FETCH_CHECKPOINT_DIR
+set, run_jobspy.main() records progress under `<dir>/<RUN_ID>/`:
+
+  state.json        completed terms, imported canonical URLs, imported total
+  terms/NNN.pkl     one frame per successfully scraped term
+  enrichment.jsonl  Phase 2 detail descriptions, one {url, description} per line
+
+A later process with the same RUN_ID (e.g. a workflow re-run that restores
+the directory from the Actions cache) reloads completed terms instead of
+re-scraping them, reuses fetched descriptions, and skips jobs whose
+import was already accepted. Imports are tracked by canonical URL rather
+than batch position, so a resumed run whose rows shift (different detail
+results, a changed filter) neither re-posts nor drops jobs. The directory is removed once the run is
+marked SUCCEEDED.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger("jobspy_runner.checkpoint")
+
+STATE_VERSION = 2
+
+
+def _empty_state(run_id: str) -> Dict[str, Any]:
+    return {
+        "version": STATE_VERSION,
+        "runId": run_id,
+        "terms": [],
+        "importedUrls": [],
+        "importedCount": 0,
+    }
+
+
+class RunCheckpoint:
+    def __init__(self, root: Path, run_id: str) -> None:
+        self.run_id = run_id
+        self.dir = Path(root) / run_id
+        self._lock = threading.Lock()
+        self._state_path = self.dir / "state.json"
+        self._enrichment_path = self.dir / "enrichment.jsonl"
+        self._enrichment: Optional[Dict[str, str]] = None
+
+        state = self._load_state()
+        self.resumed = state is not None
+        self.state = state or _empty_state(run_id)
+        (self.dir / "terms").mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls, run_id: str) -> Optional["RunCheckpoint"]:
+        raw = os.environ.get("FETCH_CHECKPOINT_DIR", "").strip()
+        return cls(Path(raw), run_id) if raw else None
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        try:
+            state = json.loads(self._state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if state.get("version") != STATE_VERSION or state.get("runId") != self.run_id:
+            logger.warning("Ignoring incompatible checkpoint at %s", self._state_path)
+            return None
+        return state
+
+    def _persist(self) -> None:
+        # Write-then-rename so a kill mid-write never leaves truncated JSON.
+        tmp = self._state_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(self.state), encoding="utf-8")
+        os.replace(tmp, self._state_path)
+
+    # ── Scrape stage ────────────────────────────────────────────────────
+
+    @property
+    def completed_terms(self) -> List[str]:
+        return [entry["term"] for entry in self.state["terms"]]
+
+    def save_term(self, term: str, df: pd.DataFrame) -> None:
+        with self._lock:
+            if term in self.completed_terms:
+                return
+            name = f"terms/{len(self.state['terms']):03d}.pkl"
+            df.reset_index(drop=True).to_pickle(self.dir / name)
+            self.state["terms"].append({"term": term, "file": name, "rows": len(df)})
+            self._persist()
+
+    def load_terms(self) -> List[Tuple[str, pd.DataFrame]]:
+        return [(entry["term"], pd.read_pickle(self.dir / entry["file"])) for entry in self.state["terms"]]
+
+    # ── Enrichment stage ────────────────────────────────────────────────
+
+    @property
+    def enrichment(self) -> Dict[str, str]:
+        # Loaded once under the lock: detail workers call this concurrently
+        # and must not see a half-read file.
+        if self._enrichment is None:
+            with self._lock:
+                if self._enrichment is None:
+                    self._enrichment = self._read_enrichment()
+        return self._enrichment
+
+    def _read_enrichment(self) -> Dict[str, str]:
+        entries: Dict[str, str] = {}
+        if self._enrichment_path.exists():
+            for line in self._enrichment_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from an interrupted append
+                entries[entry["url"]] = entry["description"]
+        return entries
+
+    def record_enrichment(self, url: str, description: str) -> None:
+        if not description:
+            return
+        enrichment = self.enrichment
+        with self._lock:
+            enrichment[url] = description
+            with self._enrichment_path.open("a", encoding="utf-8") as fh:
+                fh.write(json.dumps({"url": url, "description": description}) + "\n")
+
+    def cached_fetch(self, fetch_fn: Callable[..., str]) -> Callable[..., str]:
+        # Keyword arguments (the detail controller) reach fetch_fn only on a
+        # miss, so a cached description costs no request slot.
+        def fetch(url: str, **kwargs: Any) -> str:
+            cached = self.enrichment.get(url)
+            if cached:
+                return cached
+            description = str(fetch_fn(url, **kwargs) or "").strip()
+            self.record_enrichment(url, description)
+            return description
+
+        return fetch
+
+    # ── Import stage ────────────────────────────────────────────────────
+
+    @property
+    def imported_urls(self) -> Set[str]:
+        return set(self.state["importedUrls"])
+
+    @property
+    def imported_count(self) -> int:
+        return int(self.state["importedCount"])
+
+    def mark_imported(self, urls: Iterable[str], imported: int) -> None:
+        with self._lock:
+            known = set(self.state["importedUrls"])
+            self.state["importedUrls"].extend(url for url in dict.fromkeys(urls) if url and url not in known)
+            self.state["importedCount"] = self.imported_count + int(imported)
+            self._persist()
+
+    def clear(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
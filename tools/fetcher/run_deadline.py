@@ -0,0 +1,96 @@
+"""
+RunDeadline — wall-clock budget for a single FetchRun.
+
+.github/workflows/jobspy-fetch.yml kills the job after 25 minutes, and a
+killed job imports nothing. The deadline splits the budget into a work
+window (scrape, retries, cooldowns, detail enrichment) and a reserve
+that is never spent on work, so filtering, import and the SUCCEEDED
+update always have time to run on whatever was collected.
+
+Call sites ask `can_afford(seconds)` before sleeping/retrying and check
+`expired` before starting optional work; when they give up they call
+`cut(reason)`, which marks the run partial.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger("jobspy_runner.deadline")
+
+# Leaves ~4 minutes of the 25-minute job for checkout + pip install.
+DEFAULT_RUN_DEADLINE_SEC = 21 * 60.0
+DEFAULT_RESERVE_SEC = 240.0
+
+
+class RunDeadline:
+    def __init__(
+        self,
+        total_sec: Optional[float],
+        reserve_sec: float = DEFAULT_RESERVE_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total_sec = total_sec if total_sec and total_sec > 0 else None
+        self.reserve_sec = max(0.0, reserve_sec)
+        self._clock = clock
+        self._start = clock()
+        self._lock = threading.Lock()
+        self.partial_reasons: List[str] = []
+
+    @classmethod
+    def from_env(cls, clock: Callable[[], float] = time.monotonic) -> "RunDeadline":
+        # FETCH_RUN_DEADLINE_SEC=0 disables the deadline entirely.
+        raw_total = os.environ.get("FETCH_RUN_DEADLINE_SEC", "").strip()
+        raw_reserve = os.environ.get("FETCH_RUN_DEADLINE_RESERVE_SEC", "").strip()
+        try:
+            total = float(raw_total) if raw_total else DEFAULT_RUN_DEADLINE_SEC
+        except ValueError:
+            total = DEFAULT_RUN_DEADLINE_SEC
+        try:
+            reserve = float(raw_reserve) if raw_reserve else DEFAULT_RESERVE_SEC
+        except ValueError:
+            reserve = DEFAULT_RESERVE_SEC
+        return cls(total, reserve_sec=reserve, clock=clock)
+
+    # ── Budget queries ──────────────────────────────────────────────────
+
+    def elapsed(self) -> float:
+        return self._clock() - self._start
+
+    def remaining(self) -> float:
+        if self.total_sec is None:
+            return math.inf
+        return self.total_sec - self.elapsed()
+
+    def work_remaining(self) -> float:
+        return self.remaining() - self.reserve_sec
+
+    def can_afford(self, seconds: float) -> bool:
+        return self.work_remaining() >= max(0.0, seconds)
+
+    @property
+    def expired(self) -> bool:
+        return self.work_remaining() <= 0
+
+    # ── Partial-run bookkeeping ─────────────────────────────────────────
+
+    def cut(self, reason: str) -> None:
+        with self._lock:
+            if reason in self.partial_reasons:
+                return
+            self.partial_reasons.append(reason)
+        logger.warning(
+            "Run deadline: cutting %s (elapsed=%.1fs work_remaining=%.1fs)",
+            reason,
+            self.elapsed(),
+            self.work_remaining(),
+        )
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.partial_reasons)
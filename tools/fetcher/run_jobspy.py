@@ -3,22 +3,54 @@ import re
 import json
 import sys
 import time
+import heapq
 import math
 import random
 import logging
+import threading
+from datetime import datetime
 from html import unescape
 from pathlib import Path
-from urllib.parse import urlsplit, urlunsplit, parse_qs
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qs
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import requests
 import pandas as pd
 from jobspy import scrape_jobs
 
+from adaptive_concurrency import AdaptiveConcurrency
+from known_jobs import KnownJobs
+from query_planner import QueryPlanner
+from run_checkpoint import RunCheckpoint
+from run_deadline import RunDeadline
+from run_report import RunReport, frame_bytes, report_in_update, resolve_report_path
+from scrape_cache import ScrapeCache
+from site_sources import SEARCH_SOURCES, RateLimiter, SitePolicy, SiteStats, resolve_sources, source_term_key
+from sleep_service import SleepService
+
+# Pipeline stages hand each other filtered frames instead of defensive
+# copies, which is only safe under copy-on-write (always on from pandas 3).
+if int(pd.__version__.split(".", 1)[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s %(name)s: %(message)s')
 logger = logging.getLogger("jobspy_runner")
 
+# Every backoff/cooldown sleep goes through this service so the run report
+# can break down time spent waiting; tests swap in SleepService.virtual().
+sleeper = SleepService()
+
+# One pooled session for detail pages and API callbacks: keep-alive saves a
+# TLS handshake per request, and a resident worker (fetch_daemon.py) keeps
+# the pools warm across runs. Sized for MAX_DETAIL_URL_WORKERS plus headroom.
+http = requests.Session()
+http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+http.mount("http://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
 SCRAPE_RETRIES = 2
 SCRAPE_BACKOFF_SEC = 2
 IMPORT_RETRIES = 2
@@ -28,14 +60,54 @@ DEFAULT_RATE_LIMIT_RETRIES = 5
 DEFAULT_RATE_LIMIT_BASE_SEC = 15.0
 DEFAULT_RATE_LIMIT_MAX_SEC = 120.0
 DEFAULT_RATE_LIMIT_COOLDOWN_SEC = 20.0
+MAX_TERM_ATTEMPTS = 3
 DEFAULT_FULL_FETCH_RESULTS_WANTED = 10000
 DEFAULT_DETAIL_URL_WORKERS = 4
 MAX_DETAIL_URL_WORKERS = 8
 DEFAULT_DETAIL_URL_TIMEOUT_SEC = 12.0
 DEFAULT_DETAIL_URL_RETRIES = 2
 DEFAULT_DETAIL_URL_BACKOFF_BASE_SEC = 1.5
+PROXY_FAILURE_COOLDOWN_SEC = 300.0
+# Detail pages are uniform, so a response this many times slower than the
+# running average is treated like a 429 by the detail pool's controller.
+DETAIL_URL_LATENCY_RATIO = 3.0
+DEFAULT_NEAR_DUPLICATE_THRESHOLD = 0.85
+DEFAULT_FETCH_PAGE_SIZE = 0
+MAX_FETCH_PAGE_SIZE = 1000
+DEFAULT_EARLY_STOP_KNOWN = 25
+DEFAULT_INDEED_COUNTRY = "australia"
+DEFAULT_CN_MAX_PAGES = 5
+DEFAULT_LOCATION = "Sydney, New South Wales, Australia"
+DEFAULT_INCREMENTAL_OVERLAP_HOURS = 3.0
+# Floor for the scaled results_wanted of an incremental run.
+DEFAULT_INCREMENTAL_MIN_RESULTS = 100
+IMPORT_BATCH_SIZE = 50
+
+IMPORT_COLUMNS = ["job_url", "title", "company", "location", "job_type", "job_level", "description"]
+# jobspy column aliases used when the import column itself is absent.
+IMPORT_COLUMN_FALLBACKS = {
+    "job_url": "job_url_direct",
+    "job_type": "employment_type",
+    "job_level": "seniority_level",
+}
+# Everything read after a scrape: the import schema, the jobspy aliases
+# keep_columns falls back to, the board and the per-frame tags. jobspy's
+# other ~25 columns (salary, company metadata, emails, logos, skills) are
+# dropped as soon as scrape_jobs returns.
+SCRAPE_COLUMNS = frozenset(
+    IMPORT_COLUMNS + list(IMPORT_COLUMN_FALLBACKS.values()) + ["site", "source_query", "source_location"]
+)
+# Low-cardinality columns held as pandas categoricals between stages; a few
+# hundred distinct companies/locations repeat across thousands of rows.
+# Values come back as plain str in to_dict() for the import payload.
+CATEGORY_COLUMNS = ["company", "location", "job_type", "job_level", "source_query", "source_location"]
 
+# Phase 2 detail pages; bench_fetch.py points this at its local stub server.
+LINKEDIN_GUEST_BASE_URL = "https://www.linkedin.com"
 LINKEDIN_JOB_ID_RE = re.compile(r"linkedin\.com/jobs/view/(\d+)", re.IGNORECASE)
+# Boards that identify a posting by query parameter (Indeed viewjob?jk=,
+# Glassdoor job-listing/j?jl=); canonical URLs keep these and drop the rest.
+JOB_ID_QUERY_PARAMS = ("jk", "jl")
 
 CANCELLED_ERROR = "Cancelled by user"
 
@@ -198,18 +270,17 @@ def filter_experience_requirements(
     audit_cols = list(df.columns) + ["rule", "score", "evidence", "snippet"]
     active_thresholds = _active_experience_thresholds(rules)
     if df.empty or "description" not in df.columns or not active_thresholds:
-        return df.copy(), pd.DataFrame(columns=audit_cols)
+        return df, pd.DataFrame(columns=audit_cols)
 
-    keep_idx: List[int] = []
+    keep = [True] * len(df)
     audit_rows: List[dict] = []
-    for idx, row in df.iterrows():
-        desc = row["description"] if pd.notna(row["description"]) else ""
+    for pos, desc in enumerate(df["description"].fillna("")):
         match = _find_experience_requirement(str(desc), active_thresholds)
         if not match:
-            keep_idx.append(idx)
             continue
+        keep[pos] = False
         rule, years, snippet = match
-        entry = row.to_dict()
+        entry = df.iloc[pos].to_dict()
         entry.update(
             {
                 "rule": rule,
@@ -220,7 +291,7 @@ def filter_experience_requirements(
         )
         audit_rows.append(entry)
 
-    kept = df.loc[keep_idx].copy()
+    kept = df[keep]
     audit = (
         pd.DataFrame(audit_rows, columns=audit_cols)
         if audit_rows
@@ -288,6 +359,17 @@ def _is_rate_limited_error(err: Exception) -> bool:
     return " 429 " in f" {msg} " or "too many 429" in msg or "rate limit" in msg
 
 
+def _is_detail_throttled(err: BaseException) -> bool:
+    # LinkedIn answers throttled guest requests with 429 or its custom 999.
+    return str(err) in ("http_429", "http_999")
+
+
+def _is_proxy_failure(err: BaseException) -> bool:
+    # Connection and proxy errors, and the blocks a proxy's address earns.
+    # A 404 or a 5xx says nothing about the proxy, so it is not benched.
+    return isinstance(err, requests.ConnectionError) or str(err) in ("http_403", "http_407", "http_429", "http_999")
+
+
 def _retry_sleep_seconds(err: Exception, attempt: int) -> float:
     # For rate-limit errors we back off aggressively with jitter.
     if _is_rate_limited_error(err):
@@ -307,19 +389,89 @@ def _retry_sleep_seconds(err: Exception, attempt: int) -> float:
     return sleep_sec + random.uniform(0, 0.5)
 
 
+def _resolve_term_retry_cooldown_sec() -> float:
+    raw = os.environ.get("FETCH_RATE_LIMIT_COOLDOWN_SEC", "").strip()
+    try:
+        value = float(raw) if raw else DEFAULT_RATE_LIMIT_COOLDOWN_SEC
+    except ValueError:
+        value = DEFAULT_RATE_LIMIT_COOLDOWN_SEC
+    return max(1.0, value)
+
+
 def _fetch_terms(
-    queries: List[str],
+    queries: List[Any],
     fetch_fn,
     max_workers: int,
-):
+    max_attempts: int = 1,
+    retry_cooldown_sec: float = DEFAULT_RATE_LIMIT_COOLDOWN_SEC,
+    deadline: Optional[RunDeadline] = None,
+) -> Iterator[tuple[Any, Optional[pd.DataFrame]]]:
+    """Yield (term, frame) in completion order.
+
+    The frame is None for a term whose last attempt failed (the fetch
+    returned None or raised) and empty for a term that found nothing.
+
+    Terms sit in one queue shared by `max_workers` threads. A term whose
+    fetch returns nothing is re-queued with its own backoff (cooldown x
+    2^(attempt-1)) while idle workers keep taking other ready terms, so no
+    term waits on a round barrier. A "term" is whatever `fetch_fn` takes:
+    the site fetchers pass (term, location) units.
+    """
     if not queries:
-        return []
+        return
+    ready: deque = deque((term, 1) for term in queries)
+    delayed: List[tuple[float, int, str, int]] = []
+    seq = 0
     workers = max(1, min(max_workers, len(queries)))
-    if workers == 1:
-        return [(term, fetch_fn(term)) for term in queries]
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        frames = list(pool.map(fetch_fn, queries))
-    return list(zip(queries, frames))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    running: Dict[Any, tuple[str, int]] = {}
+    try:
+        while ready or delayed or running:
+            now = sleeper.clock()
+            while delayed and delayed[0][0] <= now:
+                _, _, term, attempt = heapq.heappop(delayed)
+                ready.append((term, attempt))
+            while ready and len(running) < workers:
+                term, attempt = ready.popleft()
+                running[pool.submit(fetch_fn, term)] = (term, attempt)
+            if not running:
+                # Only backed-off terms remain: sleep until the first is due.
+                ready_at, _, term, attempt = heapq.heappop(delayed)
+                sleeper.sleep(ready_at - now, "term_backoff", host="linkedin.com")
+                ready.append((term, attempt))
+                continue
+
+            timeout = max(0.0, delayed[0][0] - now) if delayed else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                term, attempt = running.pop(future)
+                try:
+                    df = future.result()
+                except Exception as err:
+                    logger.error("term fetch crashed term=%s error=%s", term, err)
+                    df = None
+                if df is not None and not df.empty:
+                    yield term, df
+                    continue
+                if attempt >= max_attempts:
+                    if max_attempts > 1:
+                        logger.info("Giving up on term=%s after %s attempts", term, attempt)
+                    yield term, df
+                    continue
+                delay = retry_cooldown_sec * (2 ** (attempt - 1))
+                delay += random.uniform(0.0, min(1.0, delay * 0.1))
+                if deadline is not None and not deadline.can_afford(delay):
+                    logger.info("Not retrying term=%s: backoff %.1fs exceeds run deadline", term, delay)
+                    deadline.cut("term_retries")
+                    yield term, df
+                    continue
+                logger.info("Re-queued term=%s attempt=%s/%s backoff=%.1fs", term, attempt + 1, max_attempts, delay)
+                seq += 1
+                heapq.heappush(delayed, (sleeper.clock() + delay, seq, term, attempt + 1))
+    finally:
+        for future in running:
+            future.cancel()
+        pool.shutdown(wait=True)
 
 
 def _normalize_text(text: str) -> str:
@@ -332,6 +484,39 @@ def _normalize_text(text: str) -> str:
     return s
 
 
+def _normalize_text_series(values: pd.Series) -> pd.Series:
+    # Vectorized twin of _normalize_text; a single separator pass also
+    # collapses whitespace runs since whitespace is non-alphanumeric.
+    return (
+        values.fillna("")
+        .astype(str)
+        .str.lower()
+        .str.replace(r"[^a-z0-9]+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _categorize_columns(df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    targets = [
+        c
+        for c in (columns or CATEGORY_COLUMNS)
+        if c in df.columns and not isinstance(df[c].dtype, pd.CategoricalDtype)
+    ]
+    if not targets:
+        return df
+    return df.astype({c: "category" for c in targets})
+
+
+def _fill_blank(values: pd.Series) -> pd.Series:
+    # fillna("") on a categorical needs "" registered as a category first.
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        if not values.isna().any():
+            return values
+        if "" not in values.cat.categories:
+            values = values.cat.add_categories("")
+    return values.fillna("")
+
+
 def _fingerprint_value(value: Any) -> str:
     return _normalize_text(value or "")
 
@@ -387,6 +572,103 @@ def _resolve_detail_backoff_base_sec() -> float:
     return max(0.2, min(10.0, value))
 
 
+def _resolve_near_duplicate_threshold() -> float:
+    # 0 disables the near-duplicate stage; exact URL dedupe always runs.
+    raw = os.environ.get("FETCH_NEAR_DUPLICATE_THRESHOLD", "").strip()
+    try:
+        value = float(raw) if raw else DEFAULT_NEAR_DUPLICATE_THRESHOLD
+    except ValueError:
+        value = DEFAULT_NEAR_DUPLICATE_THRESHOLD
+    return max(0.0, min(1.0, value))
+
+
+def _resolve_fetch_page_size() -> int:
+    # 0 (default) keeps the single scrape_jobs call per term; a positive
+    # value pulls each term page by page so it can stop early.
+    raw = os.environ.get("FETCH_PAGE_SIZE", "").strip()
+    try:
+        value = int(raw) if raw else DEFAULT_FETCH_PAGE_SIZE
+    except ValueError:
+        value = DEFAULT_FETCH_PAGE_SIZE
+    return max(0, min(MAX_FETCH_PAGE_SIZE, value))
+
+
+def _resolve_early_stop_known() -> int:
+    # 0 pages through the full budget without stopping on known jobs.
+    raw = os.environ.get("FETCH_EARLY_STOP_KNOWN", "").strip()
+    try:
+        value = int(raw) if raw else DEFAULT_EARLY_STOP_KNOWN
+    except ValueError:
+        value = DEFAULT_EARLY_STOP_KNOWN
+    return max(0, value)
+
+
+def _resolve_spill_dir() -> Optional[Path]:
+    # Spill mode is opt-in: set FETCH_SPILL_DIR to stage scrape results on disk.
+    raw = os.environ.get("FETCH_SPILL_DIR", "").strip()
+    return Path(raw) if raw else None
+
+
+def _resolve_two_phase() -> bool:
+    # Two-phase mode scrapes listings without detail pages, applies the title
+    # filter and dedupe, and only then fetches descriptions for the survivors.
+    return os.environ.get("FETCH_TWO_PHASE", "").strip().lower() in ("1", "true", "yes")
+
+
+def _resolve_incremental() -> bool:
+    # Incremental mode narrows hours_old to the time since the previous
+    # SUCCEEDED run with the same config (previousSucceededAt from the
+    # config API) plus an overlap for postings LinkedIn indexes late.
+    return os.environ.get("FETCH_INCREMENTAL", "").strip().lower() in ("1", "true", "yes")
+
+
+def _resolve_incremental_overlap_hours() -> float:
+    raw = os.environ.get("FETCH_INCREMENTAL_OVERLAP_HOURS", "").strip()
+    try:
+        value = float(raw) if raw else DEFAULT_INCREMENTAL_OVERLAP_HOURS
+    except ValueError:
+        value = DEFAULT_INCREMENTAL_OVERLAP_HOURS
+    return max(0.0, value)
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _incremental_window(
+    previous_at: Any,
+    hours_old: int,
+    results_wanted: int,
+    overlap_hours: float,
+    now: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Narrowed hours_old/results_wanted, or None when the full window is needed.
+
+    The window reaches back to the previous run's start plus the overlap;
+    results_wanted shrinks by the same ratio, down to a floor.
+    """
+    started = _parse_timestamp(previous_at)
+    if started is None:
+        return None
+    now = time.time() if now is None else now
+    window = max(1, math.ceil(max(0.0, now - started) / 3600 + overlap_hours))
+    if window >= hours_old:
+        return None
+    scaled = max(min(results_wanted, DEFAULT_INCREMENTAL_MIN_RESULTS), math.ceil(results_wanted * window / hours_old))
+    return {
+        "previousSucceededAt": previous_at,
+        "hoursOld": window,
+        "resultsWanted": scaled,
+        "configuredHoursOld": hours_old,
+        "configuredResultsWanted": results_wanted,
+    }
+
+
 def _extract_linkedin_job_id(url: str) -> str:
     raw = (url or "").strip()
     if not raw:
@@ -456,31 +738,41 @@ def _canonicalize_job_url(url: str) -> str:
             path = "/"
 
     # Drop query and fragment to remove tracking variants.
-    return urlunsplit((scheme, netloc, path, "", ""))
+    query_params = parse_qs(parts.query)
+    query = urlencode([(key, query_params[key][0]) for key in JOB_ID_QUERY_PARAMS if query_params.get(key)])
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def _canonical_job_urls(df: pd.DataFrame) -> pd.Series:
+    if "job_url" not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    return df["job_url"].fillna("").astype(str).map(_canonicalize_job_url)
 
 
-def dedupe_jobs(df: pd.DataFrame) -> pd.DataFrame:
+def dedupe_jobs(df: pd.DataFrame, seen_keys: Optional[Set[str]] = None) -> pd.DataFrame:
+    # `seen_keys` carries dedupe state across chunks in spill mode: rows whose
+    # key was seen in an earlier chunk are dropped and new keys are recorded.
     if df.empty:
         return df
-    out = df.copy()
-    out["_canonical_job_url"] = out.get("job_url", "").fillna("").apply(_canonicalize_job_url)
-
-    has_url = out["_canonical_job_url"].astype(bool)
-    by_url = out[has_url].drop_duplicates(subset=["_canonical_job_url"], keep="first")
-    no_url = out[~has_url].copy()
-    if not no_url.empty:
-        no_url["_fallback_fingerprint"] = (
-            no_url.get("title", "").apply(_fingerprint_value)
+    canonical = _canonical_job_urls(df)
+    has_url = canonical != ""
+    keep = (has_url & ~canonical.duplicated()).to_numpy(copy=True)
+    fallback_fingerprint = pd.Series("", index=df.index)
+    if not has_url.all():
+        no_url = df[~has_url]
+        fallback_fingerprint = (
+            no_url.get("title", pd.Series("", index=no_url.index)).map(_fingerprint_value).astype(str)
             + "|"
-            + no_url.get("company", "").apply(_fingerprint_value)
+            + no_url.get("company", pd.Series("", index=no_url.index)).map(_fingerprint_value).astype(str)
             + "|"
-            + no_url.get("location", "").apply(_fingerprint_value)
+            + no_url.get("location", pd.Series("", index=no_url.index)).map(_fingerprint_value).astype(str)
         )
-        no_url = no_url.drop_duplicates(subset=["_fallback_fingerprint"], keep="first")
-        no_url = no_url.drop(columns=["_fallback_fingerprint"], errors="ignore")
-
-    out = pd.concat([by_url, no_url], ignore_index=True)
-    return out.drop(columns=["_canonical_job_url"], errors="ignore")
+        keep[~has_url.to_numpy()] = ~fallback_fingerprint.duplicated().to_numpy()
+    if seen_keys is not None:
+        keys = canonical.where(has_url, "fp:" + fallback_fingerprint.reindex(df.index, fill_value=""))
+        keep &= ~keys.isin(seen_keys).to_numpy()
+        seen_keys.update(keys[keep].tolist())
+    return df[keep].reset_index(drop=True)
 
 
 def _build_exclude_title_re(terms: List[str]) -> Optional[re.Pattern]:
@@ -490,6 +782,15 @@ def _build_exclude_title_re(terms: List[str]) -> Optional[re.Pattern]:
     return re.compile(r'(?i)\b(?:' + "|".join(cleaned) + r')\b')
 
 
+def _build_include_title_re(phrases: List[str]) -> Optional[re.Pattern]:
+    # Plain substring semantics over normalized titles, matching the
+    # historical `any(term in value ...)` check but in a single regex pass.
+    cleaned = [re.escape(p) for p in dict.fromkeys(phrases) if p]
+    if not cleaned:
+        return None
+    return re.compile("(?:" + "|".join(cleaned) + ")")
+
+
 def filter_title(
     df: pd.DataFrame,
     queries: List[str],
@@ -498,41 +799,74 @@ def filter_title(
 ) -> pd.DataFrame:
     if df.empty:
         return df
-    t = df["title"].fillna("")
     exclude_re = _build_exclude_title_re(exclude_terms or [])
-    if exclude_re:
-        exc = t.apply(lambda s: bool(exclude_re.search(s)))
-    else:
-        exc = t.apply(lambda s: False)
-    out = df[~exc].copy()
+    include_re = _build_include_title_re(_build_query_phrases(queries)) if enforce_include else None
+    if exclude_re is None and include_re is None:
+        return df
+
+    t = df["title"].fillna("").astype(str)
+    keep = pd.Series(True, index=df.index)
+    if exclude_re is not None:
+        keep &= ~t.str.contains(exclude_re, regex=True)
     # Optional strict include mode for parity with includeFromQueries config.
-    if enforce_include:
-        include_terms = _build_query_phrases(queries)
-        if include_terms:
-            normalized_titles = out["title"].fillna("").apply(_normalize_text)
-            include_mask = normalized_titles.apply(
-                lambda value: any(term in value for term in include_terms)
-            )
-            out = out[include_mask].copy()
-    return out
+    if include_re is not None:
+        keep &= _normalize_text_series(t).str.contains(include_re, regex=True)
+    return df[keep]
 
 
-def keep_columns(df: pd.DataFrame) -> pd.DataFrame:
-    # Normalize jobspy column names to our import schema
-    out = df.copy()
-    if "job_url" not in out.columns and "job_url_direct" in out.columns:
-        out["job_url"] = out["job_url_direct"]
+_process_scraper: Any = None
+_process_scraper_resolved = False
+_process_scraper_lock = threading.Lock()
+
+
+def _get_process_scraper():
+    # Created once per process from FETCH_SCRAPE_PROCESSES and kept, so the
+    # daemon's workers stay warm between runs.
+    global _process_scraper, _process_scraper_resolved
+    with _process_scraper_lock:
+        if not _process_scraper_resolved:
+            _process_scraper_resolved = True
+            if os.environ.get("FETCH_SCRAPE_PROCESSES", "").strip():
+                from process_scrape import ProcessScraper  # type: ignore
+
+                _process_scraper = ProcessScraper.from_env(columns=SCRAPE_COLUMNS)
+                if _process_scraper is not None:
+                    logger.info(
+                        "Process scrape mode: workers=%s format=%s",
+                        _process_scraper.workers,
+                        _process_scraper.fmt,
+                    )
+        return _process_scraper
+
+
+def _scrape_jobs(**kwargs: Any) -> pd.DataFrame:
+    # scrape_jobs on the calling thread, or in a worker process that sends
+    # back the projected frame as Arrow bytes (see process_scrape.py).
+    pool = _get_process_scraper()
+    if pool is None:
+        return scrape_jobs(**kwargs)
+    return pool.scrape(**kwargs)
+
 
-    if "job_type" not in out.columns and "employment_type" in out.columns:
-        out["job_type"] = out["employment_type"]
-    if "job_level" not in out.columns and "seniority_level" in out.columns:
-        out["job_level"] = out["seniority_level"]
+def _project_scrape_columns(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    if df is None:
+        return None
+    keep = [c for c in df.columns if c in SCRAPE_COLUMNS]
+    return df if len(keep) == len(df.columns) else df[keep]
 
-    for c in ["job_url", "title", "company", "location", "job_type", "job_level", "description"]:
-        if c not in out.columns:
-            out[c] = ""
 
-    return out[["job_url", "title", "company", "location", "job_type", "job_level", "description"]].fillna("")
+def keep_columns(df: pd.DataFrame) -> pd.DataFrame:
+    # Normalize jobspy column names to our import schema
+    columns: Dict[str, Any] = {}
+    for c in IMPORT_COLUMNS:
+        fallback = IMPORT_COLUMN_FALLBACKS.get(c)
+        if c in df.columns:
+            columns[c] = _fill_blank(df[c])
+        elif fallback and fallback in df.columns:
+            columns[c] = _fill_blank(df[fallback])
+        else:
+            columns[c] = ""
+    return _categorize_columns(pd.DataFrame(columns, index=df.index, copy=False))
 
 
 def _clean_description_text(text: str) -> str:
@@ -556,9 +890,7 @@ def _clean_description_text(text: str) -> str:
 def clean_description(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty or "description" not in df.columns:
         return df
-    out = df.copy()
-    out["description"] = out["description"].fillna("").apply(_clean_description_text)
-    return out
+    return df.assign(description=df["description"].fillna("").map(_clean_description_text))
 
 
 def _find_description_in_json_ld(payload: Any) -> str:
@@ -629,6 +961,9 @@ def _extract_description_from_html(html_text: str) -> str:
 def _fetch_description_for_url(
     job_url: str,
     proxy_pool: Optional[List[str]] = None,
+    deadline: Optional[RunDeadline] = None,
+    controller: Optional[AdaptiveConcurrency] = None,
+    report: Optional[RunReport] = None,
 ) -> str:
     canonical = _canonicalize_job_url(job_url)
     if not canonical:
@@ -649,22 +984,30 @@ def _fetch_description_for_url(
         try:
             linkedin_id = _extract_linkedin_job_id(canonical)
             if linkedin_id:
-                detail_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{linkedin_id}"
+                detail_url = f"{LINKEDIN_GUEST_BASE_URL}/jobs-guest/jobs/api/jobPosting/{linkedin_id}"
             else:
                 detail_url = canonical
-            res = requests.get(detail_url, timeout=timeout_sec, headers=headers, proxies=proxies)
-            if res.status_code >= 400:
-                raise RuntimeError(f"http_{res.status_code}")
+            with controller.slot() if controller is not None else nullcontext():
+                res = http.get(detail_url, timeout=timeout_sec, headers=headers, proxies=proxies)
+                if res.status_code >= 400:
+                    raise RuntimeError(f"http_{res.status_code}")
             description = _extract_description_from_html(res.text or "")
             if description:
                 return description
             return ""
         except Exception as err:
+            if _is_proxy_failure(err):
+                _mark_proxy_failed(proxy)
             if attempt >= retries:
                 logger.warning("detail fetch failed url=%s error=%s", canonical, err)
                 return ""
             sleep_sec = backoff_base_sec * (2**attempt) + random.uniform(0.0, 0.5)
-            time.sleep(sleep_sec)
+            if deadline is not None and not deadline.can_afford(sleep_sec):
+                deadline.cut("detail_retries")
+                return ""
+            if report is not None:
+                report.count("detail_retries")
+            sleeper.sleep(sleep_sec, "detail_retry", host=urlsplit(canonical).hostname)
     return ""
 
 
@@ -677,36 +1020,60 @@ def _enrich_descriptions_for_urls(
     df: pd.DataFrame,
     proxy_pool: Optional[List[str]] = None,
     fetch_fn=None,
+    deadline: Optional[RunDeadline] = None,
+    report: Optional[RunReport] = None,
 ) -> pd.DataFrame:
     if df.empty or "job_url" not in df.columns:
         return df
-    out = df.copy()
-    if "description" not in out.columns:
-        out["description"] = ""
-    out["description"] = out["description"].fillna("")
-
-    out["_canonical_job_url"] = out["job_url"].fillna("").apply(_canonicalize_job_url)
-    candidates = out[
-        out["_canonical_job_url"].astype(bool)
-        & out["description"].apply(_description_needs_enrichment)
-    ]
-    if candidates.empty:
-        return out.drop(columns=["_canonical_job_url"], errors="ignore")
+    descriptions = df["description"].fillna("") if "description" in df.columns else ""
+    out = df.assign(description=descriptions)
 
-    urls = list(dict.fromkeys(candidates["_canonical_job_url"].tolist()))
-    workers = _resolve_detail_workers(len(urls))
-    logger.info("Phase2 detail enrichment: urls=%s workers=%s", len(urls), workers)
+    canonical = _canonical_job_urls(out)
+    candidates = canonical[(canonical != "") & out["description"].map(_description_needs_enrichment)]
+    if candidates.empty:
+        return out
+
+    urls = list(dict.fromkeys(candidates.tolist()))
+    # FETCH_DETAIL_URL_WORKERS is a ceiling: the controller backs off below
+    # it on throttling and grows back, but never past it.
+    detail_workers = _resolve_detail_workers(len(urls))
+    controller = AdaptiveConcurrency(
+        detail_workers,
+        max_limit=detail_workers,
+        latency_ratio=DETAIL_URL_LATENCY_RATIO,
+        is_congestion=_is_detail_throttled,
+        name="detail",
+    )
+    logger.info(
+        "Phase2 detail enrichment: urls=%s workers=%s max_workers=%s",
+        len(urls),
+        controller.limit,
+        controller.max_limit,
+    )
 
-    resolve = fetch_fn or (lambda url: _fetch_description_for_url(url, proxy_pool=proxy_pool))
+    # `fetch_fn(url, controller=...)` takes the controller so a wrapper such
+    # as RunCheckpoint.cached_fetch can answer from its cache without a slot.
+    fetch = fetch_fn
+    if fetch is None:
+        fetch = partial(_fetch_description_for_url, proxy_pool=proxy_pool, deadline=deadline, report=report)
 
     def fetch_one(url: str):
-        return url, str(resolve(url) or "").strip()
+        # Queued URLs are skipped (left without description) once the work
+        # window closes; rows that already have details are unaffected.
+        if deadline is not None and deadline.expired:
+            deadline.cut("detail_enrichment")
+            return url, ""
+        description = fetch(url, controller=controller)
+        description = str(description or "").strip()
+        if not description and report is not None:
+            report.count("detail_urls_failed")
+        return url, description
 
     pairs: List[tuple[str, str]]
-    if workers <= 1:
+    if controller.max_limit <= 1:
         pairs = [fetch_one(url) for url in urls]
     else:
-        with ThreadPoolExecutor(max_workers=workers) as pool:
+        with ThreadPoolExecutor(max_workers=controller.max_limit) as pool:
             pairs = list(pool.map(fetch_one, urls))
 
     details = pd.DataFrame(
@@ -716,21 +1083,42 @@ def _enrich_descriptions_for_urls(
             if description
         ]
     )
+    if report is not None:
+        report.count("detail_urls", len(urls))
+        report.count("detail_urls_filled", len(details))
     if details.empty:
-        return out.drop(columns=["_canonical_job_url"], errors="ignore")
-    merged = _merge_phase_details(
-        out.drop(columns=["_canonical_job_url"], errors="ignore"),
-        details,
-    )
-    return merged
+        return out
+    return _merge_phase_details(out, details)
+
+
+# Proxy health lives at module level so a resident worker carries it from
+# one run to the next; a one-shot run starts with every proxy healthy.
+_proxy_failed_at: Dict[str, float] = {}
+_proxy_health_lock = threading.Lock()
+
+
+def _mark_proxy_failed(proxy: Optional[str]) -> None:
+    if proxy:
+        with _proxy_health_lock:
+            _proxy_failed_at[proxy] = time.monotonic()
 
 
 def _proxy_for_attempt(proxy_pool: List[str], term: str, attempt: int) -> Optional[str]:
     if not proxy_pool:
         return None
-    base = abs(hash(term)) % len(proxy_pool)
-    index = (base + attempt) % len(proxy_pool)
-    return proxy_pool[index]
+    # Proxies that failed within the cooldown are skipped while any other
+    # is healthy; when all failed recently the whole pool is used again.
+    now = time.monotonic()
+    with _proxy_health_lock:
+        healthy = [
+            proxy
+            for proxy in proxy_pool
+            if proxy not in _proxy_failed_at or now - _proxy_failed_at[proxy] >= PROXY_FAILURE_COOLDOWN_SEC
+        ]
+    pool = healthy or proxy_pool
+    base = abs(hash(term)) % len(pool)
+    index = (base + attempt) % len(pool)
+    return pool[index]
 
 
 def _merge_phase_details(base_df: pd.DataFrame, details_df: pd.DataFrame) -> pd.DataFrame:
@@ -739,33 +1127,21 @@ def _merge_phase_details(base_df: pd.DataFrame, details_df: pd.DataFrame) -> pd.
     if details_df.empty:
         return base_df
 
-    out = base_df.copy()
-    details = details_df.copy()
-    out["_canonical_job_url"] = out.get("job_url", "").fillna("").apply(_canonicalize_job_url)
-    details["_canonical_job_url"] = details.get("job_url", "").fillna("").apply(_canonicalize_job_url)
-    details = details[details["_canonical_job_url"].astype(bool)].drop_duplicates(
-        subset=["_canonical_job_url"], keep="first"
+    details_canonical = _canonical_job_urls(details_df)
+    details_by_url = pd.Series(
+        details_df.get("description", pd.Series("", index=details_df.index)).fillna("").to_numpy(),
+        index=details_canonical.to_numpy(),
     )
-    details_by_url = details.set_index("_canonical_job_url")
-
-    if "description" not in out.columns:
-        out["description"] = ""
-    out["description"] = out["description"].fillna("")
+    details_by_url = details_by_url[details_by_url.index != ""]
+    details_by_url = details_by_url[~details_by_url.index.duplicated(keep="first")]
 
-    def resolve_description(row):
-        current = str(row.get("description") or "").strip()
-        if current:
-            return current
-        key = row.get("_canonical_job_url") or ""
-        if not key or key not in details_by_url.index:
-            return current
-        details_val = details_by_url.loc[key, "description"]
-        if isinstance(details_val, pd.Series):
-            details_val = details_val.iloc[0]
-        return str(details_val or "").strip()
-
-    out["description"] = out.apply(resolve_description, axis=1)
-    return out.drop(columns=["_canonical_job_url"], errors="ignore")
+    current = (
+        base_df["description"].fillna("").astype(str).str.strip()
+        if "description" in base_df.columns
+        else pd.Series("", index=base_df.index)
+    )
+    fetched = _canonical_job_urls(base_df).map(details_by_url).fillna("").astype(str).str.strip()
+    return base_df.assign(description=current.where(current != "", fetched))
 
 
 def _fetch_single_linkedin_term(
@@ -775,7 +1151,19 @@ def _fetch_single_linkedin_term(
     results_wanted: int,
     fetch_description: bool,
     proxy_pool: Optional[List[str]] = None,
+    deadline: Optional[RunDeadline] = None,
+    offset: int = 0,
+    controller: Optional[AdaptiveConcurrency] = None,
+    report: Optional[RunReport] = None,
+    cache: Optional[ScrapeCache] = None,
 ) -> Optional[pd.DataFrame]:
+    if cache is not None:
+        cached = cache.get(term, location, hours_old, offset, results_wanted, fetch_description)
+        if report is not None:
+            report.count("scrape_cache_hits" if cached is not None else "scrape_cache_misses")
+        if cached is not None:
+            return _project_scrape_columns(cached)
+
     raw_rl_retries = os.environ.get("FETCH_RATE_LIMIT_RETRIES", "").strip()
     try:
         rate_limit_retries = int(raw_rl_retries) if raw_rl_retries else DEFAULT_RATE_LIMIT_RETRIES
@@ -784,25 +1172,43 @@ def _fetch_single_linkedin_term(
     max_attempts = max(SCRAPE_RETRIES + 1, max(1, rate_limit_retries))
 
     for attempt in range(max_attempts):
+        if deadline is not None and deadline.expired:
+            deadline.cut("scrape")
+            return None
+        proxy = _proxy_for_attempt(proxy_pool or [], term, attempt)
         try:
-            proxy = _proxy_for_attempt(proxy_pool or [], term, attempt)
-            df = scrape_jobs(
-                site_name=["linkedin"],
-                search_term=term,
-                location=location,
-                hours_old=hours_old,
-                results_wanted=results_wanted,
-                verbose=0,
-                linkedin_fetch_description=fetch_description,
-                proxies=proxy,
-            )
+            # The slot covers the request only; backoff sleeps hold no slot.
+            with controller.slot() if controller is not None else nullcontext():
+                df = _scrape_jobs(
+                    site_name=["linkedin"],
+                    search_term=term,
+                    location=location,
+                    hours_old=hours_old,
+                    results_wanted=results_wanted,
+                    verbose=0,
+                    linkedin_fetch_description=fetch_description,
+                    proxies=proxy,
+                    offset=offset,
+                )
+            df = _project_scrape_columns(df)
+            if cache is not None:
+                cache.put(term, location, hours_old, offset, results_wanted, fetch_description, df)
             return df
         except Exception as e:
             is_429 = _is_rate_limited_error(e)
+            _mark_proxy_failed(proxy)
             if attempt >= (max_attempts - 1):
                 logger.error("scrape_jobs failed term=%s error=%s", term, e)
                 return None
             sleep_sec = _retry_sleep_seconds(e, attempt)
+            if deadline is not None and not deadline.can_afford(sleep_sec):
+                logger.error("scrape_jobs giving up term=%s: retry sleep exceeds run deadline", term)
+                deadline.cut("scrape_retries")
+                return None
+            if report is not None:
+                report.count("scrape_retries")
+                if is_429:
+                    report.count("scrape_rate_limited")
             logger.warning(
                 "scrape_jobs retry term=%s attempt=%s/%s rate_limited=%s sleep=%.1fs error=%s",
                 term,
@@ -812,86 +1218,690 @@ def _fetch_single_linkedin_term(
                 sleep_sec,
                 e,
             )
-            time.sleep(sleep_sec)
+            sleeper.sleep(sleep_sec, "scrape_rate_limit" if is_429 else "scrape_retry", host="linkedin.com")
     return None
 
 
+def _fetch_linkedin_term_paged(
+    term: str,
+    location: str,
+    hours_old: int,
+    results_wanted: int,
+    fetch_description: bool,
+    page_size: int,
+    known_urls: KnownJobs,
+    stop_after_known: int = DEFAULT_EARLY_STOP_KNOWN,
+    proxy_pool: Optional[List[str]] = None,
+    deadline: Optional[RunDeadline] = None,
+    controller: Optional[AdaptiveConcurrency] = None,
+    report: Optional[RunReport] = None,
+    cache: Optional[ScrapeCache] = None,
+) -> Optional[pd.DataFrame]:
+    # Pulls `page_size` results at a time and stops once `stop_after_known`
+    # consecutive postings were already known before this run started.
+    # Postings other terms of this run scraped do not count: overlapping
+    # terms would otherwise cut each other short depending on which one
+    # finished first. Every scraped URL is still added to the set.
+    pages: List[pd.DataFrame] = []
+    offset = 0
+    known_streak = 0
+    stop_reason = "budget"
+    while offset < results_wanted:
+        if pages and deadline is not None and deadline.expired:
+            deadline.cut("scrape_pages")
+            stop_reason = "deadline"
+            break
+        wanted = min(page_size, results_wanted - offset)
+        page = _fetch_single_linkedin_term(
+            term,
+            location,
+            hours_old,
+            wanted,
+            fetch_description=fetch_description,
+            proxy_pool=proxy_pool,
+            deadline=deadline,
+            offset=offset,
+            controller=controller,
+            report=report,
+            cache=cache,
+        )
+        if page is None and not pages:
+            return None  # first page failed: let fetch_linkedin's fallback retry the term
+        if page is None:
+            # A later page gave up (429s, deadline): the listing goes on,
+            # this term just did not get all of it.
+            stop_reason = "failed"
+            break
+        if page.empty:
+            stop_reason = "exhausted"
+            break
+        pages.append(page)
+        offset += wanted
+
+        canonical = _canonical_job_urls(page).tolist()
+        for url in canonical:
+            known_streak = known_streak + 1 if url and known_urls.known_before_run(url) else 0
+            if stop_after_known and known_streak >= stop_after_known:
+                stop_reason = "known"
+                break
+        known_urls.add_many(canonical)
+        if stop_reason == "known":
+            break
+        if len(page) < wanted:
+            stop_reason = "exhausted"
+            break
+
+    if report is not None:
+        report.count("scrape_pages", len(pages))
+        report.count(f"scrape_stop_{stop_reason}")
+    logger.info(
+        "Paged fetch term=%s pages=%s rows=%s stop=%s",
+        term,
+        len(pages),
+        sum(len(page) for page in pages),
+        stop_reason,
+    )
+    if not pages:
+        return pd.DataFrame()
+    return pd.concat(pages, ignore_index=True, sort=False)
+
+
+def _as_locations(location: Union[str, Sequence[str]]) -> List[str]:
+    return [location] if isinstance(location, str) else list(location)
+
+
+def _search_units(queries: List[str], locations: List[str]) -> List[Tuple[str, str]]:
+    # Term-major, so a term's locations are scraped close together.
+    return [(term, location) for term in queries for location in locations]
+
+
+def _unit_label(unit: Tuple[str, str], multi_location: bool) -> str:
+    term, location = unit
+    return f"{term}@{location}" if multi_location else term
+
+
 def fetch_linkedin(
     queries: List[str],
-    location: str,
+    location: Union[str, Sequence[str]],
     hours_old: int,
     results_wanted: int,
     results_budget_by_term: Optional[Dict[str, int]] = None,
     fetch_description: bool = True,
     proxy_pool: Optional[List[str]] = None,
+    on_frame: Optional[Callable[[str, pd.DataFrame], None]] = None,
+    deadline: Optional[RunDeadline] = None,
+    known_urls: Optional[KnownJobs] = None,
+    report: Optional[RunReport] = None,
+    cache: Optional[ScrapeCache] = None,
+    stats: Optional[SiteStats] = None,
+    units: Optional[List[Tuple[str, str]]] = None,
 ) -> pd.DataFrame:
+    # With `on_frame` (spill mode) each term's frame is handed off as soon as
+    # it arrives instead of being concatenated, and an empty frame is returned.
+    # Every (term, location) pair is one unit of work for the controller;
+    # `units` narrows them (fetch_sources passes the ones a resumed run lacks).
     dfs: List[pd.DataFrame] = []
-    workers = _resolve_fetch_query_workers(len(queries))
+    locations = _as_locations(location)
+    multi_location = len(locations) > 1
+    units = units if units is not None else _search_units(queries, locations)
+    # FETCH_QUERY_CONCURRENCY caps the controller, so lowering it still
+    # limits LinkedIn traffic.
+    query_workers = _resolve_fetch_query_workers(len(units))
+    controller = AdaptiveConcurrency(
+        query_workers,
+        max_limit=query_workers,
+        is_congestion=_is_rate_limited_error,
+        name="scrape",
+    )
     term_budget = results_budget_by_term or {}
+    page_size = _resolve_fetch_page_size()
+    stop_after_known = _resolve_early_stop_known()
+    if page_size and known_urls is None:
+        known_urls = KnownJobs()
     logger.info(
-        "Fetch mode: queries=%s workers=%s fetch_description=%s",
+        "Fetch mode: queries=%s locations=%s workers=%s max_workers=%s fetch_description=%s page_size=%s early_stop_known=%s",
         len(queries),
-        workers,
+        len(locations),
+        controller.limit,
+        controller.max_limit,
         fetch_description,
+        page_size or "off",
+        stop_after_known if page_size else "off",
     )
 
-    pending_terms = list(queries)
-    current_workers = workers
-    rounds = 0
-    while pending_terms:
-        rounds += 1
-        pairs = _fetch_terms(
-            pending_terms,
-            lambda term: _fetch_single_linkedin_term(
+    report = report if report is not None else RunReport()
+
+    def fetch_term(unit: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        started = sleeper.clock()
+        with report.stage("scrape", item=_unit_label(unit, multi_location)) as stage:
+            df = _fetch_term(*unit)
+            stage.done(rows_out=0 if df is None else len(df), nbytes=0 if df is None else frame_bytes(df))
+        if stats is not None:
+            stats.record_term(sleeper.clock() - started)
+        return df
+
+    def _fetch_term(term: str, term_location: str) -> Optional[pd.DataFrame]:
+        budget = int(term_budget.get(term, results_wanted))
+        if page_size:
+            return _fetch_linkedin_term_paged(
                 term,
-                location,
+                term_location,
                 hours_old,
-                int(term_budget.get(term, results_wanted)),
+                budget,
                 fetch_description=fetch_description,
+                page_size=page_size,
+                known_urls=known_urls,
+                stop_after_known=stop_after_known,
                 proxy_pool=proxy_pool,
-            ),
-            max_workers=current_workers,
+                deadline=deadline,
+                controller=controller,
+                report=report,
+                cache=cache,
+            )
+        df = _fetch_single_linkedin_term(
+            term,
+            term_location,
+            hours_old,
+            budget,
+            fetch_description=fetch_description,
+            proxy_pool=proxy_pool,
+            deadline=deadline,
+            controller=controller,
+            report=report,
+            cache=cache,
         )
-        failed_terms: List[str] = []
-        for term, df in pairs:
-            if df is None or df.empty:
-                failed_terms.append(term)
-                continue
-            df = df.loc[:, df.notna().any(axis=0)]
-            if "job_url" in df.columns:
-                df = df.drop_duplicates(subset=["job_url"], keep="first")
-            df["source_query"] = term
+        if known_urls is not None and df is not None:
+            known_urls.add_many(_canonical_job_urls(df).tolist())
+        return df
+
+    failed_terms: List[str] = []
+    for (term, term_location), df in _fetch_terms(
+        list(units),
+        fetch_term,
+        max_workers=controller.max_limit,
+        max_attempts=MAX_TERM_ATTEMPTS,
+        retry_cooldown_sec=_resolve_term_retry_cooldown_sec(),
+        deadline=deadline,
+    ):
+        if df is None:
+            failed_terms.append(_unit_label((term, term_location), multi_location))
+            continue
+        if df.empty:
+            continue
+        df = df.loc[:, df.notna().any(axis=0)]
+        if "job_url" in df.columns:
+            df = df.drop_duplicates(subset=["job_url"], keep="first")
+        df["source_query"] = term
+        if multi_location:
+            df["source_location"] = term_location
+        if on_frame is not None:
+            on_frame(term, _categorize_columns(df))
+        else:
             dfs.append(df)
 
-        if not failed_terms:
-            break
-        if current_workers <= 1 or rounds >= 3:
-            logger.info("Fallback reached safe mode after %s rounds; stop retries", rounds)
-            break
+    if failed_terms:
+        logger.warning("Terms whose scrape failed: %s", failed_terms)
+        report.count("scrape_failed_terms", len(failed_terms))
+        if stats is not None:
+            stats.failed_terms += len(failed_terms)
+    report.count("scrape_concurrency_increases", controller.increases)
+    report.count("scrape_concurrency_decreases", controller.decreases)
+    logger.info(
+        "Scrape concurrency: final=%s peak=%s increases=%s decreases=%s",
+        controller.limit,
+        controller.peak_limit,
+        controller.increases,
+        controller.decreases,
+    )
+    if cache is not None:
+        logger.info("Scrape cache: hits=%s misses=%s writes=%s", cache.hits, cache.misses, cache.writes)
+    return _combine_term_frames(dfs)
+
 
-        raw_cooldown = os.environ.get("FETCH_RATE_LIMIT_COOLDOWN_SEC", "").strip()
+def _resolve_indeed_country() -> str:
+    return os.environ.get("FETCH_INDEED_COUNTRY", "").strip().lower() or DEFAULT_INDEED_COUNTRY
+
+
+def _fetch_single_site_term(
+    site: str,
+    term: str,
+    location: str,
+    hours_old: int,
+    results_wanted: int,
+    policy: SitePolicy,
+    limiter: RateLimiter,
+    proxy_pool: Optional[List[str]] = None,
+    deadline: Optional[RunDeadline] = None,
+    report: Optional[RunReport] = None,
+) -> Optional[pd.DataFrame]:
+    # Boards other than LinkedIn page internally, so one scrape_jobs call
+    # covers the term. Requests are spaced by the board's limiter and
+    # retried with the board's own backoff.
+    for attempt in range(policy.retries + 1):
+        if deadline is not None and deadline.expired:
+            deadline.cut("scrape")
+            return None
+        limiter.acquire()
+        proxy = _proxy_for_attempt(proxy_pool or [], f"{site}:{term}", attempt)
         try:
-            cooldown_sec = float(raw_cooldown) if raw_cooldown else DEFAULT_RATE_LIMIT_COOLDOWN_SEC
-        except ValueError:
-            cooldown_sec = DEFAULT_RATE_LIMIT_COOLDOWN_SEC
-        next_workers = max(1, current_workers // 2)
+            return _project_scrape_columns(
+                _scrape_jobs(
+                    site_name=[site],
+                    search_term=term,
+                    location=location,
+                    hours_old=hours_old,
+                    results_wanted=results_wanted,
+                    country_indeed=_resolve_indeed_country(),
+                    verbose=0,
+                    proxies=proxy,
+                )
+            )
+        except Exception as e:
+            _mark_proxy_failed(proxy)
+            if attempt >= policy.retries:
+                logger.error("scrape_jobs failed site=%s term=%s error=%s", site, term, e)
+                return None
+            sleep_sec = policy.backoff_sec * (2**attempt) + random.uniform(0, 0.5)
+            if deadline is not None and not deadline.can_afford(sleep_sec):
+                deadline.cut("scrape_retries")
+                return None
+            if report is not None:
+                report.count("scrape_retries")
+            logger.warning(
+                "scrape_jobs retry site=%s term=%s attempt=%s/%s sleep=%.1fs error=%s",
+                site,
+                term,
+                attempt + 1,
+                policy.retries + 1,
+                sleep_sec,
+                e,
+            )
+            sleeper.sleep(sleep_sec, "scrape_retry", host=site)
+    return None
+
+
+def _fetch_site_terms(
+    site: str,
+    queries: List[str],
+    location: Union[str, Sequence[str]],
+    hours_old: int,
+    results_wanted: int,
+    deliver: Callable[[str, pd.DataFrame], None],
+    stats: SiteStats,
+    results_budget_by_term: Optional[Dict[str, int]] = None,
+    proxy_pool: Optional[List[str]] = None,
+    deadline: Optional[RunDeadline] = None,
+    known_urls: Optional[KnownJobs] = None,
+    report: Optional[RunReport] = None,
+    units: Optional[List[Tuple[str, str]]] = None,
+) -> None:
+    policy = SitePolicy.from_env(site)
+    limiter = RateLimiter(
+        policy.min_interval_sec,
+        sleep=lambda seconds: sleeper.sleep(seconds, "source_rate_limit", host=site),
+        clock=sleeper.clock,
+    )
+    term_budget = results_budget_by_term or {}
+    report = report if report is not None else RunReport()
+    locations = _as_locations(location)
+    multi_location = len(locations) > 1
+    units = units if units is not None else _search_units(queries, locations)
+    logger.info(
+        "Fetch mode: site=%s queries=%s locations=%s workers=%s min_interval=%.1fs retries=%s",
+        site,
+        len(queries),
+        len(locations),
+        policy.workers,
+        policy.min_interval_sec,
+        policy.retries,
+    )
+
+    def fetch_term(unit: Tuple[str, str]) -> Optional[pd.DataFrame]:
+        term, term_location = unit
+        started = sleeper.clock()
+        with report.stage("scrape", item=f"{site}:{_unit_label(unit, multi_location)}") as stage:
+            df = _fetch_single_site_term(
+                site,
+                term,
+                term_location,
+                hours_old,
+                int(term_budget.get(term, results_wanted)),
+                policy,
+                limiter,
+                proxy_pool=proxy_pool,
+                deadline=deadline,
+                report=report,
+            )
+            stage.done(rows_out=0 if df is None else len(df), nbytes=0 if df is None else frame_bytes(df))
+        stats.record_term(sleeper.clock() - started)
+        return df
+
+    for (term, term_location), df in _fetch_terms(list(units), fetch_term, max_workers=policy.workers, deadline=deadline):
+        if df is None:
+            stats.failed_terms += 1
+            if report is not None:
+                report.count("scrape_failed_terms")
+            continue
+        if df.empty:
+            continue
+        deliver(term, _tag_site_frame(df, site, term, known_urls, term_location if multi_location else ""))
+
+
+def _tag_site_frame(
+    df: pd.DataFrame,
+    site: str,
+    term: str,
+    known_urls: Optional[KnownJobs],
+    location: str = "",
+) -> pd.DataFrame:
+    df = df.loc[:, df.notna().any(axis=0)]
+    if "job_url" in df.columns:
+        df = df.drop_duplicates(subset=["job_url"], keep="first")
+    df["site"] = site
+    df["source_query"] = term
+    if location:
+        df["source_location"] = location
+    if known_urls is not None:
+        known_urls.add_many(_canonical_job_urls(df).tolist())
+    return _categorize_columns(df)
+
+
+def _resolve_cn_max_pages() -> int:
+    raw = os.environ.get("FETCH_CN_MAX_PAGES", "").strip()
+    try:
+        value = int(raw) if raw else DEFAULT_CN_MAX_PAGES
+    except ValueError:
+        value = DEFAULT_CN_MAX_PAGES
+    return max(1, value)
+
+
+def _fetch_search_terms(
+    site: str,
+    queries: List[str],
+    location: Union[str, Sequence[str]],
+    results_wanted: int,
+    deliver: Callable[[str, pd.DataFrame], None],
+    stats: SiteStats,
+    deadline: Optional[RunDeadline] = None,
+    known_urls: Optional[KnownJobs] = None,
+    report: Optional[RunReport] = None,
+    units: Optional[List[Tuple[str, str]]] = None,
+) -> None:
+    # Search-result sources (cn_fetcher) fan out (term, page) queries in one
+    # pool instead of going through scrape_jobs; hours_old does not apply.
+    from cn_fetcher import CnSearchFetcher  # type: ignore
+
+    policy = SitePolicy.from_env(site)
+    limiter = RateLimiter(
+        policy.min_interval_sec,
+        sleep=lambda seconds: sleeper.sleep(seconds, "source_rate_limit", host=site),
+        clock=sleeper.clock,
+    )
+    fetcher = CnSearchFetcher(
+        http,
+        workers=policy.workers,
+        acquire=limiter.acquire,
+        retries=policy.retries,
+        backoff_sec=policy.backoff_sec,
+        sleep=lambda seconds: sleeper.sleep(seconds, "scrape_retry", host=site),
+        max_pages=_resolve_cn_max_pages(),
+        expired=(lambda: deadline.expired) if deadline is not None else (lambda: False),
+    )
+    locations = _as_locations(location)
+    multi_location = len(locations) > 1
+    units = units if units is not None else _search_units(queries, locations)
+    logger.info(
+        "Fetch mode: site=%s queries=%s locations=%s workers=%s max_pages=%s min_interval=%.1fs",
+        site,
+        len(queries),
+        len(locations),
+        policy.workers,
+        fetcher.max_pages,
+        policy.min_interval_sec,
+    )
+    delivered = set()
+    for term, term_location, df in fetcher.fetch_units(list(units), results_wanted):
+        delivered.add((term, term_location))
+        stats.record_term(fetcher.term_seconds.get((term, term_location), 0.0))
+        deliver(term, _tag_site_frame(df, site, term, known_urls, term_location if multi_location else ""))
+    stats.failed_terms += len(set(units) - delivered)
+    if report is not None:
+        report.count("search_requests", fetcher.requests)
+        report.count("search_failed_pages", fetcher.failed_pages)
+        if fetcher.blocked:
+            report.count("search_blocked")
+    logger.info(
+        "Search source site=%s requests=%s failed_pages=%s blocked=%s parse=%.3fs",
+        site,
+        fetcher.requests,
+        fetcher.failed_pages,
+        fetcher.blocked,
+        fetcher.parse_sec,
+    )
+
+
+def _posting_fingerprints(df: pd.DataFrame) -> pd.Series:
+    # The same posting carries a different URL on every board, so boards are
+    # matched on what the posting says rather than where it lives.
+    parts = [
+        df.get(column, pd.Series("", index=df.index)).astype(object).map(_fingerprint_value)
+        for column in ("title", "company", "location")
+    ]
+    fingerprint = parts[0] + "|" + parts[1] + "|" + parts[2]
+    return fingerprint.where(parts[0].ne("") & parts[1].ne(""), "")
+
+
+def _frame_source(df: pd.DataFrame) -> str:
+    """Board a fetched frame came from (frames without a `site` column are LinkedIn's)."""
+    if "site" in df.columns and len(df):
+        return str(df["site"].iloc[0] or "linkedin")
+    return "linkedin"
+
+
+def _frame_location(df: pd.DataFrame) -> str:
+    """Searched location of a fetched frame; "" unless the run searched several."""
+    if "source_location" in df.columns and len(df):
+        return str(df["source_location"].iloc[0] or "")
+    return ""
+
+
+def fetch_sources(
+    sources: List[str],
+    queries: List[str],
+    location: Union[str, Sequence[str]],
+    hours_old: int,
+    results_wanted: int,
+    results_budget_by_term: Optional[Dict[str, int]] = None,
+    fetch_description: bool = True,
+    proxy_pool: Optional[List[str]] = None,
+    on_frame: Optional[Callable[[str, pd.DataFrame], None]] = None,
+    deadline: Optional[RunDeadline] = None,
+    known_urls: Optional[KnownJobs] = None,
+    report: Optional[RunReport] = None,
+    cache: Optional[ScrapeCache] = None,
+    skip_keys: Optional[Set[str]] = None,
+) -> pd.DataFrame:
+    """Scrape `queries` on every board in `sources` at once.
+
+    Each board runs on its own thread under its SitePolicy (LinkedIn through
+    fetch_linkedin, unchanged). Frames go through the cross-board dedupe as
+    they arrive: a posting already delivered by another board is dropped,
+    so the first board to return it wins. Duplicates within one board are
+    left to the pipeline's dedupe, as before.
+
+    `location` may be a list: every (term, location) pair is then scheduled
+    through each board's own concurrency controller, and a posting already
+    delivered for the same term under another location is dropped by
+    canonical URL as frames arrive (national and remote postings show up in
+    every city). Per-location yield lands in report.meta["locations"].
+
+    `skip_keys` holds the source_term_key()s a resumed run already has.
+    Per-board latency and yield land in report.meta["sources"].
+    """
+    report = report if report is not None else RunReport()
+    skip = skip_keys or set()
+    locations = _as_locations(location)
+    multi_location = len(locations) > 1
+    pending = {
+        site: [
+            (term, loc)
+            for term, loc in _search_units(queries, locations)
+            if source_term_key(site, term, loc if multi_location else "") not in skip
+        ]
+        for site in sources
+    }
+    if list(sources) == ["linkedin"] and not multi_location:
+        return fetch_linkedin(
+            [term for term, _ in pending["linkedin"]],
+            location,
+            hours_old,
+            results_wanted,
+            results_budget_by_term=results_budget_by_term,
+            fetch_description=fetch_description,
+            proxy_pool=proxy_pool,
+            on_frame=on_frame,
+            deadline=deadline,
+            known_urls=known_urls,
+            report=report,
+            cache=cache,
+        )
+
+    dfs: List[pd.DataFrame] = []
+    lock = threading.Lock()
+    owner: Dict[Tuple[str, str], str] = {}
+    delivered_urls: Set[tuple] = set()
+    stats = {site: SiteStats(site, clock=sleeper.clock) for site in sources}
+    location_stats = {loc: SiteStats(loc, clock=sleeper.clock) for loc in locations}
+
+    def deliver(site: str, term: str, df: pd.DataFrame) -> None:
+        # Serialized: `owner` is shared and on_frame consumers (spill,
+        # checkpoint) expect one frame at a time. Both dedupes are keyed by
+        # term: batch mode hands each run only the terms it asked for, so a
+        # posting must survive under each term.
+        with lock:
+            fingerprints = _posting_fingerprints(df)
+            keep = [not fp or owner.setdefault((term, fp), site) == site for fp in fingerprints]
+            if multi_location:
+                for index, url in enumerate(_canonical_job_urls(df)):
+                    if url and keep[index]:
+                        keep[index] = (term, url) not in delivered_urls
+                        delivered_urls.add((term, url))
+            kept = df if all(keep) else df[keep]
+            stats[site].record_frame(len(df), len(kept))
+            if multi_location:
+                location_stats[_frame_location(df) or locations[0]].record_frame(len(df), len(kept))
+            if kept.empty:
+                return
+            if on_frame is not None:
+                on_frame(term, kept)
+            else:
+                dfs.append(kept)
+
+    def run_site(site: str) -> None:
+        site_stats = stats[site]
+        site_stats.start()
+        try:
+            if site == "linkedin":
+                fetch_linkedin(
+                    queries,
+                    locations,
+                    hours_old,
+                    results_wanted,
+                    results_budget_by_term=results_budget_by_term,
+                    fetch_description=fetch_description,
+                    proxy_pool=proxy_pool,
+                    on_frame=lambda term, frame: deliver(site, term, frame),
+                    deadline=deadline,
+                    known_urls=known_urls,
+                    report=report,
+                    cache=cache,
+                    stats=site_stats,
+                    units=pending[site],
+                )
+            elif site in SEARCH_SOURCES:
+                _fetch_search_terms(
+                    site,
+                    queries,
+                    locations,
+                    results_wanted,
+                    deliver=lambda term, frame: deliver(site, term, frame),
+                    stats=site_stats,
+                    deadline=deadline,
+                    known_urls=known_urls,
+                    report=report,
+                    units=pending[site],
+                )
+            else:
+                _fetch_site_terms(
+                    site,
+                    queries,
+                    locations,
+                    hours_old,
+                    results_wanted,
+                    deliver=lambda term, frame: deliver(site, term, frame),
+                    stats=site_stats,
+                    results_budget_by_term=results_budget_by_term,
+                    proxy_pool=proxy_pool,
+                    deadline=deadline,
+                    known_urls=known_urls,
+                    report=report,
+                    units=pending[site],
+                )
+        finally:
+            site_stats.finish()
+
+    errors: Dict[str, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {pool.submit(run_site, site): site for site in sources}
+        for future in futures:
+            try:
+                future.result()
+            except Exception as err:
+                logger.exception("source failed site=%s", futures[future])
+                errors[futures[future]] = err
+    if errors:
+        report.count("scrape_failed_sources", len(errors))
+        if len(errors) == len(sources):
+            raise next(iter(errors.values()))
+
+    summary = {site: stats[site].summary() for site in sources}
+    report.meta["sources"] = summary
+    for site, entry in summary.items():
         logger.info(
-            "Adaptive fallback for %s failed terms after cooldown %.1fs (workers %s -> %s)",
-            len(failed_terms),
-            cooldown_sec,
-            current_workers,
-            next_workers,
+            "Source site=%s elapsed=%.1fs first_frame=%s terms=%s term_p50=%.2fs rows=%s kept=%s yield=%.2f",
+            site,
+            entry["elapsedSec"],
+            entry["firstFrameSec"],
+            entry["terms"],
+            entry["termP50Sec"],
+            entry["rows"],
+            entry["keptRows"],
+            entry["yield"],
         )
-        time.sleep(max(1.0, cooldown_sec))
-        pending_terms = failed_terms
-        current_workers = next_workers
+    if multi_location:
+        by_location = {}
+        for loc, loc_stats in location_stats.items():
+            entry = loc_stats.summary()
+            by_location[loc] = {key: entry[key] for key in ("frames", "rows", "keptRows", "yield")}
+            logger.info(
+                "Location location=%s frames=%s rows=%s kept=%s yield=%.2f",
+                loc,
+                entry["frames"],
+                entry["rows"],
+                entry["keptRows"],
+                entry["yield"],
+            )
+        report.meta["locations"] = by_location
+    return _combine_term_frames(dfs)
+
 
+def _combine_term_frames(dfs: List[pd.DataFrame]) -> pd.DataFrame:
     if not dfs:
         return pd.DataFrame()
     out = pd.concat(dfs, ignore_index=True, sort=False)
     if "job_url" in out.columns:
         out = out.drop_duplicates(subset=["job_url"], keep="first")
-    return out
+    return _categorize_columns(out)
 
 
 def api_base() -> str:
@@ -913,7 +1923,7 @@ def _is_cancelled_run(run: Dict[str, Any]) -> bool:
 
 
 def _fetch_run_config(base: str, run_id: str, headers: Dict[str, str]) -> Dict[str, Any]:
-    cfg_res = requests.get(
+    cfg_res = http.get(
         f"{base}/api/fetch-runs/{run_id}/config",
         headers=headers,
         timeout=30,
@@ -922,29 +1932,331 @@ def _fetch_run_config(base: str, run_id: str, headers: Dict[str, str]) -> Dict[s
     return cfg_res.json()["run"]
 
 
+def _update_run(base: str, run_id: str, headers: Dict[str, str], payload: Dict[str, Any]) -> None:
+    http.patch(
+        f"{base}/api/fetch-runs/{run_id}/update",
+        headers=headers,
+        data=json.dumps(payload),
+        timeout=30,
+    ).raise_for_status()
+
+
+class RunCancelled(SystemExit):
+    """Exit status 0; batch mode catches it to carry on with the other runs."""
+
+    def __init__(self) -> None:
+        super().__init__(0)
+
+
 def _abort_if_cancelled(base: str, run_id: str, headers: Dict[str, str], stage: str) -> None:
     run = _fetch_run_config(base, run_id, headers=headers)
     if _is_cancelled_run(run):
         logger.info("FetchRun cancelled at stage=%s. exiting.", stage)
         # SystemExit is not caught by the bottom-level Exception handler.
-        sys.exit(0)
+        raise RunCancelled()
 
 
-def main():
+def _filter_jobs_frame(
+    df: pd.DataFrame,
+    search_terms: List[str],
+    include_from_queries: bool,
+    exclude_title_terms: Optional[List[str]],
+    active_rights_rules: List[str],
+    active_experience_rules: List[str],
+    identity_region: str,
+    identity_strictness: str,
+    report: Optional[RunReport] = None,
+) -> pd.DataFrame:
+    report = report if report is not None else RunReport()
+    with report.stage("title_filter", rows_in=len(df)) as stage:
+        df = filter_title(
+            df,
+            search_terms,
+            enforce_include=include_from_queries,
+            exclude_terms=exclude_title_terms,
+        )
+        stage.done(rows_out=len(df))
+    logger.info("Rows after title filter: %s", len(df))
+    with report.stage("keep_columns", rows_in=len(df)) as stage:
+        df = keep_columns(df)
+        stage.done(rows_out=len(df))
+    # Clean before description exclusion for more consistent matching
+    with report.stage("clean_description", rows_in=len(df)) as stage:
+        df = clean_description(df)
+        stage.done(rows_out=len(df))
+    if not (active_rights_rules or active_experience_rules):
+        return df
+
+    # v2 matcher — layered regex + weighted scoring with audit trail.
+    # Import errors surface loudly; a silent fallback to the retired
+    # legacy regex would downgrade filter quality without warning.
+    if active_rights_rules:
+        from rights_filter import filter_description_v2  # type: ignore
+
+        with report.stage("rights_filter", rows_in=len(df)) as stage:
+            df, audit_df = filter_description_v2(
+                df,
+                rules=active_rights_rules,
+                region=identity_region,
+                strictness=identity_strictness,
+            )
+            stage.done(rows_out=len(df))
+        if not audit_df.empty:
+            audit_summary = (
+                audit_df.groupby("rule")["score"].count().to_dict()
+                if "rule" in audit_df.columns
+                else {}
+            )
+            logger.info(
+                "filter_description_v2 dropped=%s region=%s strictness=%s by_rule=%s",
+                len(audit_df),
+                identity_region,
+                identity_strictness,
+                audit_summary,
+            )
+    if active_experience_rules:
+        with report.stage("experience_filter", rows_in=len(df)) as stage:
+            df, experience_audit_df = filter_experience_requirements(
+                df,
+                rules=active_experience_rules,
+            )
+            stage.done(rows_out=len(df))
+        if not experience_audit_df.empty:
+            experience_summary = (
+                experience_audit_df.groupby("rule")["score"].count().to_dict()
+                if "rule" in experience_audit_df.columns
+                else {}
+            )
+            logger.info(
+                "filter_experience_requirements dropped=%s by_rule=%s",
+                len(experience_audit_df),
+                experience_summary,
+            )
+    logger.info("Rows after description filter: %s", len(df))
+    return df
+
+
+def _filter_listings(
+    df: pd.DataFrame,
+    filter_options: Dict[str, Any],
+    report: RunReport,
+    seen_keys: Optional[Set[str]] = None,
+) -> pd.DataFrame:
+    # Phase 1 runs only the listing-level filters (title, exact dedupe) so
+    # Phase 2 requests detail pages just for rows that can still be imported.
+    # Both steps are idempotent, so _filter_jobs_frame/_dedupe_frame can run
+    # over the enriched frame unchanged.
+    with report.stage("listing_filter", rows_in=len(df)) as stage:
+        rows_in = len(df)
+        df = filter_title(
+            df,
+            filter_options["search_terms"],
+            enforce_include=filter_options["include_from_queries"],
+            exclude_terms=filter_options["exclude_title_terms"],
+        )
+        df = dedupe_jobs(df, seen_keys=seen_keys)
+        stage.done(rows_out=len(df))
+    logger.info("Two-phase listing filter: rows=%s kept=%s", rows_in, len(df))
+    return df
+
+
+def _enrich_listings(
+    df: pd.DataFrame,
+    filter_options: Dict[str, Any],
+    proxy_pool: Optional[List[str]],
+    deadline: Optional[RunDeadline],
+    report: RunReport,
+    seen_keys: Optional[Set[str]] = None,
+    fetch_fn: Optional[Callable[..., str]] = None,
+) -> pd.DataFrame:
+    df = _filter_listings(df, filter_options, report, seen_keys=seen_keys)
+    with report.stage("enrich", rows_in=len(df)) as stage:
+        df = _enrich_descriptions_for_urls(
+            df, proxy_pool=proxy_pool, fetch_fn=fetch_fn, deadline=deadline, report=report
+        )
+        stage.done(rows_out=len(df))
+    return df
+
+
+def _drop_near_duplicates(df: pd.DataFrame, threshold: float, index=None) -> pd.DataFrame:
+    if threshold <= 0 or df.empty:
+        return df
+    from near_duplicates import filter_near_duplicates  # type: ignore
+
+    df, near_dupe_audit_df = filter_near_duplicates(df, threshold=threshold, index=index)
+    if not near_dupe_audit_df.empty:
+        logger.info(
+            "filter_near_duplicates dropped=%s threshold=%.2f merged=%s",
+            len(near_dupe_audit_df),
+            threshold,
+            near_dupe_audit_df[["job_url", "duplicate_of", "similarity"]].head(20).to_dict(orient="records"),
+        )
+    return df
+
+
+def _dedupe_frame(
+    df: pd.DataFrame,
+    near_duplicate_threshold: float,
+    report: RunReport,
+    seen_keys: Optional[Set[str]] = None,
+    near_index=None,
+) -> pd.DataFrame:
+    with report.stage("dedupe", rows_in=len(df)) as stage:
+        df = dedupe_jobs(df, seen_keys=seen_keys)
+        stage.done(rows_out=len(df))
+    with report.stage("near_duplicates", rows_in=len(df)) as stage:
+        df = _drop_near_duplicates(df, near_duplicate_threshold, index=near_index)
+        stage.done(rows_out=len(df))
+    return df
+
+
+def _iter_spilled_items(
+    spill,
+    filter_options: Dict[str, Any],
+    near_duplicate_threshold: float,
+    report: Optional[RunReport] = None,
+    enrich: Optional[Callable[..., pd.DataFrame]] = None,
+) -> Iterator[Dict[str, Any]]:
+    # Out-of-core counterpart of the in-memory path in main(): one chunk in
+    # memory at a time, with exact and near-duplicate state carried across.
+    report = report if report is not None else RunReport()
+    seen_keys: Set[str] = set()
+    near_index = None
+    if near_duplicate_threshold > 0:
+        from near_duplicates import NearDuplicateIndex  # type: ignore
+
+        near_index = NearDuplicateIndex(threshold=near_duplicate_threshold)
+    listing_seen_keys: Set[str] = set()
+    for chunk in spill.iter_frames():
+        if enrich is not None:
+            chunk = enrich(chunk, seen_keys=listing_seen_keys)
+        chunk = _filter_jobs_frame(chunk, **filter_options, report=report)
+        chunk = _dedupe_frame(chunk, near_duplicate_threshold, report, seen_keys=seen_keys, near_index=near_index)
+        yield from chunk.to_dict(orient="records")
+
+
+def _batched(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch: List[Dict[str, Any]] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _import_items(
+    base: str,
+    run_id: str,
+    fetch_headers: Dict[str, str],
+    user_email: str,
+    items: Iterable[Dict[str, Any]],
+    batch_size: int = IMPORT_BATCH_SIZE,
+    skip_urls: Optional[Set[str]] = None,
+    on_batch: Optional[Callable[[List[str], int], None]] = None,
+    report: Optional[RunReport] = None,
+) -> int:
+    # `skip_urls` holds canonical URLs a checkpoint recorded as imported;
+    # `on_batch(canonical_urls, imported)` fires after each accepted batch.
+    report = report if report is not None else RunReport()
+    skip_urls = skip_urls or set()
+
+    def pending() -> Iterator[Dict[str, Any]]:
+        for item in items:
+            if skip_urls and _canonicalize_job_url(item.get("job_url")) in skip_urls:
+                report.count("import_items_skipped")
+                continue
+            yield item
+
+    imported = 0
+    started = False
+    for batch_index, batch in enumerate(_batched(pending(), batch_size)):
+        i = batch_index * batch_size
+        if not started:
+            started = True
+            _abort_if_cancelled(base, run_id, headers=fetch_headers, stage="before_import")
+        _abort_if_cancelled(base, run_id, headers=fetch_headers, stage=f"before_import_batch_{i}")
+        payload = json.dumps({"userEmail": user_email, "items": batch})
+        with report.stage("import_batch", rows_in=len(batch), item=str(batch_index)) as stage:
+            imp_res = None
+            for attempt in range(IMPORT_RETRIES + 1):
+                imp_res = http.post(
+                    f"{base}/api/admin/import",
+                    headers=headers_secret("IMPORT_SECRET", "x-import-secret"),
+                    data=payload,
+                    timeout=120,
+                )
+                if imp_res.ok:
+                    break
+                if attempt >= IMPORT_RETRIES:
+                    raise RuntimeError(
+                        f"import failed status={imp_res.status_code} body={imp_res.text}"
+                    )
+                report.count("import_retries")
+                sleeper.sleep(2 * (attempt + 1), "import_retry", host=urlsplit(base).hostname)
+            batch_imported = int(imp_res.json().get("imported", 0))
+            stage.done(rows_out=batch_imported, nbytes=len(payload.encode("utf-8")), attempts=attempt + 1)
+        imported += batch_imported
+        if on_batch is not None:
+            on_batch([_canonicalize_job_url(item.get("job_url")) for item in batch], batch_imported)
+    return imported
+
+
+def _resolve_run_ids() -> List[str]:
+    # RUN_IDS (comma-separated, alongside or instead of RUN_ID) serves several
+    # FetchRuns from one process; see _run_batch.
     run_id = os.environ.get("RUN_ID", "").strip()
-    if not run_id:
+    extra = _parse_csv_list(os.environ.get("RUN_IDS", ""))
+    return list(dict.fromkeys(([run_id] if run_id else []) + extra))
+
+
+def main():
+    run_ids = _resolve_run_ids()
+    if not run_ids:
         raise RuntimeError("RUN_ID is not set")
+    run_fetch_runs(run_ids)
 
-    base = api_base()
 
-    fetch_headers = headers_secret("FETCH_RUN_SECRET", "x-fetch-run-secret")
+def run_fetch_runs(run_ids: List[str]) -> None:
+    """Serve one run, or several as a batch; shared by main() and fetch_daemon."""
+    report = RunReport(",".join(run_ids))
+    sleeper.reset()
+    try:
+        if len(run_ids) > 1:
+            _run_batch(run_ids, report)
+        else:
+            _run_fetch(run_ids[0], report)
+    finally:
+        # Written on failure/cancel too: a timed-out run is the one to profile.
+        pool = _process_scraper
+        if pool is not None:
+            report.meta["processScrape"] = pool.summary()
+            logger.info("Process scrape: %s", report.meta["processScrape"])
+            pool.reset_stats()
+        report_path = resolve_report_path()
+        if report_path is not None:
+            report.meta["sleep"] = sleeper.summary()
+            report.write(report_path)
+
+
+def _resolve_locations(value: Any) -> List[str]:
+    """run.location as a list: one string or several, blanks and repeats dropped."""
+    locations: List[str] = []
+    seen: Set[str] = set()
+    for item in value if isinstance(value, (list, tuple)) else [value]:
+        location = str(item or "").strip()
+        key = _batch_key(location)
+        if not location or key in seen:
+            continue
+        seen.add(key)
+        locations.append(location)
+    return locations or [DEFAULT_LOCATION]
 
-    # Get run config
-    run = _fetch_run_config(base, run_id, headers=fetch_headers)
-    if _is_cancelled_run(run):
-        logger.info("FetchRun already cancelled before start. exiting.")
-        sys.exit(0)
 
+def _run_settings(run: Dict[str, Any]) -> Dict[str, Any]:
+    # Everything main() needs from a FetchRun config, shared by single-run
+    # and batch mode.
     user_email = run["userEmail"]
     raw_queries = run["queries"] or {}
     if isinstance(raw_queries, list):
@@ -969,13 +2281,28 @@ def main():
     identity_region = "GLOBAL"
     identity_strictness = "balanced"
 
-    location = run.get("location") or "Sydney, New South Wales, Australia"
+    # The API stores the full list in queries.locations and the first
+    # entry in the location column.
+    raw_location = run.get("location")
+    if isinstance(raw_queries, dict) and raw_queries.get("locations"):
+        raw_location = raw_queries.get("locations")
+    locations = _resolve_locations(raw_location)
     hours_old = int(run.get("hoursOld") or 48)
     results_wanted = int(run.get("resultsWanted") or DEFAULT_FULL_FETCH_RESULTS_WANTED)
+    incremental = None
+    if _resolve_incremental():
+        incremental = _incremental_window(
+            run.get("previousSucceededAt"),
+            hours_old,
+            results_wanted,
+            _resolve_incremental_overlap_hours(),
+        )
+    if incremental is not None:
+        hours_old = incremental["hoursOld"]
+        results_wanted = incremental["resultsWanted"]
     include_from_queries = bool(run.get("includeFromQueries") or False)
     if not include_from_queries and isinstance(raw_queries, dict):
         include_from_queries = bool(raw_queries.get("includeFromQueries") or False)
-    proxy_pool = _parse_csv_list(os.environ.get("FETCH_PROXY_POOL", ""))
 
     active_rights_rules = (
         [rule for rule in exclude_desc_rules if rule in DESCRIPTION_RIGHTS_RULES]
@@ -987,148 +2314,471 @@ def main():
         if apply_excludes
         else []
     )
-    filter_desc = bool(active_rights_rules or active_experience_rules)
+    search_terms = _resolve_search_terms(title_query=title_query, queries=queries)
+    return {
+        "user_email": user_email,
+        "market": str(run.get("market") or "AU").upper(),
+        "search_terms": search_terms,
+        "locations": locations,
+        "hours_old": hours_old,
+        "results_wanted": results_wanted,
+        "incremental": incremental,
+        "filter_options": {
+            "search_terms": search_terms,
+            "include_from_queries": include_from_queries,
+            "exclude_title_terms": exclude_title_terms if apply_excludes else None,
+            "active_rights_rules": active_rights_rules,
+            "active_experience_rules": active_experience_rules,
+            "identity_region": identity_region,
+            "identity_strictness": identity_strictness,
+        },
+    }
+
+
+# Counters that mean part of the run's window was not scraped: terms,
+# pages or boards whose scrape failed. Terms that found nothing, or ran
+# out of results, are complete.
+GAP_COUNTERS = (
+    "scrape_failed_terms",
+    "scrape_stop_failed",
+    "scrape_failed_sources",
+    "search_failed_pages",
+    "search_blocked",
+)
+
+
+def _scrape_gaps(counters: Dict[str, float], before: Optional[Dict[str, float]] = None) -> List[str]:
+    # GAP_COUNTERS that grew (since `before`, for one group of a batch).
+    # Together with deadline cuts they make a run partial, and incremental
+    # runs only start after complete ones, so a gap is never narrowed past.
+    before = before or {}
+    return [name for name in GAP_COUNTERS if counters.get(name, 0) > before.get(name, 0)]
+
+
+def _run_fetch(run_id: str, report: RunReport) -> None:
+    base = api_base()
+    deadline = RunDeadline.from_env()
+
+    fetch_headers = headers_secret("FETCH_RUN_SECRET", "x-fetch-run-secret")
+
+    # Get run config
+    run = _fetch_run_config(base, run_id, headers=fetch_headers)
+    if _is_cancelled_run(run):
+        logger.info("FetchRun already cancelled before start. exiting.")
+        sys.exit(0)
+
+    settings = _run_settings(run)
+    user_email = settings["user_email"]
+    search_terms = settings["search_terms"]
+    locations = settings["locations"]
+    multi_location = len(locations) > 1
+    # Query-plan stats are per (term, location set).
+    plan_location = " | ".join(locations)
+    hours_old = settings["hours_old"]
+    results_wanted = settings["results_wanted"]
+    filter_options = settings["filter_options"]
+    proxy_pool = _parse_csv_list(os.environ.get("FETCH_PROXY_POOL", ""))
+    if settings["incremental"] is not None:
+        incremental = settings["incremental"]
+        report.meta["incremental"] = incremental
+        logger.info(
+            "Incremental mode: previous_run=%s hours_old=%s->%s results_wanted=%s->%s",
+            incremental["previousSucceededAt"],
+            incremental["configuredHoursOld"],
+            hours_old,
+            incremental["configuredResultsWanted"],
+            results_wanted,
+        )
 
     # Mark running
-    requests.patch(
-        f"{base}/api/fetch-runs/{run_id}/update",
-        headers=fetch_headers,
-        data=json.dumps({"status": "RUNNING"}),
-        timeout=30,
-    ).raise_for_status()
+    _update_run(base, run_id, fetch_headers, {"status": "RUNNING"})
 
     t0 = time.time()
-    search_terms = _resolve_search_terms(title_query=title_query, queries=queries)
-    results_budget_by_term = _build_results_budget_by_term(search_terms, results_wanted)
+    planner = QueryPlanner.from_env(user_email)
+    plan = planner.plan(search_terms, plan_location, results_wanted)
+    results_budget_by_term = {**_build_results_budget_by_term(search_terms, results_wanted), **plan.budgets}
     logger.info(
-        "Search terms=%s results_budget_by_term=%s source_options=%s",
+        "Search terms=%s locations=%s results_budget_by_term=%s source_options=%s",
         len(search_terms),
+        locations,
         results_budget_by_term,
         {
             "proxyPoolSize": len(proxy_pool),
         },
     )
-    df = fetch_linkedin(
-        search_terms,
-        location,
-        hours_old,
-        results_wanted,
-        results_budget_by_term=results_budget_by_term,
-        fetch_description=True,
-        proxy_pool=proxy_pool,
-    )
+    near_duplicate_threshold = _resolve_near_duplicate_threshold()
+    spill_dir = _resolve_spill_dir()
+    spill = None
+    if spill_dir is not None:
+        from spill_store import SpillStore  # type: ignore
+
+        spill = SpillStore(spill_dir / run_id)
+        logger.info("Spill mode: dir=%s format=%s", spill.root, spill.fmt)
+
+    two_phase = _resolve_two_phase()
+    scrape_cache = ScrapeCache.from_env()
+    checkpoint = RunCheckpoint.from_env(run_id)
+
+    enrich: Optional[Callable[..., pd.DataFrame]] = None
+    if two_phase:
+        logger.info("Two-phase mode: listings first, descriptions for surviving rows only")
+        # Checkpointed descriptions keep a resumed run's filtered rows the
+        # same as the first attempt's.
+        detail_fetch = None
+        if checkpoint is not None:
+            detail_fetch = checkpoint.cached_fetch(
+                partial(_fetch_description_for_url, proxy_pool=proxy_pool, deadline=deadline, report=report)
+            )
 
-    if df.empty:
-        items: List[Dict[str, Any]] = []
+        def enrich(frame: pd.DataFrame, seen_keys: Optional[Set[str]] = None) -> pd.DataFrame:
+            return _enrich_listings(
+                frame, filter_options, proxy_pool, deadline, report, seen_keys=seen_keys, fetch_fn=detail_fetch
+            )
+
+    known_urls = KnownJobs.from_env(user_email)
+    if known_urls.loaded:
+        logger.info("Known jobs loaded: urls=%s path=%s", known_urls.loaded, known_urls.path)
+    collected: List[pd.DataFrame] = []
+
+    def keep_frame(term: str, frame: pd.DataFrame) -> None:
+        planner.observe(term, _canonical_job_urls(frame).tolist())
+        if spill is not None:
+            spill.write(term, frame)
+        else:
+            collected.append(frame)
+
+    def on_term_frame(term: str, frame: pd.DataFrame) -> None:
+        checkpoint.save_term(source_term_key(_frame_source(frame), term, _frame_location(frame)), frame)
+        keep_frame(term, frame)
+
+    sources = resolve_sources(settings["market"])
+    completed: Set[str] = set()
+    if checkpoint is not None and checkpoint.resumed:
+        completed = set(checkpoint.completed_terms)
+        for key, frame in checkpoint.load_terms():
+            term = str(frame["source_query"].iloc[0]) if "source_query" in frame.columns and len(frame) else key
+            keep_frame(term, frame)
+        logger.info(
+            "Resuming from checkpoint %s: completed_terms=%s pending_terms=%s imported_urls=%s",
+            checkpoint.dir,
+            len(completed),
+            sum(
+                source_term_key(site, term, location if multi_location else "") not in completed
+                for site in sources
+                for term, location in _search_units(plan.order, locations)
+            ),
+            len(checkpoint.imported_urls),
+        )
+
+    sink = on_term_frame if checkpoint is not None else keep_frame
+    with report.stage("fetch"):
+        df = fetch_sources(
+            sources,
+            plan.order,
+            locations,
+            hours_old,
+            results_wanted,
+            results_budget_by_term=results_budget_by_term,
+            fetch_description=not two_phase,
+            proxy_pool=proxy_pool,
+            on_frame=sink,
+            deadline=deadline,
+            known_urls=known_urls,
+            report=report,
+            cache=scrape_cache,
+            skip_keys=completed,
+        )
+    if spill is None:
+        df = _combine_term_frames(collected)
+        collected.clear()
+    planner.finish(plan_location, known_before=known_urls.known_before_run)
+
+    items: Iterable[Dict[str, Any]]
+    if spill is not None:
+        logger.info("Fetched %s rows before filtering (spilled to %s chunks)", spill.rows_written, len(spill))
+        items = _iter_spilled_items(spill, filter_options, near_duplicate_threshold, report=report, enrich=enrich)
+    elif df.empty:
+        items = []
     else:
         logger.info("Fetched %s rows before filtering", len(df))
-        df = filter_title(
-            df,
-            search_terms,
-            enforce_include=include_from_queries,
-            exclude_terms=exclude_title_terms if apply_excludes else None,
-        )
-        logger.info("Rows after title filter: %s", len(df))
-        df = keep_columns(df)
-        # Clean before description exclusion for more consistent matching
-        df = clean_description(df)
-        if filter_desc:
-            # v2 matcher — layered regex + weighted scoring with audit trail.
-            # Import errors surface loudly; a silent fallback to the retired
-            # legacy regex would downgrade filter quality without warning.
-            if active_rights_rules:
-                from rights_filter import filter_description_v2  # type: ignore
-
-                df, audit_df = filter_description_v2(
-                    df,
-                    rules=active_rights_rules,
-                    region=identity_region,
-                    strictness=identity_strictness,
-                )
-                if not audit_df.empty:
-                    audit_summary = (
-                        audit_df.groupby("rule")["score"].count().to_dict()
-                        if "rule" in audit_df.columns
-                        else {}
-                    )
-                    logger.info(
-                        "filter_description_v2 dropped=%s region=%s strictness=%s by_rule=%s",
-                        len(audit_df),
-                        identity_region,
-                        identity_strictness,
-                        audit_summary,
-                    )
-            if active_experience_rules:
-                df, experience_audit_df = filter_experience_requirements(
-                    df,
-                    rules=active_experience_rules,
-                )
-                if not experience_audit_df.empty:
-                    experience_summary = (
-                        experience_audit_df.groupby("rule")["score"].count().to_dict()
-                        if "rule" in experience_audit_df.columns
-                        else {}
-                    )
-                    logger.info(
-                        "filter_experience_requirements dropped=%s by_rule=%s",
-                        len(experience_audit_df),
-                        experience_summary,
-                    )
-            logger.info("Rows after description filter: %s", len(df))
-        df = dedupe_jobs(df)
+        if enrich is not None:
+            df = enrich(df)
+        df = _filter_jobs_frame(df, **filter_options, report=report)
+        df = _dedupe_frame(df, near_duplicate_threshold, report)
         items = df.to_dict(orient="records")
 
     # Import into DB via Vercel API (chunked to avoid payload/time limits)
-    imported = 0
-    if items:
-        _abort_if_cancelled(base, run_id, headers=fetch_headers, stage="before_import")
-        batch_size = 50
-        for i in range(0, len(items), batch_size):
-            _abort_if_cancelled(base, run_id, headers=fetch_headers, stage=f"before_import_batch_{i}")
-            batch = items[i : i + batch_size]
-            imp_res = None
-            for attempt in range(IMPORT_RETRIES + 1):
-                imp_res = requests.post(
-                    f"{base}/api/admin/import",
-                    headers=headers_secret("IMPORT_SECRET", "x-import-secret"),
-                    data=json.dumps({"userEmail": user_email, "items": batch}),
-                    timeout=120,
-                )
-                if imp_res.ok:
-                    break
-                if attempt >= IMPORT_RETRIES:
-                    raise RuntimeError(
-                        f"import failed status={imp_res.status_code} body={imp_res.text}"
-                    )
-                time.sleep(2 * (attempt + 1))
-            imported += int(imp_res.json().get("imported", 0))
+    imported = (checkpoint.imported_count if checkpoint is not None else 0) + _import_items(
+        base,
+        run_id,
+        fetch_headers,
+        user_email,
+        items,
+        skip_urls=checkpoint.imported_urls if checkpoint is not None else None,
+        on_batch=checkpoint.mark_imported if checkpoint is not None else None,
+        report=report,
+    )
+    if spill is not None:
+        spill.cleanup()
 
     # Update run
     _abort_if_cancelled(base, run_id, headers=fetch_headers, stage="before_succeeded_update")
-    requests.patch(
-        f"{base}/api/fetch-runs/{run_id}/update",
-        headers=fetch_headers,
-        data=json.dumps({"status": "SUCCEEDED", "importedCount": imported, "error": None}),
-        timeout=30,
-    ).raise_for_status()
+    partial_reasons = deadline.partial_reasons + _scrape_gaps(report.counters)
+    report.meta.update({"imported": imported, "partialReasons": partial_reasons, "sleep": sleeper.summary()})
+    update = {
+        "status": "SUCCEEDED",
+        "importedCount": imported,
+        "error": None,
+        "partial": bool(partial_reasons),
+        "partialReasons": partial_reasons,
+    }
+    if report_in_update():
+        update["report"] = report.to_dict()
+    _update_run(base, run_id, fetch_headers, update)
+
+    if checkpoint is not None:
+        checkpoint.clear()
+    # Only after SUCCEEDED: a failed run must not teach the next one to stop early.
+    known_urls.save()
+    planner.save()
+    if scrape_cache is not None:
+        scrape_cache.prune()
+
+    sleep_summary = sleeper.summary()
+    logger.info(
+        "Done. imported=%s elapsed=%.1fs slept=%.1fs sleep_by_reason=%s partial=%s",
+        imported,
+        time.time() - t0,
+        sleep_summary["totalSec"],
+        sleep_summary["byReason"],
+        deadline.partial_reasons or False,
+    )
 
-    logger.info("Done. imported=%s elapsed=%.1fs", imported, time.time() - t0)
 
+def _batch_key(value: Any) -> str:
+    return " ".join(str(value or "").lower().split())
 
-if __name__ == "__main__":
+
+def _run_batch(run_ids: List[str], report: RunReport) -> None:
+    # Several FetchRuns in one process. Runs are grouped by (market,
+    # locations, hours_old); each unique term in a group is scraped once, with the
+    # largest budget any run asked for, and each run then takes its own
+    # budget's worth of every shared frame through its own filters and
+    # import. Runs succeed, fail or get cancelled independently, and each
+    # gets a report of its own stages; the shared scrape stays in `report`.
+    # Paged early stop uses the URLs every run of a group already had
+    # (KnownJobs.common). Checkpoints, spill mode and the query planner are
+    # single-run features and are not used here.
+    base = api_base()
+    deadline = RunDeadline.from_env()
+    fetch_headers = headers_secret("FETCH_RUN_SECRET", "x-fetch-run-secret")
+    proxy_pool = _parse_csv_list(os.environ.get("FETCH_PROXY_POOL", ""))
+    near_duplicate_threshold = _resolve_near_duplicate_threshold()
+    two_phase = _resolve_two_phase()
+    scrape_cache = ScrapeCache.from_env()
+    t0 = time.time()
+
+    runs: Dict[str, Dict[str, Any]] = {}
+    for run_id in run_ids:
+        run = _fetch_run_config(base, run_id, headers=fetch_headers)
+        if _is_cancelled_run(run):
+            logger.info("FetchRun %s already cancelled before start. skipping.", run_id)
+            continue
+        runs[run_id] = _run_settings(run)
+    if not runs:
+        return
+    for run_id in runs:
+        _update_run(base, run_id, fetch_headers, {"status": "RUNNING"})
+
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    run_budgets: Dict[str, Dict[str, int]] = {}
+    for run_id, settings in runs.items():
+        group = groups.setdefault(
+            (
+                settings["market"],
+                tuple(_batch_key(location) for location in settings["locations"]),
+                settings["hours_old"],
+            ),
+            {
+                "sources": resolve_sources(settings["market"]),
+                "locations": settings["locations"],
+                "hours_old": settings["hours_old"],
+                "terms": {},
+                "budgets": {},
+                "runs": [],
+            },
+        )
+        group["runs"].append(run_id)
+        budgets = _build_results_budget_by_term(settings["search_terms"], settings["results_wanted"])
+        run_budgets[run_id] = {}
+        for term in settings["search_terms"]:
+            key = _batch_key(term)
+            group["terms"].setdefault(key, term)
+            budget = int(budgets.get(term, settings["results_wanted"]))
+            run_budgets[run_id][key] = budget
+            group["budgets"][key] = max(group["budgets"].get(key, 0), budget)
+    requested = sum(len(settings["search_terms"]) for settings in runs.values())
+    unique = sum(len(group["terms"]) for group in groups.values())
+    incremental_runs = sum(settings["incremental"] is not None for settings in runs.values())
+    logger.info(
+        "Batch mode: runs=%s groups=%s terms_requested=%s terms_scraped=%s incremental_runs=%s",
+        len(runs),
+        len(groups),
+        requested,
+        unique,
+        incremental_runs,
+    )
+    report.meta["batch"] = {
+        "runs": len(runs),
+        "groups": len(groups),
+        "termsRequested": requested,
+        "termsScraped": unique,
+        "incrementalRuns": incremental_runs,
+    }
+
+    # One KnownJobs per user, loaded before the scrape: two runs of the same
+    # user share it, so neither save drops the other's URLs.
+    known_by_user: Dict[str, KnownJobs] = {}
+    for settings in runs.values():
+        if settings["user_email"] not in known_by_user:
+            known_by_user[settings["user_email"]] = KnownJobs.from_env(settings["user_email"])
+
+    run_reports = {run_id: RunReport(run_id) for run_id in runs}
+    run_frames: Dict[str, pd.DataFrame] = {}
+    run_gaps: Dict[str, List[str]] = {}
     try:
-        main()
+        for group in groups.values():
+            frames: Dict[str, List[pd.DataFrame]] = {}
+            counters_before = dict(report.counters)
+            with report.stage("fetch", item=f"{'|'.join(group['locations'])}|{group['hours_old']}"):
+                fetch_sources(
+                    group["sources"],
+                    list(group["terms"].values()),
+                    group["locations"],
+                    group["hours_old"],
+                    max(group["budgets"].values()),
+                    results_budget_by_term={term: group["budgets"][key] for key, term in group["terms"].items()},
+                    fetch_description=not two_phase,
+                    proxy_pool=proxy_pool,
+                    on_frame=lambda term, frame: frames.setdefault(_batch_key(term), []).append(frame),
+                    deadline=deadline,
+                    known_urls=KnownJobs.common(known_by_user[runs[run_id]["user_email"]] for run_id in group["runs"]),
+                    report=report,
+                    cache=scrape_cache,
+                )
+            for run_id in group["runs"]:
+                settings = runs[run_id]
+                budgets = run_budgets[run_id]
+                # Each frame was scraped with the group's largest budget for
+                # its term; a run only keeps the rows its own budget covers.
+                df = _combine_term_frames(
+                    [frame.head(budget) for key, budget in budgets.items() for frame in frames.get(key, [])]
+                )
+                if two_phase and not df.empty:
+                    df = _filter_listings(df, settings["filter_options"], run_reports[run_id])
+                run_frames[run_id] = df
+            if two_phase:
+                # One detail fetch per URL, however many runs kept it.
+                survivors = _combine_term_frames([run_frames[run_id] for run_id in group["runs"]])
+                with report.stage("enrich", rows_in=len(survivors)) as stage:
+                    details = _enrich_descriptions_for_urls(
+                        survivors, proxy_pool=proxy_pool, deadline=deadline, report=report
+                    )
+                    stage.done(rows_out=len(details))
+                for run_id in group["runs"]:
+                    run_frames[run_id] = _merge_phase_details(run_frames[run_id], details)
+            group_gaps = _scrape_gaps(report.counters, before=counters_before)
+            for run_id in group["runs"]:
+                run_gaps[run_id] = group_gaps
     except Exception as e:
-        # Best effort: mark failed
+        for run_id in runs:
+            try:
+                _update_run(base, run_id, fetch_headers, {"status": "FAILED", "error": str(e)})
+            except Exception:
+                pass
+        raise
+
+    outcomes: Dict[str, Any] = {}
+    for run_id, settings in runs.items():
+        df = run_frames.pop(run_id)
+        run_report = run_reports[run_id]
         try:
-            rid = os.environ.get("RUN_ID", "").strip()
-            if rid:
-                requests.patch(
-                    f"{api_base()}/api/fetch-runs/{rid}/update",
-                    headers=headers_secret("FETCH_RUN_SECRET", "x-fetch-run-secret"),
-                    data=json.dumps({"status": "FAILED", "error": str(e)}),
-                    timeout=30,
-                )
+            scraped_urls = _canonical_job_urls(df).tolist()
+            items: Iterable[Dict[str, Any]] = []
+            if not df.empty:
+                df = _filter_jobs_frame(df, **settings["filter_options"], report=run_report)
+                df = _dedupe_frame(df, near_duplicate_threshold, run_report)
+                items = df.to_dict(orient="records")
+            imported = _import_items(base, run_id, fetch_headers, settings["user_email"], items, report=run_report)
+            _abort_if_cancelled(base, run_id, headers=fetch_headers, stage="before_succeeded_update")
+            partial_reasons = deadline.partial_reasons + run_gaps.get(run_id, [])
+            update = {
+                "status": "SUCCEEDED",
+                "importedCount": imported,
+                "error": None,
+                "partial": bool(partial_reasons),
+                "partialReasons": partial_reasons,
+            }
+            if report_in_update():
+                update["report"] = run_report.to_dict()
+            _update_run(base, run_id, fetch_headers, update)
+            # Only once the run succeeded: the set is shared with the
+            # user's other runs, which save it too.
+            known_urls = known_by_user[settings["user_email"]]
+            known_urls.add_many(scraped_urls)
+            known_urls.save()
+            outcomes[run_id] = imported
+        except RunCancelled:
+            outcomes[run_id] = "CANCELLED"
+        except Exception as e:
+            logger.error("Batch run %s failed: %s", run_id, e)
+            outcomes[run_id] = "FAILED"
+            try:
+                _update_run(base, run_id, fetch_headers, {"status": "FAILED", "error": str(e)})
+            except Exception:
+                pass
+
+    if scrape_cache is not None:
+        scrape_cache.prune()
+    report.meta.update(
+        {
+            "runs": outcomes,
+            "runReports": {run_id: run_report.to_dict() for run_id, run_report in run_reports.items()},
+            "partialReasons": deadline.partial_reasons,
+            "sleep": sleeper.summary(),
+        }
+    )
+    logger.info(
+        "Batch done. runs=%s elapsed=%.1fs partial=%s",
+        outcomes,
+        time.time() - t0,
+        deadline.partial_reasons or False,
+    )
+    if "FAILED" in outcomes.values():
+        # Failed runs are already marked; SystemExit skips the bottom-level
+        # handler, which would otherwise mark RUN_ID failed as well.
+        raise SystemExit(1)
+
+
+def _mark_runs_failed(run_ids: List[str], error: str) -> None:
+    # Best effort: the API may be what failed.
+    for rid in run_ids:
+        try:
+            http.patch(
+                f"{api_base()}/api/fetch-runs/{rid}/update",
+                headers=headers_secret("FETCH_RUN_SECRET", "x-fetch-run-secret"),
+                data=json.dumps({"status": "FAILED", "error": error}),
+                timeout=30,
+            )
         except Exception:
             pass
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        rid = os.environ.get("RUN_ID", "").strip()
+        if rid:
+            _mark_runs_failed([rid], str(e))
         raise
@@ -0,0 +1,132 @@
+"""
+RunReport — per-stage timings and counters for one FetchRun.
+
+main() wraps every stage in `report.stage(name)`; the yielded StageTimer
+takes rows in/out and byte counts, and the duration is recorded on exit
+(also when the stage raises). Stages that run more than once — one scrape
+per term, one filter pass per spill chunk, one POST per import batch —
+are aggregated under their name, and calls made with `item=` are also
+listed individually. Counters cover everything that is not a stage
+(retries, skipped batches, ...).
+
+The report is written as JSON to FETCH_RUN_REPORT_PATH (if set) and, with
+FETCH_RUN_REPORT_IN_UPDATE=1, sent as `report` in the final /update PATCH.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("jobspy_runner.report")
+
+REPORT_VERSION = 1
+
+
+class StageTimer:
+    def __init__(self, rows_in: Optional[int] = None) -> None:
+        self.rows_in = rows_in
+        self.rows_out: Optional[int] = None
+        self.bytes: Optional[int] = None
+        self.fields: Dict[str, Any] = {}
+
+    def done(self, rows_out: Optional[int] = None, nbytes: Optional[int] = None, **fields: Any) -> None:
+        if rows_out is not None:
+            self.rows_out = int(rows_out)
+        if nbytes is not None:
+            self.bytes = int(nbytes)
+        self.fields.update(fields)
+
+
+class RunReport:
+    def __init__(self, run_id: str = "", clock: Callable[[], float] = time.perf_counter) -> None:
+        self.run_id = run_id
+        self._clock = clock
+        self._start = clock()
+        self._lock = threading.Lock()
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, float] = {}
+        self.meta: Dict[str, Any] = {}
+
+    # ── Recording ───────────────────────────────────────────────────────
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None, item: Optional[str] = None) -> Iterator[StageTimer]:
+        timer = StageTimer(rows_in)
+        start = self._clock()
+        error: Optional[str] = None
+        try:
+            yield timer
+        except BaseException as err:
+            error = type(err).__name__
+            raise
+        finally:
+            self._record(name, item, self._clock() - start, timer, error)
+
+    def _record(self, name: str, item: Optional[str], seconds: float, timer: StageTimer, error: Optional[str]) -> None:
+        with self._lock:
+            agg = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0})
+            agg["calls"] += 1
+            agg["seconds"] = round(agg["seconds"] + seconds, 4)
+            for key, value in (("rowsIn", timer.rows_in), ("rowsOut", timer.rows_out), ("bytes", timer.bytes)):
+                if value is not None:
+                    agg[key] = agg.get(key, 0) + value
+            if error:
+                agg["errors"] = agg.get("errors", 0) + 1
+            if item is not None:
+                entry: Dict[str, Any] = {"item": item, "seconds": round(seconds, 4)}
+                for key, value in (("rowsIn", timer.rows_in), ("rowsOut", timer.rows_out), ("bytes", timer.bytes)):
+                    if value is not None:
+                        entry[key] = value
+                entry.update(timer.fields)
+                if error:
+                    entry["error"] = error
+                items: List[Dict[str, Any]] = agg.setdefault("items", [])
+                items.append(entry)
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    # ── Output ──────────────────────────────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "version": REPORT_VERSION,
+                "runId": self.run_id,
+                "elapsedSec": round(self._clock() - self._start, 3),
+                "stages": copy.deepcopy(self.stages),
+                "counters": dict(self.counters),
+                **self.meta,
+            }
+
+    def write(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8")
+        logger.info("Run report written to %s", path)
+
+
+def resolve_report_path() -> Optional[Path]:
+    raw = os.environ.get("FETCH_RUN_REPORT_PATH", "").strip()
+    return Path(raw) if raw else None
+
+
+def report_in_update() -> bool:
+    return os.environ.get("FETCH_RUN_REPORT_IN_UPDATE", "").strip().lower() in ("1", "true", "yes")
+
+
+def frame_bytes(df: Any) -> int:
+    # Deep size including Python string payloads; only called once per stage.
+    try:
+        return int(df.memory_usage(deep=True).sum())
+    except Exception:
+        return 0
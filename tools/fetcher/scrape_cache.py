@@ -0,0 +1,243 @@
+"""
+ScrapeCache — TTL-bounded scrape results shared between FetchRuns.
+
+Many runs search the same terms in the same location over the same
+`hours_old` window, and each one used to call scrape_jobs from scratch.
+_fetch_single_linkedin_term now asks the cache first and fills it after
+a successful scrape. Entries are keyed by (normalized term, normalized
+location, hours_old) and hold the rows scraped from offset 0:
+
+  - a request for [offset, offset + n) is served only when the entry
+    already holds rows up to offset + n; anything past them is a miss
+  - a page scraped at exactly the entry's end extends it, so paged fetch
+    fills one entry page by page; other writes at offset > 0 are ignored
+  - entries scraped without descriptions do not serve requests that need
+    them; entries with descriptions serve both
+  - an entry expires `ttl_sec` after its first page was scraped, so a
+    cached listing is never much older than a fresh one would be
+
+Empty results are not cached: jobspy returns an empty frame when LinkedIn
+blocks it, and that must not be handed to every other run in the window.
+A short frame is not taken as the end of the listing either: jobspy also
+returns the rows it already has when a 429 stops it partway, and the two
+cases look the same from here. A run that wants more than the entry holds
+scrapes again.
+
+Storage goes through a small backend protocol (get/put/delete/keys on
+bytes). LocalDirBackend keeps one pickle per key under
+FETCH_SCRAPE_CACHE_DIR; MemoryBackend is the in-process stand-in used in
+tests. A shared store (object storage, Redis, ...) only needs the same
+four methods.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Protocol
+from urllib.parse import quote, unquote
+
+import pandas as pd
+
+logger = logging.getLogger("jobspy_runner.scrape_cache")
+
+# 2: entries no longer carry an `exhausted` flag; `covered` is rows held.
+ENTRY_VERSION = 2
+DEFAULT_TTL_SEC = 3600.0
+
+
+def _normalize(value: str) -> str:
+    return " ".join(str(value or "").lower().split())
+
+
+def cache_key(term: str, location: str, hours_old: int) -> str:
+    return f"v{ENTRY_VERSION}|{_normalize(term)}|{_normalize(location)}|{int(hours_old)}"
+
+
+# ── Backends ────────────────────────────────────────────────────────────
+
+
+class ScrapeCacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def put(self, key: str, data: bytes) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def keys(self) -> Iterable[str]: ...
+
+
+class MemoryBackend:
+    def __init__(self) -> None:
+        self._data: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            return self._data.get(key)
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._data[key] = data
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def keys(self) -> Iterable[str]:
+        with self._lock:
+            return list(self._data)
+
+
+class LocalDirBackend:
+    """One `<quoted key>.pkl` file per entry (reversible, so `keys()` works)."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{quote(key, safe='')}.pkl"
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        # Unique tmp name: two runs may fill the same key at once.
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def keys(self) -> Iterable[str]:
+        return [unquote(path.stem) for path in self.root.glob("*.pkl")]
+
+
+# ── Cache ───────────────────────────────────────────────────────────────
+
+
+class ScrapeCache:
+    def __init__(
+        self,
+        backend: ScrapeCacheBackend,
+        ttl_sec: float = DEFAULT_TTL_SEC,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend = backend
+        self.ttl_sec = max(0.0, ttl_sec)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["ScrapeCache"]:
+        raw_dir = os.environ.get("FETCH_SCRAPE_CACHE_DIR", "").strip()
+        if not raw_dir:
+            return None
+        raw_ttl = os.environ.get("FETCH_SCRAPE_CACHE_TTL_SEC", "").strip()
+        try:
+            ttl_sec = float(raw_ttl) if raw_ttl else DEFAULT_TTL_SEC
+        except ValueError:
+            ttl_sec = DEFAULT_TTL_SEC
+        return cls(LocalDirBackend(Path(raw_dir)), ttl_sec=ttl_sec)
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self.backend.get(key)
+        if data is None:
+            return None
+        try:
+            entry = pickle.loads(data)
+        except Exception:
+            self.backend.delete(key)  # torn or incompatible entry
+            return None
+        if entry.get("version") != ENTRY_VERSION or self._clock() - entry["stamp"] > self.ttl_sec:
+            return None
+        return entry
+
+    def get(
+        self,
+        term: str,
+        location: str,
+        hours_old: int,
+        offset: int,
+        count: int,
+        with_descriptions: bool,
+    ) -> Optional[pd.DataFrame]:
+        entry = self._load(cache_key(term, location, hours_old))
+        end = offset + count
+        if (
+            entry is None
+            or (with_descriptions and not entry["withDescriptions"])
+            or end > entry["covered"]
+        ):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry["frame"].iloc[offset:end].reset_index(drop=True)
+
+    def put(
+        self,
+        term: str,
+        location: str,
+        hours_old: int,
+        offset: int,
+        count: int,
+        with_descriptions: bool,
+        df: Optional[pd.DataFrame],
+    ) -> None:
+        if df is None or df.empty:
+            return
+        key = cache_key(term, location, hours_old)
+        frame = df.reset_index(drop=True)
+        stamp = self._clock()
+        if offset:
+            entry = self._load(key)
+            if entry is None or entry["covered"] != offset:
+                return
+            frame = pd.concat([entry["frame"], frame], ignore_index=True, sort=False)
+            with_descriptions = with_descriptions and entry["withDescriptions"]
+            stamp = entry["stamp"]
+        entry = {
+            "version": ENTRY_VERSION,
+            "key": key,
+            "stamp": stamp,
+            "covered": len(frame),
+            "withDescriptions": bool(with_descriptions),
+            "frame": frame,
+        }
+        self.backend.put(key, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        with self._lock:
+            self.writes += 1
+
+    def prune(self) -> int:
+        """Delete expired and unreadable entries; returns the number removed."""
+        removed = 0
+        for key in list(self.backend.keys()):
+            data = self.backend.get(key)
+            try:
+                stale = data is None or self._clock() - pickle.loads(data)["stamp"] > self.ttl_sec
+            except Exception:
+                stale = True
+            if stale:
+                self.backend.delete(key)
+                removed += 1
+        if removed:
+            logger.info("Pruned scrape cache entries=%s", removed)
+        return removed
@@ -0,0 +1,228 @@
+"""
+Per-site scrape policy for run_jobspy.fetch_sources.
+
+fetch_linkedin only ever scraped LinkedIn, although jobspy's scrape_jobs
+also covers Indeed, Glassdoor, Google and others, and cn_fetcher reads
+BOSS直聘 listings off search results (`zhipin`). FETCH_SOURCES lists the
+boards a run scrapes (default `linkedin`). Boards tied to one market
+(SOURCE_MARKETS) are dropped for runs of any other market. `zhipin` only
+applies to CN runs, and the production CN flow does not come here at all:
+the trigger route runs CN FetchRuns in-process (processCnFetchRun). So
+`zhipin` only runs for a CN run sent to this worker explicitly.
+fetch_sources runs each board on
+its own thread so extra boards add coverage without adding their
+wall-clock time to LinkedIn's. Boards differ in how hard they throttle,
+so each gets its own:
+
+  workers           concurrent terms for that board
+  min_interval_sec  minimum spacing between request starts (RateLimiter)
+  retries           extra attempts per term after a failure
+  backoff_sec       base of the exponential retry backoff
+
+Defaults live in DEFAULT_SITE_POLICIES and can be overridden per board
+with FETCH_SOURCE_<SITE>_WORKERS / _MIN_INTERVAL_SEC / _RETRIES /
+_BACKOFF_SEC. LinkedIn keeps its own adaptive controller, paging and
+scrape cache inside fetch_linkedin; its policy entry only matters for the
+report.
+
+SiteStats collects what each board cost and returned: wall time, time to
+first frame, per-term latency (retries and paging included), rows
+scraped and rows that survived the cross-site dedupe (its yield). Runs
+that search several locations keep one per location as well.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("jobspy_runner.sources")
+
+DEFAULT_SOURCES = ["linkedin"]
+# jobspy Site values that take a plain search_term + location.
+JOBSPY_SOURCES = ("linkedin", "indeed", "glassdoor", "google", "zip_recruiter")
+# Search-result sources served by cn_fetcher.
+SEARCH_SOURCES = ("zhipin",)
+SUPPORTED_SOURCES = JOBSPY_SOURCES + SEARCH_SOURCES
+# Boards that only make sense for one FetchRun market; the rest serve any.
+SOURCE_MARKETS: Dict[str, str] = {"zhipin": "CN"}
+
+
+@dataclass(frozen=True)
+class SitePolicy:
+    site: str
+    workers: int = 2
+    min_interval_sec: float = 1.0
+    retries: int = 2
+    backoff_sec: float = 5.0
+
+    @classmethod
+    def from_env(cls, site: str) -> "SitePolicy":
+        policy = DEFAULT_SITE_POLICIES.get(site) or cls(site)
+        prefix = f"FETCH_SOURCE_{site.upper()}_"
+        overrides: Dict[str, object] = {}
+        for field_name, env_name, parse in (
+            ("workers", "WORKERS", int),
+            ("min_interval_sec", "MIN_INTERVAL_SEC", float),
+            ("retries", "RETRIES", int),
+            ("backoff_sec", "BACKOFF_SEC", float),
+        ):
+            raw = os.environ.get(prefix + env_name, "").strip()
+            if not raw:
+                continue
+            try:
+                overrides[field_name] = parse(raw)
+            except ValueError:
+                continue
+        policy = replace(policy, **overrides)
+        return replace(
+            policy,
+            workers=max(1, policy.workers),
+            min_interval_sec=max(0.0, policy.min_interval_sec),
+            retries=max(0, policy.retries),
+            backoff_sec=max(0.0, policy.backoff_sec),
+        )
+
+
+DEFAULT_SITE_POLICIES: Dict[str, SitePolicy] = {
+    "linkedin": SitePolicy("linkedin", workers=2, min_interval_sec=0.0, retries=5, backoff_sec=15.0),
+    # Indeed pages 100 results per request and tolerates steady traffic.
+    "indeed": SitePolicy("indeed", workers=3, min_interval_sec=0.5, retries=2, backoff_sec=5.0),
+    # Glassdoor and ZipRecruiter block bursts quickly.
+    "glassdoor": SitePolicy("glassdoor", workers=1, min_interval_sec=2.0, retries=2, backoff_sec=10.0),
+    "zip_recruiter": SitePolicy("zip_recruiter", workers=1, min_interval_sec=2.0, retries=1, backoff_sec=10.0),
+    "google": SitePolicy("google", workers=2, min_interval_sec=1.0, retries=1, backoff_sec=5.0),
+    # Bing result pages for site:zhipin.com; challenges come fast on bursts.
+    "zhipin": SitePolicy("zhipin", workers=4, min_interval_sec=1.0, retries=1, backoff_sec=10.0),
+}
+
+
+def resolve_sources(market: str = "AU") -> List[str]:
+    """FETCH_SOURCES as a list of boards for a `market` run, LinkedIn when unset."""
+    raw = os.environ.get("FETCH_SOURCES", "")
+    market = (market or "AU").strip().upper()
+    sources: List[str] = []
+    for part in raw.split(","):
+        site = part.strip().lower()
+        if not site or site in sources:
+            continue
+        if site not in SUPPORTED_SOURCES:
+            logger.warning("Ignoring unsupported source=%s", site)
+            continue
+        if SOURCE_MARKETS.get(site, market) != market:
+            logger.info("Skipping source=%s for market=%s run", site, market)
+            continue
+        sources.append(site)
+    return sources or list(DEFAULT_SOURCES)
+
+
+def source_term_key(site: str, term: str, location: str = "") -> str:
+    """Checkpoint key for one (board, term[, location]) frame.
+
+    LinkedIn keeps the bare term; `location` is only passed by runs that
+    search several locations.
+    """
+    key = term if site == "linkedin" else f"{site}:{term}"
+    return f"{key}@{location}" if location else key
+
+
+# ── Rate limiting ───────────────────────────────────────────────────────
+
+
+class RateLimiter:
+    """Spaces request starts at least `min_interval_sec` apart across threads.
+
+    Each caller reserves the next free start time under the lock and sleeps
+    outside it, so waiting threads queue up in order without holding the
+    lock.
+    """
+
+    def __init__(
+        self,
+        min_interval_sec: float,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_interval_sec = max(0.0, min_interval_sec)
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+        self.waited_sec = 0.0
+
+    def acquire(self) -> float:
+        if self.min_interval_sec <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_at)
+            self._next_at = start + self.min_interval_sec
+            wait = start - now
+            self.waited_sec += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+# ── Reporting ───────────────────────────────────────────────────────────
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class SiteStats:
+    def __init__(self, site: str, clock: Callable[[], float] = time.monotonic) -> None:
+        self.site = site
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.first_frame_at: Optional[float] = None
+        self.latencies: List[float] = []
+        self.frames = 0
+        self.rows = 0
+        self.kept_rows = 0
+        self.failed_terms = 0
+
+    def start(self) -> None:
+        self.started_at = self._clock()
+
+    def finish(self) -> None:
+        self.finished_at = self._clock()
+
+    def record_term(self, seconds: float) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+
+    def record_frame(self, rows: int, kept_rows: int) -> None:
+        with self._lock:
+            if self.first_frame_at is None:
+                self.first_frame_at = self._clock()
+            self.frames += 1
+            self.rows += rows
+            self.kept_rows += kept_rows
+
+    def summary(self) -> Dict[str, object]:
+        start = self.started_at or 0.0
+        end = self.finished_at if self.finished_at is not None else self._clock()
+        return {
+            "elapsedSec": round(end - start, 3) if self.started_at is not None else 0.0,
+            "firstFrameSec": round(self.first_frame_at - start, 3) if self.first_frame_at is not None else None,
+            "terms": len(self.latencies),
+            "termP50Sec": round(_percentile(self.latencies, 0.5), 3),
+            "termP95Sec": round(_percentile(self.latencies, 0.95), 3),
+            "frames": self.frames,
+            "rows": self.rows,
+            "keptRows": self.kept_rows,
+            "yield": round(self.kept_rows / self.rows, 3) if self.rows else 0.0,
+            "failedTerms": self.failed_terms,
+        }
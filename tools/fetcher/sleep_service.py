@@ -0,0 +1,81 @@
+"""
+SleepService — the one place run_jobspy sleeps, with accounting.
+
+Scrape retries, detail-page retries, re-queued term backoff and import
+retries all call `sleep(seconds, reason, host)` instead of time.sleep, so
+a run can say how much of its wall clock went to waiting and on whom
+(`summary()` feeds the run report and the final log line).
+
+Both the sleep function and the clock are injectable. Tests pass a
+VirtualClock, whose `sleep` advances its own time instead of blocking,
+so backoff-heavy paths run instantly and deterministically.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class VirtualClock:
+    """Deterministic clock for tests: `sleep` advances `now` immediately."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += max(0.0, seconds)
+
+
+class SleepService:
+    def __init__(
+        self,
+        sleep_fn: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sleep_fn = sleep_fn
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def virtual(cls, clock: Optional[VirtualClock] = None) -> "SleepService":
+        clock = clock or VirtualClock()
+        return cls(sleep_fn=clock.sleep, clock=clock)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.total_sec = 0.0
+            self.calls = 0
+            self.by_reason: Dict[str, float] = {}
+            self.by_host: Dict[str, float] = {}
+
+    def sleep(self, seconds: float, reason: str, host: Optional[str] = None) -> float:
+        """Sleep `seconds` and record the time actually slept."""
+        if seconds <= 0:
+            return 0.0
+        start = self.clock()
+        self._sleep_fn(seconds)
+        slept = max(0.0, self.clock() - start)
+        with self._lock:
+            self.total_sec += slept
+            self.calls += 1
+            self.by_reason[reason] = self.by_reason.get(reason, 0.0) + slept
+            key = host or "-"
+            self.by_host[key] = self.by_host.get(key, 0.0) + slept
+        return slept
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "totalSec": round(self.total_sec, 3),
+                "calls": self.calls,
+                "byReason": {k: round(v, 3) for k, v in sorted(self.by_reason.items())},
+                "byHost": {k: round(v, 3) for k, v in sorted(self.by_host.items())},
+            }
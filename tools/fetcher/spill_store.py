@@ -0,0 +1,110 @@
+"""
+SpillStore — on-disk staging for per-term scrape results.
+
+Large fetches (resultsWanted up to 10k per term, several terms, full
+descriptions) used to be concatenated in memory before filtering. In
+spill mode run_jobspy.fetch_linkedin hands every term's frame to
+`SpillStore.write`, which splits it into `chunk_rows`-sized files, and
+main() filters/dedupes/imports chunk by chunk via `iter_frames`, so peak
+memory is bounded by one term's scrape plus one chunk.
+
+Chunks are Parquet when pyarrow is installed and pickle otherwise; the
+reader dispatches on the file suffix so both can coexist in one store.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import shutil
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger("jobspy_runner.spill")
+
+DEFAULT_CHUNK_ROWS = 1000
+
+try:  # pragma: no cover - depends on the runner image
+    import pyarrow  # noqa: F401
+
+    _DEFAULT_FORMAT = "parquet"
+except ImportError:  # pragma: no cover
+    _DEFAULT_FORMAT = "pickle"
+
+_SUFFIXES = {"parquet": ".parquet", "pickle": ".pkl"}
+
+
+class SpillStore:
+    def __init__(
+        self,
+        root: Path,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+        fmt: Optional[str] = None,
+    ) -> None:
+        fmt = fmt or _DEFAULT_FORMAT
+        if fmt not in _SUFFIXES:
+            raise ValueError(f"fmt must be one of {tuple(_SUFFIXES)}, got {fmt!r}")
+        self.root = Path(root)
+        self.chunk_rows = max(1, int(chunk_rows))
+        self.fmt = fmt
+        self.rows_written = 0
+        self.terms_written = 0
+        self._paths: List[Path] = []
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @property
+    def paths(self) -> List[Path]:
+        return list(self._paths)
+
+    # ── Writing ─────────────────────────────────────────────────────────
+
+    def write(self, term: str, df: pd.DataFrame) -> None:
+        if df is None or df.empty:
+            return
+        term_index = self.terms_written
+        for part, start in enumerate(range(0, len(df), self.chunk_rows)):
+            chunk = df.iloc[start : start + self.chunk_rows]
+            path = self.root / f"term-{term_index:03d}-part-{part:04d}"
+            self._paths.append(self._write_chunk(chunk, path))
+        self.rows_written += len(df)
+        self.terms_written += 1
+        logger.info(
+            "Spilled term=%s rows=%s chunks=%s format=%s",
+            term,
+            len(df),
+            math.ceil(len(df) / self.chunk_rows),
+            self.fmt,
+        )
+
+    def _write_chunk(self, chunk: pd.DataFrame, stem: Path) -> Path:
+        if self.fmt == "parquet":
+            path = stem.with_suffix(_SUFFIXES["parquet"])
+            try:
+                chunk.to_parquet(path, index=False)
+                return path
+            except Exception as err:
+                # Mixed-type jobspy columns (e.g. emails as list|None) can
+                # trip Arrow's type inference; pickle takes anything.
+                logger.warning("Parquet spill failed for %s, using pickle: %s", path.name, err)
+        path = stem.with_suffix(_SUFFIXES["pickle"])
+        chunk.reset_index(drop=True).to_pickle(path)
+        return path
+
+    # ── Reading ─────────────────────────────────────────────────────────
+
+    def iter_frames(self) -> Iterator[pd.DataFrame]:
+        for path in self._paths:
+            if path.suffix == _SUFFIXES["parquet"]:
+                yield pd.read_parquet(path)
+            else:
+                yield pd.read_pickle(path)
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._paths = []
+
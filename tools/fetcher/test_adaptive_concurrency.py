@@ -0,0 +1,92 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(__file__))
+
+from adaptive_concurrency import AdaptiveConcurrency  # noqa: E402
+
+
+class Throttled(Exception):
+    pass
+
+
+def _controller(**kwargs):
+    kwargs.setdefault("is_congestion", lambda err: isinstance(err, Throttled))
+    return AdaptiveConcurrency(**kwargs)
+
+
+class AdaptiveConcurrencyTests(unittest.TestCase):
+    def test_congestion_halves_limit_and_clean_window_adds_one(self):
+        ctl = _controller(initial=4, max_limit=6)
+
+        with self.assertRaises(Throttled):
+            with ctl.slot():
+                raise Throttled()
+        self.assertEqual(ctl.limit, 2)
+
+        for _ in range(2):
+            with ctl.slot():
+                pass
+        self.assertEqual(ctl.limit, 3)
+        self.assertEqual((ctl.increases, ctl.decreases), (1, 1))
+
+    def test_limit_stays_within_bounds(self):
+        ctl = _controller(initial=2, max_limit=3)
+        for _ in range(20):
+            ctl.record(0.1, congested=False)
+        self.assertEqual(ctl.limit, 3)
+        for _ in range(5):
+            ctl.record(0.1, congested=True)
+        self.assertEqual(ctl.limit, 1)
+
+    def test_burst_of_congestion_from_same_epoch_counts_once(self):
+        ctl = _controller(initial=6, max_limit=6)
+        epoch = ctl._epoch
+        for _ in range(3):
+            ctl.record(0.1, congested=True, epoch=epoch)
+        self.assertEqual(ctl.limit, 3)
+
+    def test_non_congestion_errors_are_neutral(self):
+        ctl = _controller(initial=1, max_limit=4)
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                with ctl.slot():
+                    raise ValueError("parse error")
+        self.assertEqual(ctl.limit, 1)
+        self.assertEqual((ctl.increases, ctl.decreases), (0, 0))
+
+    def test_slow_response_counts_as_congestion_after_warmup(self):
+        ctl = _controller(initial=4, max_limit=4, latency_ratio=3.0)
+        for _ in range(6):
+            ctl.record(1.0, congested=False)
+        ctl.record(10.0, congested=False)
+        self.assertEqual(ctl.limit, 2)
+
+    def test_slot_blocks_beyond_limit(self):
+        ctl = _controller(initial=2, max_limit=2)
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work():
+            with ctl.slot():
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with lock:
+                    active.pop()
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(max(peak), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_filters import CorpusSpec, compare_to_baseline, generate_corpus, run_benchmark  # noqa: E402
+
+
+class CorpusTests(unittest.TestCase):
+    def test_same_seed_gives_same_corpus(self):
+        spec = CorpusSpec(count=20, chars=600)
+        self.assertEqual(generate_corpus(spec), generate_corpus(spec))
+        self.assertNotEqual(generate_corpus(spec), generate_corpus(CorpusSpec(count=20, chars=600, seed=8)))
+
+    def test_zero_density_corpus_is_never_dropped(self):
+        spec = CorpusSpec(
+            count=30,
+            chars=600,
+            anchor_density=0,
+            region_density=0,
+            negation_density=0,
+            year_density=0,
+        )
+        corpus = generate_corpus(spec)
+        self.assertEqual({item.lang for item in corpus}, {"en", "zh"})
+
+        cells = run_benchmark(corpus, ["AU"], ["strict"])
+
+        self.assertEqual(cells["AU/strict/en"]["dropped"], 0)
+        self.assertEqual(cells["experience/zh"]["dropped"], 0)
+
+    def test_dense_year_requirements_are_dropped_in_both_languages(self):
+        corpus = generate_corpus(CorpusSpec(count=40, chars=600, year_density=3))
+
+        cells = run_benchmark(corpus, ["GLOBAL"], ["balanced"])
+
+        self.assertGreater(cells["experience/en"]["dropped"], 0)
+        self.assertGreater(cells["experience/zh"]["dropped"], 0)
+
+
+class BaselineTests(unittest.TestCase):
+    def _result(self, rate, dropped=3, calibration=0.1):
+        return {
+            "corpus": {"count": 10},
+            "calibrationSec": calibration,
+            "cells": {"AU/balanced/en": {"descriptions": 10, "dropped": dropped, "descPerSec": rate}},
+        }
+
+    def test_flags_slowdown_beyond_tolerance_only(self):
+        baseline = self._result(1000.0)
+
+        self.assertEqual(compare_to_baseline(self._result(800.0), baseline, 0.25)["regressions"], [])
+        regressions = compare_to_baseline(self._result(700.0), baseline, 0.25)["regressions"]
+        self.assertEqual([r["cell"] for r in regressions], ["AU/balanced/en"])
+
+    def test_expected_rate_scales_with_calibration(self):
+        # Twice as slow on the calibration loop: 500 desc/s is on par.
+        baseline = self._result(1000.0, calibration=0.1)
+
+        comparison = compare_to_baseline(self._result(500.0, calibration=0.2), baseline, 0.25)
+
+        self.assertEqual(comparison["regressions"], [])
+
+    def test_reports_changed_drop_counts(self):
+        comparison = compare_to_baseline(self._result(1000.0, dropped=4), self._result(1000.0))
+
+        self.assertEqual(comparison["changedDrops"], [{"cell": "AU/balanced/en", "dropped": 4, "baseline": 3}])
+
+    def test_different_corpus_is_not_compared(self):
+        baseline = {**self._result(1000.0), "corpus": {"count": 20}}
+
+        self.assertEqual(compare_to_baseline(self._result(1.0), baseline)["regressions"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
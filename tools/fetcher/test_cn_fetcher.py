@@ -0,0 +1,182 @@
+import base64
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_cn import reference_parse, synthetic_page  # noqa: E402
+from cn_fetcher import (  # noqa: E402
+    CnSearchFetcher,
+    SearchResult,
+    _unwrap_bing_link,
+    parse_results,
+    results_to_rows,
+    split_zhipin_title,
+)
+
+DEBUG_PAGE = Path(__file__).parent / "bing_debug.html"
+
+
+def _block(url, title, snippet="薪资15-25K 3-5年 本科"):
+    return (
+        f'<li class="b_algo"><h2><a href="{url}" h="ID=SERP">{title}</a></h2>'
+        f'<div class="b_caption"><p class="b_lineclamp2">{snippet}</p></div></li>'
+    )
+
+
+def _page(count, prefix="job"):
+    blocks = "".join(
+        _block(f"https://www.zhipin.com/job_detail/{prefix}{i}.html", f"「工程师{i}招聘」_公司{i}招聘-BOSS直聘")
+        for i in range(count)
+    )
+    return f'<html><body><ol id="b_results">{blocks}</ol></body></html>'
+
+
+class _Response:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+
+class _Session:
+    """Serves pages by (term, first) and tracks how many requests overlap."""
+
+    def __init__(self, pages, delay=0.0):
+        self.pages = pages
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        term = params["q"].split(" ")[0]
+        page = (params["first"] - 1) // 10
+        with self._lock:
+            self.calls.append((term, page))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            return self.pages(term, page)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class ParseTests(unittest.TestCase):
+    def test_parses_blocks_and_unescapes_text(self):
+        html = _page(0).replace(
+            "</ol>",
+            _block("https://www.zhipin.com/job_detail/a1.html?ka=x&amp;y=1", "<strong>前端</strong>招聘_米哈游招聘-BOSS直聘", "5-10年 &amp; 本科")
+            + "</ol>",
+        )
+        page = parse_results(html)
+
+        self.assertFalse(page.blocked)
+        self.assertEqual(
+            page.results,
+            [SearchResult("https://www.zhipin.com/job_detail/a1.html?ka=x&y=1", "前端招聘_米哈游招聘-BOSS直聘", "5-10年 & 本科")],
+        )
+
+    def test_captured_page_is_a_challenge(self):
+        page = parse_results(DEBUG_PAGE.read_text(encoding="utf-8"))
+
+        self.assertTrue(page.blocked)
+        self.assertEqual(page.results, [])
+
+    def test_matches_reference_parser_on_synthetic_page(self):
+        html = synthetic_page(12, DEBUG_PAGE.read_text(encoding="utf-8"))
+        page = parse_results(html)
+
+        self.assertEqual(len(page.results), 12)
+        self.assertFalse(page.blocked)
+        self.assertEqual(page.results, reference_parse(html))
+
+    def test_unwraps_bing_click_links(self):
+        target = "https://www.zhipin.com/job_detail/xyz.html"
+        encoded = base64.urlsafe_b64encode(target.encode()).decode().rstrip("=")
+        self.assertEqual(_unwrap_bing_link(f"https://www.bing.com/ck/a?!&amp;&amp;p=abc&amp;u=a1{encoded}&amp;ntb=1"), target)
+        self.assertEqual(_unwrap_bing_link("https://example.com/x"), "https://example.com/x")
+
+    def test_splits_zhipin_titles(self):
+        self.assertEqual(split_zhipin_title("「全栈工程师招聘」_上海某某科技有限公司招聘-BOSS直聘"), ("全栈工程师", "上海某某科技有限公司"))
+        self.assertEqual(split_zhipin_title("Java开发工程师招聘_字节跳动招聘-BOSS直聘"), ("Java开发工程师", "字节跳动"))
+        self.assertEqual(split_zhipin_title("数据工程师 - BOSS直聘"), ("数据工程师", ""))
+
+    def test_rows_keep_only_job_pages(self):
+        rows = results_to_rows(
+            [
+                SearchResult("https://www.zhipin.com/job_detail/abc.html?ka=search", "「后端招聘」_某公司招聘-BOSS直聘", "3-5年"),
+                SearchResult("https://www.zhipin.com/gongsi/abc.html", "某公司怎么样", ""),
+            ],
+            "上海",
+        )
+        self.assertEqual(
+            rows,
+            [{"job_url": "https://www.zhipin.com/job_detail/abc.html", "title": "后端", "company": "某公司", "location": "上海", "description": "3-5年"}],
+        )
+
+
+class CnSearchFetcherTests(unittest.TestCase):
+    def test_runs_queries_concurrently_and_stops_at_short_pages(self):
+        # "a" has two full pages and a short third; "b" ends on its first page.
+        def pages(term, page):
+            count = {"a": [10, 10, 3], "b": [4]}[term]
+            return _Response(_page(count[page] if page < len(count) else 0, prefix=f"{term}{page}-"))
+
+        session = _Session(pages, delay=0.02)
+        fetcher = CnSearchFetcher(session=session, workers=4, max_pages=5, sleep=lambda _s: None)
+        out = dict(fetcher.fetch(["a", "b"], "上海", 50))
+
+        self.assertGreater(session.max_active, 1)
+        self.assertEqual(len(out["a"]), 23)
+        self.assertEqual(len(out["b"]), 4)
+        self.assertEqual(out["a"].iloc[0]["job_url"], "https://www.zhipin.com/job_detail/a0-0.html")
+        self.assertEqual(fetcher.requests, len(session.calls))
+        self.assertFalse(fetcher.blocked)
+
+    def test_challenge_stops_queries_not_yet_started(self):
+        challenge = DEBUG_PAGE.read_text(encoding="utf-8")
+
+        def pages(term, page):
+            return _Response(challenge if term == "t1" else _page(10, prefix=f"{term}{page}-"))
+
+        session = _Session(pages)
+        fetcher = CnSearchFetcher(session=session, workers=1, max_pages=1, sleep=lambda _s: None)
+        out = dict(fetcher.fetch(["t0", "t1", "t2", "t3"], "上海", 10))
+
+        self.assertTrue(fetcher.blocked)
+        self.assertEqual(list(out), ["t0"])
+        self.assertEqual([term for term, _ in session.calls], ["t0", "t1"])
+
+    def test_retries_http_errors_then_gives_up(self):
+        session = _Session(lambda term, page: _Response("", status_code=503))
+        slept = []
+        fetcher = CnSearchFetcher(session=session, workers=1, retries=2, backoff_sec=1.0, sleep=slept.append, max_pages=1)
+
+        self.assertEqual(list(fetcher.fetch(["t"], "", 10)), [])
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(slept, [1.0, 2.0])
+        self.assertEqual(fetcher.failed_pages, 1)
+
+    def test_failed_page_does_not_end_the_unit(self):
+        # Page 0 fails every attempt; the later pages are still fetched.
+        def pages(term, page):
+            return _Response("", status_code=503) if page == 0 else _Response(_page(10, prefix=f"{term}{page}-"))
+
+        session = _Session(pages)
+        fetcher = CnSearchFetcher(session=session, workers=1, retries=0, max_pages=3, sleep=lambda _s: None)
+        out = dict(fetcher.fetch(["t"], "上海", 30))
+
+        self.assertEqual(sorted(page for _, page in session.calls), [0, 1, 2])
+        self.assertEqual(len(out["t"]), 20)
+        self.assertEqual(fetcher.failed_pages, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
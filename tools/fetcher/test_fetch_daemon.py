@@ -0,0 +1,113 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.dirname(__file__))
+
+from fetch_daemon import DirRunQueue, FetchDaemon, apply_state_dir  # noqa: E402
+
+
+class DirRunQueueTests(unittest.TestCase):
+    def test_claims_oldest_first_up_to_limit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            queue = DirRunQueue(Path(tmp))
+            for i, run_id in enumerate(["run-b", "run-a", "run-c"]):
+                queue.enqueue(run_id)
+                os.utime(Path(tmp) / f"{run_id}.queued", (1000 + i, 1000 + i))
+
+            self.assertEqual(queue.claim(2), ["run-b", "run-a"])
+            self.assertEqual(queue.claim(2), ["run-c"])
+            self.assertEqual(queue.claim(2), [])
+
+            queue.done("run-a")
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ["run-b.claimed", "run-c.claimed"])
+
+
+class FetchDaemonTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = DirRunQueue(Path(self.tmp.name))
+        self.served = []
+        self.failed = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _daemon(self, runner, **kwargs):
+        def record(run_ids):
+            self.served.append(list(run_ids))
+            runner(run_ids)
+
+        return FetchDaemon(
+            self.queue,
+            poll_sec=0,
+            runner=record,
+            mark_failed=lambda ids, error: self.failed.append((list(ids), error)),
+            **kwargs,
+        )
+
+    def test_serves_queued_runs_as_one_batch(self):
+        self.queue.enqueue("run-1")
+        self.queue.enqueue("run-2")
+        daemon = self._daemon(lambda ids: None, max_batch=5)
+
+        self.assertEqual(daemon.run_once(), 2)
+        self.assertEqual(daemon.run_once(), 0)
+
+        self.assertEqual(sorted(self.served[0]), ["run-1", "run-2"])
+        self.assertEqual(list(Path(self.tmp.name).iterdir()), [])
+
+    def test_failure_marks_runs_failed_and_keeps_serving(self):
+        def runner(ids):
+            if ids == ["bad"]:
+                raise RuntimeError("config fetch failed")
+
+        self.queue.enqueue("bad")
+        daemon = self._daemon(runner, max_batch=1)
+        daemon.run_once()
+        self.queue.enqueue("good")
+        daemon.run_once()
+
+        self.assertEqual(self.failed, [(["bad"], "config fetch failed")])
+        self.assertEqual(self.served, [["bad"], ["good"]])
+        self.assertEqual((daemon.served, daemon.failed), (2, 1))
+
+    def test_cancelled_run_exit_is_not_a_failure(self):
+        def runner(ids):
+            raise SystemExit(0)
+
+        self.queue.enqueue("cancelled")
+        daemon = self._daemon(runner)
+
+        daemon.run_once()
+
+        self.assertEqual((self.failed, daemon.failed), ([], 0))
+
+    def test_serve_stops_after_max_runs(self):
+        for run_id in ("run-1", "run-2", "run-3"):
+            self.queue.enqueue(run_id)
+        daemon = self._daemon(lambda ids: None, max_batch=1)
+
+        daemon.serve(max_runs=2)
+
+        self.assertEqual(len(self.served), 2)
+
+
+class StateDirTests(unittest.TestCase):
+    def test_defaults_only_unset_state_dirs(self):
+        with mock.patch.dict(os.environ, {"FETCH_KNOWN_JOBS_DIR": "/custom/known"}, clear=False):
+            os.environ.pop("FETCH_SCRAPE_CACHE_DIR", None)
+            os.environ.pop("FETCH_QUERY_PLAN_DIR", None)
+
+            apply_state_dir("/var/lib/fetcher")
+
+            self.assertEqual(os.environ["FETCH_KNOWN_JOBS_DIR"], "/custom/known")
+            self.assertEqual(os.environ["FETCH_SCRAPE_CACHE_DIR"], str(Path("/var/lib/fetcher") / "scrape-cache"))
+            self.assertEqual(os.environ["FETCH_QUERY_PLAN_DIR"], str(Path("/var/lib/fetcher") / "query-plans"))
+
+
+if __name__ == "__main__":
+    unittest.main()
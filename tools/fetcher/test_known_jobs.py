@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.dirname(__file__))
+
+from known_jobs import KnownJobs  # noqa: E402
+
+
+class KnownJobsTests(unittest.TestCase):
+    def test_in_memory_set_tracks_added_urls(self):
+        known = KnownJobs()
+        known.add_many(["https://linkedin.com/jobs/view/1", "", "https://linkedin.com/jobs/view/2"])
+
+        self.assertIn("https://linkedin.com/jobs/view/1", known)
+        self.assertNotIn("", known)
+        self.assertEqual(len(known), 2)
+        known.save()  # no path: nothing to write
+
+    def test_save_round_trips_and_prunes_old_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "user.tsv"
+            known = KnownJobs(path, max_age_days=1)
+            known.add_many(["https://linkedin.com/jobs/view/old"], now=1_000_000)
+            known.add_many(["https://linkedin.com/jobs/view/new"], now=1_000_000 + 2 * 86400)
+            known.save(now=1_000_000 + 2 * 86400)
+
+            reloaded = KnownJobs(path, max_age_days=1)
+            self.assertEqual(reloaded.loaded, 1)
+            self.assertIn("https://linkedin.com/jobs/view/new", reloaded)
+            self.assertNotIn("https://linkedin.com/jobs/view/old", reloaded)
+
+    def test_from_env_uses_one_file_per_user(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.dict(os.environ, {"FETCH_KNOWN_JOBS_DIR": tmp}):
+                a = KnownJobs.from_env("A@example.com")
+                b = KnownJobs.from_env("a@example.com ")
+                c = KnownJobs.from_env("c@example.com")
+
+            self.assertEqual(a.path, b.path)
+            self.assertNotEqual(a.path, c.path)
+            self.assertEqual(a.path.parent, Path(tmp))
+
+    def test_common_keeps_urls_every_user_knew_before_the_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a, b = KnownJobs(Path(tmp) / "a.tsv"), KnownJobs(Path(tmp) / "b.tsv")
+            a.add_many(["https://linkedin.com/jobs/view/1", "https://linkedin.com/jobs/view/2"])
+            b.add_many(["https://linkedin.com/jobs/view/2"])
+            a.save()
+            b.save()
+
+            shared = KnownJobs.common([KnownJobs(a.path), KnownJobs(b.path)])
+
+        self.assertEqual(shared.loaded, 1)
+        self.assertTrue(shared.known_before_run("https://linkedin.com/jobs/view/2"))
+        self.assertFalse(shared.known_before_run("https://linkedin.com/jobs/view/1"))
+        self.assertIsNone(shared.path)
+        self.assertEqual(KnownJobs.common([]).loaded, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for the MinHash/LSH near-duplicate stage.
+
+Covers reposts under a new URL, cross-company isolation, the short-description
+guard that leaves exact URL dedupe in charge, and linear-ish scaling.
+"""
+
+import os
+import random
+import sys
+import time
+import unittest
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(__file__))
+
+from near_duplicates import NearDuplicateIndex, filter_near_duplicates  # noqa: E402
+
+BASE_JD = (
+    "We are looking for a Software Engineer to join our platform team in Sydney. "
+    "You will design, build and operate backend services in Python and Go, work closely "
+    "with product and design, own features end to end, and mentor other engineers. "
+    "Experience with AWS, Postgres, Kubernetes and CI/CD pipelines is highly valued."
+)
+
+
+def _row(job_url: str, title: str, company: str, description: str) -> dict:
+    return {"job_url": job_url, "title": title, "company": company, "description": description}
+
+
+def _vocab_description(rng: random.Random, words: int = 120) -> str:
+    vocab = [f"term{i}" for i in range(4000)]
+    return " ".join(rng.choice(vocab) for _ in range(words))
+
+
+class NearDuplicateFilterTests(unittest.TestCase):
+    def test_repost_with_new_linkedin_id_is_merged_and_recorded(self):
+        df = pd.DataFrame(
+            [
+                _row("https://linkedin.com/jobs/view/1", "Software Engineer", "Acme", BASE_JD),
+                _row("https://linkedin.com/jobs/view/2", "Software Engineer", "Acme", BASE_JD + " Apply now!"),
+                _row("https://linkedin.com/jobs/view/3", "Data Analyst", "Acme", _vocab_description(random.Random(7))),
+            ]
+        )
+
+        kept, audit = filter_near_duplicates(df)
+        self.assertEqual(
+            kept["job_url"].tolist(),
+            ["https://linkedin.com/jobs/view/1", "https://linkedin.com/jobs/view/3"],
+        )
+        self.assertEqual(audit["job_url"].tolist(), ["https://linkedin.com/jobs/view/2"])
+        self.assertEqual(audit["duplicate_of"].tolist(), ["https://linkedin.com/jobs/view/1"])
+        self.assertGreaterEqual(audit.iloc[0]["similarity"], 0.85)
+
+    def test_same_description_at_different_companies_is_kept(self):
+        df = pd.DataFrame(
+            [
+                _row("https://a.example/1", "Software Engineer", "Acme", BASE_JD),
+                _row("https://b.example/1", "Software Engineer", "Beta", BASE_JD),
+            ]
+        )
+
+        kept, audit = filter_near_duplicates(df)
+        self.assertEqual(len(kept), 2)
+        self.assertTrue(audit.empty)
+
+    def test_short_descriptions_are_left_to_exact_dedupe(self):
+        df = pd.DataFrame(
+            [
+                _row("https://example.com/jobs/100", "Frontend Engineer", "Acme", ""),
+                _row("https://example.com/jobs/200", "Frontend Engineer", "Acme", ""),
+            ]
+        )
+
+        kept, audit = filter_near_duplicates(df)
+        self.assertEqual(len(kept), 2)
+        self.assertTrue(audit.empty)
+
+    def test_index_rejects_invalid_band_layout(self):
+        with self.assertRaises(ValueError):
+            NearDuplicateIndex(num_perm=64, bands=10)
+
+    def test_distinct_descriptions_scale_without_false_merges(self):
+        rng = random.Random(42)
+        rows = [
+            {
+                "job_url": f"https://example.com/{i}",
+                "title": "Engineer",
+                "company": f"Co{i % 50}",
+                "description": _vocab_description(rng),
+            }
+            for i in range(2000)
+        ]
+        start = time.perf_counter()
+        kept, audit = filter_near_duplicates(pd.DataFrame(rows))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(kept), 2000)
+        self.assertTrue(audit.empty)
+        self.assertLess(elapsed, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(__file__))
+
+import process_scrape  # noqa: E402
+from process_scrape import ProcessScraper, decode_frame, encode_frame  # noqa: E402
+
+
+def _fake_scrape(search_term="", results_wanted=2, crash_flag=None, **_):
+    if crash_flag is not None and not os.path.exists(crash_flag):
+        # Dies once, like an OOM-killed worker.
+        open(crash_flag, "w").close()
+        os._exit(1)
+    if search_term == "blocked":
+        raise RuntimeError("429 Too Many Requests")
+    if search_term == "none":
+        return None
+    return pd.DataFrame(
+        {
+            "job_url": [f"https://example.com/{search_term}/{i}" for i in range(results_wanted)],
+            "title": [f"{search_term} {i}" for i in range(results_wanted)],
+            "skills": ["Python"] * results_wanted,
+        }
+    )
+
+
+class EncodingTests(unittest.TestCase):
+    def _round_trip(self, fmt):
+        df = pd.DataFrame({"title": ["Engineer", None], "is_remote": [True, False], "min_amount": [1.5, None]})
+        out = decode_frame(encode_frame(df.iloc[[1, 0]], fmt), fmt)
+        pd.testing.assert_frame_equal(out, df.iloc[[1, 0]].reset_index(drop=True), check_dtype=False)
+
+    def test_pickle_round_trip(self):
+        self._round_trip("pickle")
+
+    @unittest.skipIf(process_scrape.pa is None, "pyarrow not installed")
+    def test_arrow_round_trip(self):
+        self._round_trip("arrow")
+
+
+class ProcessScraperTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.scraper = ProcessScraper(2, target=_fake_scrape, columns={"job_url", "title"})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.shutdown()
+
+    def test_scrape_returns_projected_frame_and_counts_payload(self):
+        self.scraper.reset_stats()
+        df = self.scraper.scrape(search_term="dev", results_wanted=3)
+
+        self.assertEqual(list(df.columns), ["job_url", "title"])
+        self.assertEqual(df["title"].tolist(), ["dev 0", "dev 1", "dev 2"])
+        summary = self.scraper.summary()
+        self.assertEqual(summary["calls"], 1)
+        self.assertEqual(summary["workers"], 2)
+        self.assertGreater(self.scraper.payload_bytes, 0)
+
+    def test_none_result_becomes_empty_frame(self):
+        self.assertTrue(self.scraper.scrape(search_term="none").empty)
+
+    def test_worker_exception_reaches_caller(self):
+        with self.assertRaisesRegex(RuntimeError, "429"):
+            self.scraper.scrape(search_term="blocked")
+
+    def test_dead_worker_restarts_pool_and_retries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            flag = os.path.join(tmp, "crashed")
+            scraper = ProcessScraper(1, target=_fake_scrape)
+            try:
+                df = scraper.scrape(search_term="dev", results_wanted=2, crash_flag=flag)
+                again = scraper.scrape(search_term="dev", results_wanted=1)
+            finally:
+                scraper.shutdown()
+
+        self.assertEqual(len(df), 2)
+        self.assertEqual(len(again), 1)
+        self.assertEqual(scraper.summary()["restarts"], 1)
+
+
+class FromEnvTests(unittest.TestCase):
+    def test_unset_or_zero_keeps_thread_mode(self):
+        for value in ("", "0", "abc"):
+            with mock.patch.dict(os.environ, {"FETCH_SCRAPE_PROCESSES": value}):
+                self.assertIsNone(ProcessScraper.from_env())
+
+    def test_unknown_format_falls_back_to_default(self):
+        env = {"FETCH_SCRAPE_PROCESSES": "2", "FETCH_SCRAPE_PROCESS_FORMAT": "parquet"}
+        with mock.patch.dict(os.environ, env):
+            scraper = ProcessScraper.from_env(columns=["title"])
+        try:
+            self.assertEqual(scraper.workers, 2)
+            self.assertEqual(scraper.fmt, process_scrape.DEFAULT_FORMAT)
+            self.assertEqual(scraper.columns, ("title",))
+        finally:
+            scraper.shutdown()
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            ProcessScraper(1, fmt="csv")
+
+
+if __name__ == "__main__":
+    unittest.main()
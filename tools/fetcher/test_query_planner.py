@@ -0,0 +1,70 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(__file__))
+
+from query_planner import QueryPlanner  # noqa: E402
+
+LOCATION = "Sydney, New South Wales, Australia"
+
+
+def _urls(ids):
+    return [f"https://linkedin.com/jobs/view/{i}" for i in ids]
+
+
+class QueryPlannerTests(unittest.TestCase):
+    def test_terms_without_history_get_full_budget_in_input_order(self):
+        plan = QueryPlanner().plan(["Software Engineer", "Frontend Engineer"], LOCATION, 1000)
+
+        self.assertEqual(plan.order, ["Software Engineer", "Frontend Engineer"])
+        self.assertEqual(plan.budgets, {"Software Engineer": 1000, "Frontend Engineer": 1000})
+        self.assertEqual(plan.predicted, {"Software Engineer": None, "Frontend Engineer": None})
+
+    def test_finish_counts_new_and_exclusive_urls_per_term(self):
+        planner = QueryPlanner()
+        planner.observe("Software Engineer", _urls(range(0, 100)))
+        planner.observe("Frontend Engineer", _urls(range(80, 120)))
+
+        actual = planner.finish(LOCATION, known_before=lambda url: url.endswith("/0"))
+
+        self.assertEqual(actual["Software Engineer"], {"rows": 100, "new": 99, "exclusive": 79})
+        self.assertEqual(actual["Frontend Engineer"], {"rows": 40, "new": 40, "exclusive": 20})
+
+    def test_overlapping_term_gets_smaller_budget_and_runs_last(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "user.plan.json"
+            planner = QueryPlanner(path, min_budget=50)
+            planner.plan(["Frontend Engineer", "Software Engineer"], LOCATION, 1000)
+            planner.observe("Software Engineer", _urls(range(0, 1000)))
+            planner.observe("Frontend Engineer", _urls(range(900, 1100)))
+            planner.finish(LOCATION, known_before=lambda url: False)
+            planner.save()
+
+            plan = QueryPlanner(path, min_budget=50).plan(
+                ["Frontend Engineer", "Software Engineer", "Data Engineer"],
+                LOCATION,
+                1000,
+            )
+
+        self.assertEqual(plan.order, ["Data Engineer", "Software Engineer", "Frontend Engineer"])
+        self.assertEqual(plan.budgets["Data Engineer"], 1000)
+        self.assertEqual(plan.budgets["Software Engineer"], 900)
+        self.assertEqual(plan.budgets["Frontend Engineer"], 500)
+        self.assertEqual(plan.predicted["Software Engineer"], 810.0)
+        self.assertEqual(plan.predicted["Frontend Engineer"], 100.0)
+
+    def test_stats_are_kept_per_location(self):
+        planner = QueryPlanner()
+        planner.observe("Software Engineer", _urls(range(10)))
+        planner.finish(LOCATION, known_before=lambda url: True)
+
+        plan = planner.plan(["Software Engineer"], "Melbourne", 1000)
+
+        self.assertEqual(plan.budgets["Software Engineer"], 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
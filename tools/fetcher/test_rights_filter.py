@@ -18,7 +18,7 @@ import pandas as pd
 
 sys.path.append(os.path.dirname(__file__))
 
-from rights_filter import ExclusionMatcher, MatchResult, filter_description_v2  # noqa: E402
+from rights_filter import ExclusionMatcher, MatchResult, filter_description_v2, get_matcher  # noqa: E402
 
 
 class MatcherCorePhraseTests(unittest.TestCase):
@@ -193,6 +193,15 @@ class DataframeFilterTests(unittest.TestCase):
         self.assertEqual(len(kept), 1)
         self.assertEqual(kept.iloc[0]["job_url"], "3")
 
+    def test_get_matcher_reuses_compiled_matcher_per_configuration(self):
+        first = get_matcher(region="AU", strictness="balanced", rules=["identity_requirement", "clearance_requirement"])
+        again = get_matcher(region="AU", strictness="balanced", rules=["clearance_requirement", "identity_requirement"])
+        other = get_matcher(region="AU", strictness="strict", rules=["identity_requirement", "clearance_requirement"])
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other)
+        self.assertEqual(other.strictness, "strict")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,73 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(__file__))
+
+from run_checkpoint import RunCheckpoint  # noqa: E402
+
+
+class RunCheckpointTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_terms_and_import_progress_survive_a_new_process(self):
+        checkpoint = RunCheckpoint(self.root, "run-1")
+        self.assertFalse(checkpoint.resumed)
+        checkpoint.save_term("Software Engineer", pd.DataFrame([{"job_url": "https://example.com/1"}]))
+        checkpoint.save_term("Software Engineer", pd.DataFrame([{"job_url": "https://example.com/dup"}]))
+        checkpoint.mark_imported(["https://example.com/1", "https://example.com/2"], 2)
+        checkpoint.mark_imported(["https://example.com/2", "https://example.com/3"], 1)
+
+        resumed = RunCheckpoint(self.root, "run-1")
+        self.assertTrue(resumed.resumed)
+        self.assertEqual(resumed.completed_terms, ["Software Engineer"])
+        [(term, frame)] = resumed.load_terms()
+        self.assertEqual(frame["job_url"].tolist(), ["https://example.com/1"])
+        self.assertEqual(
+            resumed.imported_urls, {"https://example.com/1", "https://example.com/2", "https://example.com/3"}
+        )
+        self.assertEqual(resumed.imported_count, 3)
+
+    def test_cached_fetch_reuses_recorded_descriptions(self):
+        calls = []
+
+        def fetch(url, controller=None):
+            calls.append((url, controller))
+            return f"JD for {url}" if url.endswith("1") else ""
+
+        checkpoint = RunCheckpoint(self.root, "run-1")
+        cached = checkpoint.cached_fetch(fetch)
+        self.assertEqual(cached("https://example.com/1", controller="slots"), "JD for https://example.com/1")
+        self.assertEqual(cached("https://example.com/2"), "")
+
+        resumed = RunCheckpoint(self.root, "run-1").cached_fetch(fetch)
+        self.assertEqual(resumed("https://example.com/1", controller="slots"), "JD for https://example.com/1")
+        self.assertEqual(calls, [("https://example.com/1", "slots"), ("https://example.com/2", None)])
+
+    def test_state_for_another_run_is_ignored(self):
+        checkpoint = RunCheckpoint(self.root, "run-1")
+        checkpoint.mark_imported(["https://example.com/1"], 1)
+        (self.root / "run-2").mkdir()
+        (self.root / "run-1" / "state.json").replace(self.root / "run-2" / "state.json")
+
+        other = RunCheckpoint(self.root, "run-2")
+        self.assertFalse(other.resumed)
+        self.assertEqual(other.imported_urls, set())
+
+    def test_clear_removes_run_directory(self):
+        checkpoint = RunCheckpoint(self.root, "run-1")
+        checkpoint.clear()
+        self.assertFalse((self.root / "run-1").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
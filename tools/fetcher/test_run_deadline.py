@@ -0,0 +1,65 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(__file__))
+
+from run_deadline import RunDeadline  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RunDeadlineTests(unittest.TestCase):
+    def test_reserve_is_excluded_from_work_window(self):
+        clock = FakeClock()
+        deadline = RunDeadline(600, reserve_sec=120, clock=clock)
+
+        self.assertEqual(deadline.work_remaining(), 480)
+        self.assertTrue(deadline.can_afford(480))
+        clock.now += 400
+        self.assertFalse(deadline.can_afford(90))
+        self.assertFalse(deadline.expired)
+        clock.now += 80
+        self.assertTrue(deadline.expired)
+        self.assertEqual(deadline.remaining(), 120)
+
+    def test_zero_total_disables_deadline(self):
+        clock = FakeClock()
+        deadline = RunDeadline(0, reserve_sec=120, clock=clock)
+        clock.now += 10**6
+        self.assertFalse(deadline.expired)
+        self.assertTrue(deadline.can_afford(10**6))
+
+    def test_cut_records_each_reason_once(self):
+        deadline = RunDeadline(60, reserve_sec=0, clock=FakeClock())
+        self.assertFalse(deadline.partial)
+        deadline.cut("scrape_retries")
+        deadline.cut("scrape_retries")
+        deadline.cut("detail_enrichment")
+        self.assertTrue(deadline.partial)
+        self.assertEqual(deadline.partial_reasons, ["scrape_retries", "detail_enrichment"])
+
+    def test_from_env_reads_total_and_reserve(self):
+        original = {k: os.environ.get(k) for k in ("FETCH_RUN_DEADLINE_SEC", "FETCH_RUN_DEADLINE_RESERVE_SEC")}
+        try:
+            os.environ["FETCH_RUN_DEADLINE_SEC"] = "300"
+            os.environ["FETCH_RUN_DEADLINE_RESERVE_SEC"] = "not-a-number"
+            deadline = RunDeadline.from_env(clock=FakeClock())
+            self.assertEqual(deadline.total_sec, 300)
+            self.assertEqual(deadline.reserve_sec, 240)
+        finally:
+            for key, value in original.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+if __name__ == "__main__":
+    unittest.main()
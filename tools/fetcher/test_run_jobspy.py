@@ -1,14 +1,20 @@
 import unittest
 
+import json
 import os
 import sys
+import tempfile
 import threading
 import time
+from unittest import mock
 
 import pandas as pd
 
 sys.path.append(os.path.dirname(__file__))
-import run_jobspy as rj  # noqa: E402
+import run_jobspy as rj
+from known_jobs import KnownJobs
+from sleep_service import SleepService
+from run_report import RunReport
 
 
 class RunJobspyDedupeTests(unittest.TestCase):
@@ -61,6 +67,111 @@ class RunJobspyDedupeTests(unittest.TestCase):
         deduped = rj.dedupe_jobs(df)
         self.assertEqual(len(deduped), 2)
 
+    def test_dedupe_jobs_falls_back_to_fingerprint_for_rows_without_url(self):
+        df = pd.DataFrame(
+            [
+                {"job_url": "", "title": "Frontend Engineer", "company": "Acme", "location": "Sydney"},
+                {"job_url": None, "title": "Frontend-Engineer", "company": "ACME", "location": "Sydney"},
+                {"job_url": "https://example.com/a", "title": "Frontend Engineer", "company": "Acme", "location": "Sydney"},
+                {"job_url": "", "title": "Backend Engineer", "company": "Acme", "location": "Sydney"},
+            ],
+            index=[10, 11, 12, 13],
+        )
+
+        deduped = rj.dedupe_jobs(df)
+        self.assertEqual(deduped["title"].tolist(), ["Frontend Engineer", "Frontend Engineer", "Backend Engineer"])
+        self.assertEqual(deduped.index.tolist(), [0, 1, 2])
+
+    def test_keep_columns_maps_jobspy_aliases_without_mutating_input(self):
+        df = pd.DataFrame(
+            [
+                {
+                    "job_url_direct": "https://example.com/a",
+                    "title": "Software Engineer",
+                    "employment_type": "fulltime",
+                    "description": None,
+                    "company_logo": "https://example.com/logo.png",
+                }
+            ]
+        )
+
+        out = rj.keep_columns(df)
+        self.assertEqual(list(out.columns), rj.IMPORT_COLUMNS)
+        self.assertEqual(out.iloc[0]["job_url"], "https://example.com/a")
+        self.assertEqual(out.iloc[0]["job_type"], "fulltime")
+        self.assertEqual(out.iloc[0]["description"], "")
+        self.assertNotIn("job_url", df.columns)
+
+    def test_keep_columns_stores_low_cardinality_columns_as_categories(self):
+        df = pd.DataFrame(
+            [
+                {"job_url": "https://example.com/a", "title": "Engineer", "company": "Acme", "location": None},
+                {"job_url": "https://example.com/b", "title": "Engineer", "company": "Acme", "location": "Sydney"},
+            ]
+        ).astype({"location": "category"})
+
+        out = rj.keep_columns(df)
+        for column in ["company", "location", "job_type", "job_level"]:
+            self.assertIsInstance(out[column].dtype, pd.CategoricalDtype)
+        records = out.to_dict(orient="records")
+        self.assertEqual(records[0]["location"], "")
+        self.assertIs(type(records[1]["company"]), str)
+
+    def test_dedupe_jobs_with_seen_keys_dedupes_across_chunks(self):
+        seen = set()
+        first = rj.dedupe_jobs(
+            pd.DataFrame(
+                [
+                    {"job_url": "https://example.com/a?ref=1", "title": "A", "company": "Acme", "location": "Sydney"},
+                    {"job_url": "", "title": "B", "company": "Acme", "location": "Sydney"},
+                ]
+            ),
+            seen_keys=seen,
+        )
+        second = rj.dedupe_jobs(
+            pd.DataFrame(
+                [
+                    {"job_url": "https://example.com/a?ref=2", "title": "A", "company": "Acme", "location": "Sydney"},
+                    {"job_url": None, "title": "B", "company": "Acme", "location": "Sydney"},
+                    {"job_url": "https://example.com/c", "title": "C", "company": "Acme", "location": "Sydney"},
+                ]
+            ),
+            seen_keys=seen,
+        )
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second["title"].tolist(), ["C"])
+
+    def test_iter_spilled_items_matches_in_memory_pipeline(self):
+        import tempfile
+        from pathlib import Path
+
+        from spill_store import SpillStore
+
+        df = pd.DataFrame(
+            [
+                {"job_url": f"https://linkedin.com/jobs/view/{i % 7}", "title": title, "company": "Acme",
+                 "location": "Sydney", "description": "Build APIs."}
+                for i, title in enumerate(["Software Engineer", "Senior Engineer", "Data Engineer"] * 6)
+            ]
+        )
+        options = {
+            "search_terms": ["Software Engineer"],
+            "include_from_queries": False,
+            "exclude_title_terms": ["senior"],
+            "active_rights_rules": [],
+            "active_experience_rules": [],
+            "identity_region": "GLOBAL",
+            "identity_strictness": "balanced",
+        }
+        expected = rj.dedupe_jobs(rj._filter_jobs_frame(df, **options)).to_dict(orient="records")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SpillStore(Path(tmp), chunk_rows=4, fmt="pickle")
+            store.write("Software Engineer", df)
+            streamed = list(rj._iter_spilled_items(store, options, near_duplicate_threshold=0))
+
+        self.assertEqual(streamed, expected)
+
     def test_canonicalize_job_url_removes_query_and_fragment(self):
         self.assertEqual(
             rj._canonicalize_job_url("HTTPS://Example.com/jobs/view/123/?utm_source=x#top"),
@@ -81,6 +192,16 @@ class RunJobspyDedupeTests(unittest.TestCase):
             "https://linkedin.com/jobs/view/999",
         )
 
+    def test_canonicalize_job_url_keeps_board_posting_ids(self):
+        self.assertEqual(
+            rj._canonicalize_job_url("https://au.indeed.com/viewjob?from=serp&jk=abc123&vjs=3"),
+            "https://au.indeed.com/viewjob?jk=abc123",
+        )
+        self.assertEqual(
+            rj._canonicalize_job_url("https://www.glassdoor.com.au/job-listing/j?jl=987"),
+            "https://glassdoor.com.au/job-listing/j?jl=987",
+        )
+
     def test_results_per_query_splits_budget_across_terms(self):
         self.assertEqual(rj._results_per_query(100, 8), 13)
         self.assertEqual(rj._results_per_query(100, 1), 100)
@@ -120,6 +241,435 @@ class RunJobspyDedupeTests(unittest.TestCase):
         self.assertTrue(rj._is_rate_limited_error(Exception("Rate limit exceeded")))
         self.assertFalse(rj._is_rate_limited_error(Exception("connection reset by peer")))
 
+    def test_fetch_single_term_stops_retrying_when_backoff_exceeds_deadline(self):
+        from run_deadline import RunDeadline
+
+        deadline = RunDeadline(60, reserve_sec=50, clock=lambda: 0.0)
+        with mock.patch.object(rj, "scrape_jobs", side_effect=RuntimeError("too many 429 error responses")) as scrape, \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()) as sleeper:
+            out = rj._fetch_single_linkedin_term(
+                "Software Engineer",
+                "Sydney",
+                48,
+                100,
+                fetch_description=False,
+                deadline=deadline,
+            )
+
+        self.assertIsNone(out)
+        self.assertEqual(scrape.call_count, 1)
+        self.assertEqual(sleeper.calls, 0)
+        self.assertEqual(deadline.partial_reasons, ["scrape_retries"])
+
+    def _known_from_earlier_run(self, urls):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, "known.tsv")
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.writelines(f"{url}\t{time.time():.0f}\n" for url in urls)
+        return KnownJobs(path)
+
+    def test_paged_fetch_stops_after_consecutive_known_jobs(self):
+        known = self._known_from_earlier_run(f"https://linkedin.com/jobs/view/{i}" for i in range(100, 200))
+        offsets = []
+
+        def scrape(offset, results_wanted, **kwargs):
+            offsets.append(offset)
+            # Newest first: 15 new postings, then everything after is known.
+            return pd.DataFrame(
+                {"job_url": [f"https://www.linkedin.com/jobs/view/{85 + offset + i}" for i in range(results_wanted)]}
+            )
+
+        with mock.patch.object(rj, "scrape_jobs", scrape):
+            out = rj._fetch_linkedin_term_paged(
+                "Software Engineer",
+                "Sydney",
+                24,
+                1000,
+                fetch_description=False,
+                page_size=10,
+                known_urls=known,
+                stop_after_known=5,
+            )
+
+        self.assertEqual(offsets, [0, 10])
+        self.assertEqual(len(out), 20)
+        self.assertIn("https://linkedin.com/jobs/view/85", known)
+
+    def test_paged_fetch_ignores_postings_other_terms_scraped_this_run(self):
+        known = KnownJobs()
+        known.add_many(f"https://linkedin.com/jobs/view/{i}" for i in range(100))
+        offsets = []
+
+        def scrape(offset, results_wanted, **kwargs):
+            offsets.append(offset)
+            return pd.DataFrame({"job_url": [f"https://linkedin.com/jobs/view/{offset + i}" for i in range(results_wanted)]})
+
+        with mock.patch.object(rj, "scrape_jobs", scrape):
+            out = rj._fetch_linkedin_term_paged(
+                "Backend Engineer",
+                "Sydney",
+                24,
+                40,
+                fetch_description=False,
+                page_size=10,
+                known_urls=known,
+                stop_after_known=5,
+            )
+
+        self.assertEqual(offsets, [0, 10, 20, 30])
+        self.assertEqual(len(out), 40)
+
+    def test_paged_fetch_reports_failed_later_page_as_failure(self):
+        report = RunReport()
+
+        def scrape(offset, results_wanted, **kwargs):
+            if offset:
+                raise RuntimeError("HTTP 500")
+            return pd.DataFrame({"job_url": [f"https://linkedin.com/jobs/view/{i}" for i in range(results_wanted)]})
+
+        with mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj._fetch_linkedin_term_paged(
+                "Software Engineer",
+                "Sydney",
+                24,
+                100,
+                fetch_description=False,
+                page_size=10,
+                known_urls=KnownJobs(),
+                report=report,
+            )
+
+        self.assertEqual(len(out), 10)
+        self.assertEqual(report.counters["scrape_stop_failed"], 1)
+        self.assertNotIn("scrape_stop_exhausted", report.counters)
+
+    def test_paged_fetch_stops_on_short_page_without_known_jobs(self):
+        offsets = []
+
+        def scrape(offset, results_wanted, **kwargs):
+            offsets.append(offset)
+            rows = results_wanted if offset < 20 else 3
+            return pd.DataFrame({"job_url": [f"https://linkedin.com/jobs/view/{offset + i}" for i in range(rows)]})
+
+        with mock.patch.object(rj, "scrape_jobs", scrape):
+            out = rj._fetch_linkedin_term_paged(
+                "Software Engineer",
+                "Sydney",
+                24,
+                1000,
+                fetch_description=False,
+                page_size=10,
+                known_urls=KnownJobs(),
+                stop_after_known=5,
+            )
+
+        self.assertEqual(offsets, [0, 10, 20])
+        self.assertEqual(len(out), 23)
+
+    def test_fetch_linkedin_retries_rate_limited_term_under_controller(self):
+        attempts = {}
+        lock = threading.Lock()
+
+        def scrape(search_term, **kwargs):
+            with lock:
+                attempts[search_term] = attempts.get(search_term, 0) + 1
+                first = attempts[search_term] == 1
+            if search_term == "t0" and first:
+                raise RuntimeError("HTTP 429 Too Many Requests")
+            return _scraped_frame(search_term, 3)
+
+        terms = [f"t{i}" for i in range(8)]
+        with mock.patch.dict(os.environ, {"FETCH_QUERY_CONCURRENCY": "4"}), \
+                mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()) as sleeper:
+            out = rj.fetch_linkedin(terms, "Sydney", 24, 10, fetch_description=False)
+
+        self.assertEqual(len(out), 24)
+        self.assertEqual(attempts["t0"], 2)
+        self.assertEqual(list(sleeper.summary()["byReason"]), ["scrape_rate_limit"])
+
+    def test_fetch_linkedin_never_runs_more_terms_than_configured(self):
+        in_flight = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def scrape(search_term, **kwargs):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.005)
+            with lock:
+                in_flight["now"] -= 1
+            return _scraped_frame(search_term, 1)
+
+        terms = [f"t{i}" for i in range(12)]
+        with mock.patch.dict(os.environ, {"FETCH_QUERY_CONCURRENCY": "1"}), \
+                mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj.fetch_linkedin(terms, "Sydney", 24, 10, fetch_description=False)
+
+        self.assertEqual(len(out), 12)
+        self.assertEqual(in_flight["peak"], 1)
+
+    def test_fetch_sources_merges_boards_and_drops_cross_board_duplicates(self):
+        calls = []
+        lock = threading.Lock()
+
+        def scrape(site_name, search_term, **kwargs):
+            site = site_name[0]
+            with lock:
+                calls.append((site, search_term))
+            slug = search_term.lower().replace(" ", "-")
+            # Two postings on both boards, one only on Indeed.
+            postings = [f"{search_term} {i}" for i in range(2)] + ([f"{search_term} indeed"] if site == "indeed" else [])
+            return pd.DataFrame(
+                [
+                    {
+                        "job_url": (
+                            f"https://www.linkedin.com/jobs/view/{slug}-{i}"
+                            if site == "linkedin"
+                            else f"https://au.indeed.com/viewjob?jk={slug}-{i}&from=serp"
+                        ),
+                        "title": title,
+                        "company": "Acme",
+                        "location": "Sydney",
+                        "description": f"{title} role.",
+                    }
+                    for i, title in enumerate(postings)
+                ]
+            )
+
+        report = RunReport()
+        with mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj.fetch_sources(
+                ["linkedin", "indeed"],
+                ["Data Engineer", "Backend Engineer"],
+                "Sydney",
+                24,
+                10,
+                fetch_description=False,
+                report=report,
+            )
+
+        self.assertEqual(sorted(calls), sorted((site, term) for site in ("linkedin", "indeed") for term in ("Data Engineer", "Backend Engineer")))
+        self.assertEqual(len(out), 6)
+        self.assertEqual(sorted(out["title"]), sorted(f"{t} {s}" for t in ("Data Engineer", "Backend Engineer") for s in ("0", "1", "indeed")))
+        self.assertEqual(out["job_url"].map(rj._canonicalize_job_url).nunique(), 6)
+        sources = report.meta["sources"]
+        self.assertEqual((sources["linkedin"]["rows"], sources["indeed"]["rows"]), (4, 6))
+        self.assertEqual(sources["linkedin"]["keptRows"] + sources["indeed"]["keptRows"], 6)
+        self.assertEqual(sources["indeed"]["terms"], 2)
+
+    def test_fetch_sources_keeps_cross_board_duplicate_under_each_term(self):
+        def scrape(site_name, search_term, **kwargs):
+            # Every board lists the same posting under every term.
+            job_url = (
+                "https://www.linkedin.com/jobs/view/shared"
+                if site_name[0] == "linkedin"
+                else "https://au.indeed.com/viewjob?jk=shared"
+            )
+            return pd.DataFrame(
+                [{"job_url": job_url, "title": "Platform Engineer", "company": "Acme", "location": "Sydney"}]
+            )
+
+        delivered = []
+        with mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            rj.fetch_sources(
+                ["linkedin", "indeed"],
+                ["Data Engineer", "Backend Engineer"],
+                "Sydney",
+                24,
+                10,
+                fetch_description=False,
+                on_frame=lambda term, frame: delivered.append((term, len(frame))),
+            )
+
+        # One copy per term (batch mode hands each run only its own terms),
+        # never one per board.
+        self.assertEqual(sorted(delivered), [("Backend Engineer", 1), ("Data Engineer", 1)])
+
+    def test_fetch_sources_runs_search_sources_through_cn_fetcher(self):
+        def get(url, params=None, **kwargs):
+            term = params["q"].split(" ")[0]
+            blocks = "".join(
+                f'<li class="b_algo"><h2><a href="https://www.zhipin.com/job_detail/{term}{i}.html">'
+                f"「{term}工程师招聘」_某公司招聘-BOSS直聘</a></h2><p>3-5年 本科</p></li>"
+                for i in range(3)
+            )
+            return mock.Mock(status_code=200, text=f"<ol>{blocks}</ol>")
+
+        report = RunReport()
+        with mock.patch.object(rj.http, "get", side_effect=get), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj.fetch_sources(["zhipin"], ["java", "go"], "上海", 24, 10, report=report)
+
+        self.assertEqual(sorted(out["job_url"]), sorted(f"https://www.zhipin.com/job_detail/{t}{i}.html" for t in ("java", "go") for i in range(3)))
+        self.assertEqual(set(out["site"]), {"zhipin"})
+        self.assertEqual(set(out["source_query"]), {"java", "go"})
+        self.assertEqual(report.counters["search_requests"], 2)
+        self.assertEqual(report.meta["sources"]["zhipin"]["rows"], 6)
+
+    def test_fetch_sources_pairs_terms_with_locations_and_dedupes_by_url(self):
+        calls = []
+        lock = threading.Lock()
+
+        def scrape(search_term, location, **kwargs):
+            with lock:
+                calls.append((search_term, location))
+            slug = search_term.lower().replace(" ", "-")
+            # Two remote postings every city returns, plus one local posting.
+            rows = [(f"{slug}-remote-{i}", "Remote") for i in range(2)] + [(f"{slug}-{location.lower()}", location)]
+            return pd.DataFrame(
+                [
+                    {
+                        "job_url": f"https://www.linkedin.com/jobs/view/{job_id}?trk=public",
+                        "title": search_term,
+                        "company": "Acme",
+                        "location": job_location,
+                        "description": "role",
+                    }
+                    for job_id, job_location in rows
+                ]
+            )
+
+        report = RunReport()
+        frames = []
+        with mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            rj.fetch_sources(
+                ["linkedin"],
+                ["Data Engineer", "Backend Engineer"],
+                ["Sydney", "Melbourne"],
+                24,
+                10,
+                on_frame=lambda term, frame: frames.append((term, frame)),
+                report=report,
+                skip_keys={"Backend Engineer@Melbourne"},
+            )
+
+        self.assertEqual(
+            sorted(calls),
+            [("Backend Engineer", "Sydney"), ("Data Engineer", "Melbourne"), ("Data Engineer", "Sydney")],
+        )
+        out = pd.concat([frame for _, frame in frames], ignore_index=True)
+        self.assertEqual(len(out), 7)  # 2 remote + 2 local for Data Engineer, 3 for Backend Engineer
+        self.assertEqual(out["job_url"].map(rj._canonicalize_job_url).nunique(), 7)
+        self.assertEqual(set(out["source_location"]), {"Sydney", "Melbourne"})
+        locations = report.meta["locations"]
+        self.assertEqual(locations["Sydney"]["rows"] + locations["Melbourne"]["rows"], 9)
+        self.assertEqual(locations["Sydney"]["keptRows"] + locations["Melbourne"]["keptRows"], 7)
+
+    def test_run_settings_accepts_location_lists(self):
+        base = {"userEmail": "u@example.com", "queries": {"title": "Data Engineer"}}
+
+        self.assertEqual(rj._run_settings({**base, "location": "Sydney"})["locations"], ["Sydney"])
+        self.assertEqual(
+            rj._run_settings({**base, "location": ["Sydney", " sydney ", "", "Remote"]})["locations"],
+            ["Sydney", "Remote"],
+        )
+        stored = {**base, "location": "Sydney", "queries": {"title": "Data Engineer", "locations": ["Sydney", "Perth"]}}
+        self.assertEqual(rj._run_settings(stored)["locations"], ["Sydney", "Perth"])
+        self.assertEqual(rj._run_settings(base)["locations"], [rj.DEFAULT_LOCATION])
+
+    def test_incremental_window_covers_time_since_previous_run(self):
+        now = 1_800_000_000.0
+        previous = "2027-01-15T06:00:00Z"  # 2h before `now`
+        started = rj._parse_timestamp(previous)
+        self.assertEqual(started, now - 2 * 3600)
+
+        window = rj._incremental_window(previous, 48, 1000, overlap_hours=3, now=now)
+        self.assertEqual(window["hoursOld"], 5)
+        self.assertEqual(window["resultsWanted"], 105)  # ceil(1000 * 5 / 48)
+
+        # Floor on results_wanted, full window once the gap is too long.
+        self.assertEqual(rj._incremental_window(previous, 48, 200, overlap_hours=0, now=now)["resultsWanted"], 100)
+        self.assertIsNone(rj._incremental_window(previous, 4, 1000, overlap_hours=3, now=now))
+        self.assertIsNone(rj._incremental_window(None, 48, 1000, overlap_hours=3, now=now))
+        self.assertIsNone(rj._incremental_window("not a date", 48, 1000, overlap_hours=3, now=now))
+
+    def test_run_settings_applies_incremental_window_only_when_enabled(self):
+        previous = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - 3600))
+        run = {
+            "userEmail": "u@example.com",
+            "queries": {"title": "Data Engineer"},
+            "hoursOld": 48,
+            "resultsWanted": 4800,
+            "previousSucceededAt": previous,
+        }
+
+        with mock.patch.dict(os.environ, {"FETCH_INCREMENTAL": ""}):
+            settings = rj._run_settings(run)
+        self.assertEqual((settings["hours_old"], settings["results_wanted"], settings["incremental"]), (48, 4800, None))
+
+        with mock.patch.dict(os.environ, {"FETCH_INCREMENTAL": "1", "FETCH_INCREMENTAL_OVERLAP_HOURS": "2"}):
+            settings = rj._run_settings(run)
+        self.assertIn(settings["hours_old"], (3, 4))
+        self.assertEqual(settings["results_wanted"], 4800 * settings["hours_old"] // 48)
+        self.assertEqual(settings["incremental"]["configuredHoursOld"], 48)
+
+    def test_fetch_linkedin_projects_columns_right_after_scrape(self):
+        def scrape(search_term, **kwargs):
+            return _scraped_frame(search_term, 2).assign(
+                job_url_direct="https://careers.example.com/1",
+                company_logo="https://media.example.com/logo.png",
+                company_description="About us.",
+                min_amount=100000.0,
+                emails="jobs@example.com",
+            )
+
+        with mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj.fetch_linkedin(["Data Engineer"], "Sydney", 24, 10, fetch_description=False)
+
+        self.assertEqual(
+            sorted(out.columns),
+            sorted(["job_url", "job_url_direct", "title", "company", "location", "description", "source_query"]),
+        )
+        self.assertEqual(list(rj.keep_columns(out).columns), rj.IMPORT_COLUMNS)
+
+    def test_fetch_linkedin_hands_scrape_to_process_scraper_when_enabled(self):
+        pool = mock.Mock()
+        pool.scrape.side_effect = lambda search_term, **kwargs: _scraped_frame(search_term, 2)
+        direct = mock.Mock(side_effect=AssertionError("scraped on the thread"))
+
+        with mock.patch.object(rj, "scrape_jobs", direct), \
+                mock.patch.object(rj, "_get_process_scraper", return_value=pool), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj.fetch_linkedin(["Data Engineer"], "Sydney", 24, 10, fetch_description=False)
+
+        self.assertEqual(len(out), 2)
+        self.assertEqual(pool.scrape.call_args.kwargs["search_term"], "Data Engineer")
+        self.assertEqual(pool.scrape.call_args.kwargs["site_name"], ["linkedin"])
+
+    def test_fetch_sources_linkedin_only_skips_completed_terms(self):
+        seen = []
+
+        def scrape(search_term, **kwargs):
+            seen.append(search_term)
+            return _scraped_frame(search_term, 2)
+
+        with mock.patch.object(rj, "scrape_jobs", scrape), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            out = rj.fetch_sources(["linkedin"], ["t0", "t1"], "Sydney", 24, 10, skip_keys={"t0"})
+
+        self.assertEqual(seen, ["t1"])
+        self.assertEqual(len(out), 2)
+
+    def test_enrich_descriptions_skips_fetches_after_deadline(self):
+        from run_deadline import RunDeadline
+
+        deadline = RunDeadline(60, reserve_sec=60, clock=lambda: 0.0)
+        base = pd.DataFrame([{"job_url": "https://linkedin.com/jobs/view/1", "description": ""}])
+        calls = []
+
+        out = rj._enrich_descriptions_for_urls(base, fetch_fn=lambda url, **_: calls.append(url), deadline=deadline)
+        self.assertEqual(calls, [])
+        self.assertEqual(out.iloc[0]["description"], "")
+        self.assertEqual(deadline.partial_reasons, ["detail_enrichment"])
+
     def test_fetch_terms_uses_multiple_threads_when_workers_gt1(self):
         queries = ["q1", "q2", "q3", "q4"]
         thread_names = set()
@@ -140,10 +690,44 @@ class RunJobspyDedupeTests(unittest.TestCase):
                 ]
             )
 
-        pairs = rj._fetch_terms(queries, fake_fetch, max_workers=4)
+        pairs = list(rj._fetch_terms(queries, fake_fetch, max_workers=4))
         self.assertEqual(len(pairs), 4)
         self.assertGreater(len(thread_names), 1)
 
+    def test_fetch_terms_requeues_failed_term_without_blocking_others(self):
+        attempts = {}
+        lock = threading.Lock()
+
+        def fake_fetch(term: str):
+            with lock:
+                attempts[term] = attempts.get(term, 0) + 1
+                attempt = attempts[term]
+            if term == "flaky" and attempt == 1:
+                return None
+            if term == "dead":
+                return None
+            if term == "empty":
+                return pd.DataFrame()
+            time.sleep(0.01)
+            return pd.DataFrame([{"job_url": f"https://example.com/{term}", "title": term}])
+
+        results = list(
+            rj._fetch_terms(
+                ["flaky", "dead", "empty", "q1", "q2", "q3"],
+                fake_fetch,
+                max_workers=2,
+                max_attempts=3,
+                retry_cooldown_sec=0.05,
+            )
+        )
+
+        order = [term for term, _ in results]
+        self.assertEqual(attempts, {"flaky": 2, "dead": 3, "empty": 3, "q1": 1, "q2": 1, "q3": 1})
+        self.assertLess(order.index("q1"), order.index("flaky"))
+        self.assertIsNone(dict(results)["dead"])
+        self.assertTrue(dict(results)["empty"].empty)
+        self.assertEqual(len(dict(results)["flaky"]), 1)
+
     def test_filter_title_includes_description_match_when_enforced(self):
         df = pd.DataFrame(
             [
@@ -224,6 +808,29 @@ class RunJobspyDedupeTests(unittest.TestCase):
         )
         self.assertEqual(len(out), 2)
 
+    def test_filter_title_without_active_filters_returns_input_unchanged(self):
+        df = pd.DataFrame([{"title": "Senior Software Engineer"}, {"title": None}])
+
+        out = rj.filter_title(df, queries=["Software Engineer"], enforce_include=False, exclude_terms=[])
+        self.assertIs(out, df)
+
+    def test_filter_title_include_matches_normalized_separators(self):
+        df = pd.DataFrame(
+            [
+                {"title": "Full-Stack Engineer (React)"},
+                {"title": "Fullstack Engineer"},
+                {"title": None},
+            ]
+        )
+
+        out = rj.filter_title(df, queries=['"full stack engineer"'], enforce_include=True, exclude_terms=[])
+        self.assertEqual(out["title"].tolist(), ["Full-Stack Engineer (React)"])
+
+    def test_normalize_text_series_matches_scalar_normalizer(self):
+        values = ["Full-Stack  Engineer", "  C++/Go Dev\t", "", None, "Ünïcode Rôle"]
+        expected = [rj._normalize_text(v) for v in values]
+        self.assertEqual(rj._normalize_text_series(pd.Series(values)).tolist(), expected)
+
     def test_filter_description_only_drops_hard_rights_requirement(self):
         from rights_filter import filter_description_v2
 
@@ -435,7 +1042,8 @@ class RunJobspyDedupeTests(unittest.TestCase):
         )
         calls = []
 
-        def fake_fetch(url: str):
+        def fake_fetch(url: str, controller=None):
+            self.assertIsNotNone(controller)
             calls.append(rj._canonicalize_job_url(url))
             return "Fetched JD for 123"
 
@@ -447,5 +1055,518 @@ class RunJobspyDedupeTests(unittest.TestCase):
         self.assertEqual(out.iloc[0]["description"], "Fetched JD for 123")
         self.assertEqual(out.iloc[2]["description"], "Already has details")
 
+    def test_proxy_for_attempt_skips_recently_failed_proxies(self):
+        pool = ["http://p1", "http://p2"]
+        with mock.patch.dict(rj._proxy_failed_at, clear=True):
+            rj._mark_proxy_failed("http://p1")
+
+            picks = {rj._proxy_for_attempt(pool, term, attempt) for term in ("a", "b", "c") for attempt in range(3)}
+            self.assertEqual(picks, {"http://p2"})
+
+            rj._mark_proxy_failed("http://p2")
+            picks = {rj._proxy_for_attempt(pool, "a", attempt) for attempt in range(2)}
+            self.assertEqual(picks, set(pool))
+
+    def test_detail_fetch_benches_proxy_only_for_blocks_and_connection_errors(self):
+        outcomes = {
+            "missing": FakeResponse(status_code=404),
+            "blocked": FakeResponse(status_code=429),
+            "refused": rj.requests.exceptions.ProxyError("proxy refused"),
+        }
+        for name, outcome in outcomes.items():
+            with self.subTest(outcome=name), \
+                    mock.patch.dict(rj._proxy_failed_at, clear=True), \
+                    mock.patch.dict(os.environ, {"FETCH_DETAIL_URL_RETRIES": "0"}), \
+                    mock.patch.object(rj.http, "get", mock.Mock(side_effect=[outcome])):
+                out = rj._fetch_description_for_url("https://example.com/jobs/1", proxy_pool=["http://p1"])
+
+                self.assertEqual(out, "")
+                self.assertEqual("http://p1" in rj._proxy_failed_at, name != "missing")
+
+
+class FakeResponse:
+    def __init__(self, payload=None, status_code=200):
+        self._payload = payload or {}
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.text = json.dumps(self._payload)
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise RuntimeError(f"http_{self.status_code}")
+
+
+class FakeFetchRunApi:
+    """Stands in for /api/fetch-runs/* and /api/admin/import in main() tests."""
+
+    def __init__(self, run, fail_import_after=None):
+        self.run = run
+        self.patches = []
+        self.imported_batches = []
+        self.fail_import_after = fail_import_after
+
+    def get(self, url, **kwargs):
+        return FakeResponse({"run": self.run})
+
+    def patch(self, url, data=None, **kwargs):
+        self.patches.append(json.loads(data))
+        return FakeResponse({"ok": True})
+
+    def post(self, url, data=None, **kwargs):
+        if self.fail_import_after is not None and len(self.imported_batches) >= self.fail_import_after:
+            raise ConnectionError("runner evicted")
+        items = json.loads(data)["items"]
+        self.imported_batches.append([item["job_url"] for item in items])
+        return FakeResponse({"imported": len(items)})
+
+
+class FakeBatchFetchRunApi(FakeFetchRunApi):
+    """FakeFetchRunApi for several runs, routed by the run id in the URL."""
+
+    def __init__(self, runs):
+        super().__init__(None)
+        self.runs = runs
+        self.imported_by_user = {}
+
+    @staticmethod
+    def _run_id(url):
+        return url.split("/fetch-runs/")[1].split("/")[0]
+
+    def get(self, url, **kwargs):
+        return FakeResponse({"run": self.runs[self._run_id(url)]})
+
+    def patch(self, url, data=None, **kwargs):
+        self.patches.append((self._run_id(url), json.loads(data)))
+        return FakeResponse({"ok": True})
+
+    def post(self, url, data=None, **kwargs):
+        body = json.loads(data)
+        urls = [item["job_url"] for item in body["items"]]
+        self.imported_by_user.setdefault(body["userEmail"], []).extend(urls)
+        self.imported_batches.append(urls)
+        return FakeResponse({"imported": len(urls)})
+
+
+def _scraped_frame(term: str, rows: int) -> pd.DataFrame:
+    slug = term.lower().replace(" ", "-")
+    return pd.DataFrame(
+        [
+            {
+                "job_url": f"https://www.linkedin.com/jobs/view/{slug}-{i}",
+                "title": term,
+                "company": "Acme",
+                "location": "Sydney",
+                "description": f"{term} role number {i}.",
+            }
+            for i in range(rows)
+        ]
+    )
+
+
+class RunJobspyMainTests(unittest.TestCase):
+    RUN_ID = "11111111-1111-4111-8111-111111111111"
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.env = {
+            "RUN_ID": self.RUN_ID,
+            "JOBLIT_WEB_URL": "https://joblit.test",
+            "FETCH_RUN_SECRET": "fetch-secret",
+            "IMPORT_SECRET": "import-secret",
+            "FETCH_CHECKPOINT_DIR": os.path.join(self._tmp.name, "checkpoints"),
+            "FETCH_NEAR_DUPLICATE_THRESHOLD": "0",
+        }
+        self.run = {
+            "userEmail": "user@example.com",
+            "status": "RUNNING",
+            "queries": {"title": "Software Engineer", "queries": ["Software Engineer", "Data Engineer"]},
+            "resultsWanted": 100,
+        }
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _run_main(self, api, scrape):
+        with mock.patch.dict(os.environ, self.env), \
+                mock.patch.object(rj.http, "get", api.get), \
+                mock.patch.object(rj.http, "patch", api.patch), \
+                mock.patch.object(rj.http, "post", api.post), \
+                mock.patch.object(rj, "scrape_jobs", scrape):
+            rj.main()
+
+    def test_resume_skips_completed_terms_and_imported_batches(self):
+        calls = []
+
+        def scrape(search_term, **kwargs):
+            calls.append(search_term)
+            return _scraped_frame(search_term, 60)
+
+        first = FakeFetchRunApi(self.run, fail_import_after=1)
+        with self.assertRaises(ConnectionError):
+            self._run_main(first, scrape)
+        self.assertEqual(sorted(calls), ["Data Engineer", "Software Engineer"])
+        self.assertEqual(len(first.imported_batches), 1)
+
+        calls.clear()
+        second = FakeFetchRunApi(self.run)
+        self._run_main(second, scrape)
+
+        self.assertEqual(calls, [])
+        all_urls = [url for batch in first.imported_batches + second.imported_batches for url in batch]
+        self.assertEqual(len(all_urls), 120)
+        self.assertEqual(len(set(all_urls)), 120)
+        self.assertEqual(second.patches[-1]["status"], "SUCCEEDED")
+        self.assertEqual(second.patches[-1]["importedCount"], 120)
+        self.assertFalse(os.path.exists(os.path.join(self.env["FETCH_CHECKPOINT_DIR"], self.RUN_ID)))
+
+    def test_two_phase_resume_reuses_descriptions_and_skips_imported_urls(self):
+        self.env["FETCH_TWO_PHASE"] = "1"
+        detail_urls = []
+
+        def scrape(search_term, **kwargs):
+            return _scraped_frame(search_term, 60).assign(description=None)
+
+        def fetch_detail(url, **kwargs):
+            detail_urls.append(url)
+            return f"Details for {url}"
+
+        def blocked_detail(url, **kwargs):
+            detail_urls.append(url)
+            return ""
+
+        first = FakeFetchRunApi(self.run, fail_import_after=1)
+        with mock.patch.object(rj, "_fetch_description_for_url", fetch_detail), \
+                self.assertRaises(ConnectionError):
+            self._run_main(first, scrape)
+        self.assertEqual(len(detail_urls), 120)
+
+        # The detail pages are blocked now; the checkpoint still has them.
+        detail_urls.clear()
+        second = FakeFetchRunApi(self.run)
+        with mock.patch.object(rj, "_fetch_description_for_url", blocked_detail):
+            self._run_main(second, scrape)
+
+        self.assertEqual(detail_urls, [])
+        all_urls = [url for batch in first.imported_batches + second.imported_batches for url in batch]
+        self.assertEqual(len(all_urls), 120)
+        self.assertEqual(len(set(all_urls)), 120)
+        self.assertEqual(second.patches[-1]["importedCount"], 120)
+
+    def test_known_jobs_from_previous_run_stop_paged_fetch_early(self):
+        self.env.update(
+            {
+                "FETCH_PAGE_SIZE": "10",
+                "FETCH_EARLY_STOP_KNOWN": "5",
+                "FETCH_KNOWN_JOBS_DIR": os.path.join(self._tmp.name, "known"),
+            }
+        )
+        newest = [0]
+        calls = []
+
+        def scrape(search_term, offset, results_wanted, **kwargs):
+            calls.append((search_term, offset))
+            ids = range(newest[0] - offset, max(newest[0] - offset - results_wanted, 0), -1)
+            return pd.DataFrame(
+                [
+                    {
+                        "job_url": f"https://www.linkedin.com/jobs/view/{search_term[0]}{job_id}",
+                        "title": search_term,
+                        "company": "Acme",
+                        "location": "Sydney",
+                        "description": f"{search_term} role {job_id}.",
+                    }
+                    for job_id in ids
+                ]
+            )
+
+        newest[0] = 40
+        first = FakeFetchRunApi(self.run)
+        self._run_main(first, scrape)
+        self.assertEqual(first.patches[-1]["importedCount"], 80)
+        self.assertEqual(len(calls), 10)
+
+        # Three new postings per term since the last run.
+        calls.clear()
+        newest[0] = 43
+        second = FakeFetchRunApi(self.run)
+        self._run_main(second, scrape)
+        self.assertEqual(sorted(offset for _, offset in calls), [0, 0])
+        self.assertEqual(second.patches[-1]["status"], "SUCCEEDED")
+
+    def test_two_phase_fetches_descriptions_only_for_surviving_listings(self):
+        for spill in (False, True):
+            with self.subTest(spill=spill):
+                self.env["FETCH_TWO_PHASE"] = "1"
+                if spill:
+                    self.env["FETCH_SPILL_DIR"] = os.path.join(self._tmp.name, "spill")
+                scrape_flags = []
+                detail_urls = []
+
+                def scrape(search_term, linkedin_fetch_description, **kwargs):
+                    scrape_flags.append(linkedin_fetch_description)
+                    frame = _scraped_frame(search_term, 4).assign(description=None)
+                    frame.loc[0, "title"] = f"Senior {search_term}"
+                    # Every term also lists the same shared posting.
+                    frame.loc[3, "job_url"] = "https://www.linkedin.com/jobs/view/shared?trk=x"
+                    return frame
+
+                def fetch_detail(url, **kwargs):
+                    detail_urls.append(url)
+                    return f"Details for {url}"
+
+                self.run["queries"]["excludeTitleTerms"] = ["senior"]
+                api = FakeFetchRunApi(self.run)
+                with mock.patch.object(rj, "_fetch_description_for_url", fetch_detail):
+                    self._run_main(api, scrape)
+
+                self.assertEqual(scrape_flags, [False, False])
+                self.assertEqual(len(detail_urls), 5)
+                self.assertEqual(len(set(detail_urls)), 5)
+                self.assertFalse(any("-0" in url for url in detail_urls))
+                imported = [url for batch in api.imported_batches for url in batch]
+                self.assertEqual(len(imported), 5)
+                self.assertEqual(api.patches[-1]["importedCount"], 5)
+
+    def test_scrape_cache_serves_same_query_to_another_user(self):
+        self.env["FETCH_SCRAPE_CACHE_DIR"] = os.path.join(self._tmp.name, "scrape-cache")
+        calls = []
+
+        def scrape(search_term, results_wanted, **kwargs):
+            calls.append(search_term)
+            return _scraped_frame(search_term, results_wanted)
+
+        first = FakeFetchRunApi(self.run)
+        self._run_main(first, scrape)
+        self.assertEqual(sorted(calls), ["Data Engineer", "Software Engineer"])
+
+        calls.clear()
+        second = FakeFetchRunApi({**self.run, "userEmail": "other@example.com"})
+        self._run_main(second, scrape)
+
+        self.assertEqual(calls, [])
+        self.assertEqual(second.patches[-1]["importedCount"], 200)
+
+    def test_run_with_a_failed_term_is_reported_partial(self):
+        def scrape(search_term, results_wanted, **kwargs):
+            if search_term == "Data Engineer":
+                raise RuntimeError("HTTP 429 Too Many Requests")
+            return _scraped_frame(search_term, results_wanted)
+
+        api = FakeFetchRunApi(self.run)
+        with mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            self._run_main(api, scrape)
+
+        final = api.patches[-1]
+        self.assertEqual(final["status"], "SUCCEEDED")
+        self.assertTrue(final["partial"])
+        self.assertEqual(final["partialReasons"], ["scrape_failed_terms"])
+
+    def test_run_with_an_empty_term_is_not_partial(self):
+        def scrape(search_term, results_wanted, **kwargs):
+            if search_term == "Data Engineer":
+                return pd.DataFrame()
+            return _scraped_frame(search_term, results_wanted)
+
+        api = FakeFetchRunApi(self.run)
+        with mock.patch.object(rj, "sleeper", SleepService.virtual()):
+            self._run_main(api, scrape)
+
+        final = api.patches[-1]
+        self.assertEqual(final["status"], "SUCCEEDED")
+        self.assertEqual(final["importedCount"], 100)
+        self.assertFalse(final["partial"])
+        self.assertEqual(final["partialReasons"], [])
+
+    def test_complete_run_is_not_partial(self):
+        api = FakeFetchRunApi(self.run)
+        self._run_main(api, lambda search_term, results_wanted, **kwargs: _scraped_frame(search_term, results_wanted))
+
+        self.assertFalse(api.patches[-1]["partial"])
+        self.assertEqual(api.patches[-1]["partialReasons"], [])
+
+    def test_batch_scrapes_shared_terms_once_and_imports_per_run(self):
+        other_id = "22222222-2222-4222-8222-222222222222"
+        cancelled_id = "33333333-3333-4333-8333-333333333333"
+        runs = {
+            self.RUN_ID: self.run,
+            other_id: {
+                "userEmail": "other@example.com",
+                "status": "QUEUED",
+                "queries": {
+                    "title": "software engineer",
+                    "queries": ["software engineer", "Platform Engineer"],
+                    "excludeTitleTerms": ["senior"],
+                },
+                "resultsWanted": 100,
+            },
+            cancelled_id: {"userEmail": "gone@example.com", "status": "FAILED", "error": rj.CANCELLED_ERROR},
+        }
+        self.env.update({"RUN_IDS": f"{other_id},{cancelled_id}", "FETCH_TWO_PHASE": "1"})
+        calls = []
+        detail_urls = []
+
+        def scrape(search_term, **kwargs):
+            calls.append(search_term)
+            frame = _scraped_frame(search_term, 10).assign(description=None)
+            frame.loc[0, "title"] = f"Senior {search_term}"
+            return frame
+
+        def fetch_detail(url, **kwargs):
+            detail_urls.append(url)
+            return f"Details for {url}"
+
+        api = FakeBatchFetchRunApi(runs)
+        with mock.patch.object(rj, "_fetch_description_for_url", fetch_detail):
+            self._run_main(api, scrape)
+
+        self.assertEqual(sorted(calls), ["Data Engineer", "Platform Engineer", "Software Engineer"])
+        # Union of both runs' survivors: 10 + 10 Software/Data, 9 Platform.
+        self.assertEqual(len(set(detail_urls)), 29)
+        self.assertEqual(len(detail_urls), 29)
+        final = {run_id: patch for run_id, patch in api.patches}
+        self.assertNotIn(cancelled_id, final)
+        self.assertEqual(final[self.RUN_ID]["status"], "SUCCEEDED")
+        self.assertEqual(final[self.RUN_ID]["importedCount"], 20)
+        self.assertEqual(final[other_id]["status"], "SUCCEEDED")
+        self.assertEqual(final[other_id]["importedCount"], 18)
+        self.assertEqual(len(api.imported_by_user["other@example.com"]), 18)
+        self.assertFalse(any(url.endswith("-0") for url in api.imported_by_user["other@example.com"]))
+
+    def test_batch_trims_shared_frames_to_each_runs_budget_and_reports_per_run(self):
+        other_id = "22222222-2222-4222-8222-222222222222"
+        runs = {
+            self.RUN_ID: self.run,
+            other_id: {
+                "userEmail": "other@example.com",
+                "status": "QUEUED",
+                "queries": {"title": "Software Engineer", "queries": ["Software Engineer"]},
+                "resultsWanted": 20,
+            },
+        }
+        self.env.update({"RUN_IDS": other_id, "FETCH_RUN_REPORT_IN_UPDATE": "1"})
+        wanted = {}
+
+        def scrape(search_term, results_wanted, **kwargs):
+            wanted[search_term] = results_wanted
+            return _scraped_frame(search_term, results_wanted)
+
+        api = FakeBatchFetchRunApi(runs)
+        self._run_main(api, scrape)
+
+        self.assertEqual(wanted, {"Software Engineer": 100, "Data Engineer": 100})
+        final = {run_id: patch for run_id, patch in api.patches}
+        self.assertEqual(final[self.RUN_ID]["importedCount"], 200)
+        self.assertEqual(final[other_id]["importedCount"], 20)
+        self.assertEqual(len(api.imported_by_user["other@example.com"]), 20)
+        other_report = final[other_id]["report"]
+        self.assertEqual(other_report["runId"], other_id)
+        self.assertNotIn("fetch", other_report["stages"])
+        self.assertEqual(other_report["stages"]["import_batch"]["rowsIn"], 20)
+
+    def test_batch_stops_paged_fetch_only_on_jobs_every_run_knew(self):
+        other_id = "22222222-2222-4222-8222-222222222222"
+        runs = {
+            self.RUN_ID: self.run,
+            other_id: {
+                "userEmail": "other@example.com",
+                "status": "QUEUED",
+                "queries": {"title": "Software Engineer", "queries": ["Software Engineer"]},
+                "resultsWanted": 100,
+            },
+        }
+        self.env.update(
+            {
+                "RUN_IDS": other_id,
+                "FETCH_PAGE_SIZE": "10",
+                "FETCH_EARLY_STOP_KNOWN": "5",
+                "FETCH_KNOWN_JOBS_DIR": os.path.join(self._tmp.name, "known"),
+            }
+        )
+        newest = [40]
+        calls = []
+
+        def scrape(search_term, offset, results_wanted, **kwargs):
+            calls.append((search_term, offset))
+            ids = range(newest[0] - offset, max(newest[0] - offset - results_wanted, 0), -1)
+            return pd.DataFrame(
+                [
+                    {
+                        "job_url": f"https://www.linkedin.com/jobs/view/{search_term[0]}{job_id}",
+                        "title": search_term,
+                        "company": "Acme",
+                        "location": "Sydney",
+                        "description": f"{search_term} role {job_id}.",
+                    }
+                    for job_id in ids
+                ]
+            )
+
+        self._run_main(FakeBatchFetchRunApi(runs), scrape)
+
+        # Three new postings per term. Both users had the Software Engineer
+        # postings, so that term stops on its first page; only one had the
+        # Data Engineer ones, so that term is paged to the end.
+        calls.clear()
+        newest[0] = 43
+        api = FakeBatchFetchRunApi(runs)
+        self._run_main(api, scrape)
+
+        self.assertEqual(
+            sorted(calls),
+            [("Data Engineer", offset) for offset in (0, 10, 20, 30, 40)] + [("Software Engineer", 0)],
+        )
+        final = {run_id: patch for run_id, patch in api.patches}
+        self.assertEqual(final[self.RUN_ID]["status"], "SUCCEEDED")
+        self.assertEqual(final[other_id]["status"], "SUCCEEDED")
+
+    def test_import_retry_sleep_is_accounted_per_host(self):
+        api = FakeFetchRunApi(self.run)
+        responses = iter([FakeResponse({"error": "busy"}, status_code=503)])
+
+        def flaky_post(url, data=None, **kwargs):
+            return next(responses, None) or api.post(url, data=data, **kwargs)
+
+        with mock.patch.dict(os.environ, self.env), \
+                mock.patch.object(rj.http, "get", api.get), \
+                mock.patch.object(rj.http, "post", flaky_post), \
+                mock.patch.object(rj, "sleeper", SleepService.virtual()) as sleeper:
+            imported = rj._import_items(
+                "https://joblit.test",
+                self.RUN_ID,
+                {},
+                "user@example.com",
+                [{"job_url": "https://linkedin.com/jobs/view/1", "title": "Software Engineer"}],
+            )
+
+        self.assertEqual(imported, 1)
+        self.assertEqual(sleeper.summary()["byReason"], {"import_retry": 2.0})
+        self.assertEqual(sleeper.summary()["byHost"], {"joblit.test": 2.0})
+
+    def test_run_report_is_written_and_sent_with_final_update(self):
+        report_path = os.path.join(self._tmp.name, "report.json")
+        self.env.update({"FETCH_RUN_REPORT_PATH": report_path, "FETCH_RUN_REPORT_IN_UPDATE": "1"})
+
+        api = FakeFetchRunApi(self.run)
+        self._run_main(api, lambda search_term, **kwargs: _scraped_frame(search_term, 60))
+
+        sent = api.patches[-1]["report"]
+        with open(report_path, encoding="utf-8") as fh:
+            written = json.load(fh)
+        self.assertEqual(written["runId"], self.RUN_ID)
+        self.assertEqual(written["imported"], 120)
+        stages = sent["stages"]
+        self.assertEqual(
+            sorted(item["item"] for item in stages["scrape"]["items"]),
+            ["Data Engineer", "Software Engineer"],
+        )
+        self.assertEqual(stages["title_filter"]["rowsIn"], 120)
+        self.assertEqual(stages["dedupe"]["rowsOut"], 120)
+        self.assertEqual(stages["import_batch"]["calls"], 3)
+        self.assertEqual(stages["import_batch"]["rowsOut"], 120)
+
+
 if __name__ == "__main__":
     unittest.main()
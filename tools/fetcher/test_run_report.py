@@ -0,0 +1,68 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(__file__))
+
+from run_report import RunReport  # noqa: E402
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RunReportTests(unittest.TestCase):
+    def test_stage_aggregates_calls_rows_and_items(self):
+        clock = FakeClock()
+        report = RunReport("run-1", clock=clock)
+        for batch, (rows, imported) in enumerate([(50, 48), (20, 20)]):
+            with report.stage("import_batch", rows_in=rows, item=str(batch)) as stage:
+                clock.now += 1.5
+                stage.done(rows_out=imported, nbytes=1000, attempts=1)
+
+        stage = report.to_dict()["stages"]["import_batch"]
+        self.assertEqual(stage["calls"], 2)
+        self.assertEqual(stage["seconds"], 3.0)
+        self.assertEqual((stage["rowsIn"], stage["rowsOut"], stage["bytes"]), (70, 68, 2000))
+        self.assertEqual(
+            stage["items"][1],
+            {"item": "1", "seconds": 1.5, "rowsIn": 20, "rowsOut": 20, "bytes": 1000, "attempts": 1},
+        )
+
+    def test_stage_records_duration_and_error_when_body_raises(self):
+        clock = FakeClock()
+        report = RunReport(clock=clock)
+        with self.assertRaises(ValueError):
+            with report.stage("scrape", item="Software Engineer"):
+                clock.now += 2
+                raise ValueError("boom")
+
+        stage = report.to_dict()["stages"]["scrape"]
+        self.assertEqual((stage["calls"], stage["seconds"], stage["errors"]), (1, 2.0, 1))
+        self.assertEqual(stage["items"][0]["error"], "ValueError")
+
+    def test_counters_and_write(self):
+        report = RunReport("run-2")
+        report.count("scrape_retries")
+        report.count("scrape_retries", 2)
+        report.meta["imported"] = 7
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "reports" / "run.json"
+            report.write(path)
+            written = json.loads(path.read_text(encoding="utf-8"))
+
+        self.assertEqual(written["runId"], "run-2")
+        self.assertEqual(written["counters"], {"scrape_retries": 3})
+        self.assertEqual(written["imported"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(__file__))
+
+from scrape_cache import LocalDirBackend, MemoryBackend, ScrapeCache  # noqa: E402
+from sleep_service import VirtualClock  # noqa: E402
+
+
+def _frame(start, rows):
+    return pd.DataFrame({"job_url": [f"https://www.linkedin.com/jobs/view/{i}" for i in range(start, start + rows)]})
+
+
+class ScrapeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(now=1000.0)
+        self.cache = ScrapeCache(MemoryBackend(), ttl_sec=600, clock=self.clock)
+
+    def test_key_normalizes_term_and_location(self):
+        self.cache.put("Software  Engineer", "Sydney, NSW", 48, 0, 10, True, _frame(0, 10))
+
+        hit = self.cache.get("software engineer", " sydney,  nsw ", 48, 0, 10, True)
+
+        self.assertEqual(len(hit), 10)
+        self.assertIsNone(self.cache.get("software engineer", "sydney, nsw", 24, 0, 10, True))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_entry_expires_after_ttl(self):
+        self.cache.put("Data Engineer", "Sydney", 48, 0, 10, True, _frame(0, 10))
+
+        self.clock.sleep(601)
+
+        self.assertIsNone(self.cache.get("Data Engineer", "Sydney", 48, 0, 10, True))
+        self.assertEqual(self.cache.prune(), 1)
+        self.assertEqual(list(self.cache.backend.keys()), [])
+
+    def test_pages_extend_one_entry_and_serve_slices(self):
+        self.cache.put("Data Engineer", "Sydney", 48, 0, 10, False, _frame(0, 10))
+        self.cache.put("Data Engineer", "Sydney", 48, 10, 10, False, _frame(10, 10))
+        # Not contiguous with the entry: ignored.
+        self.cache.put("Data Engineer", "Sydney", 48, 40, 10, False, _frame(40, 10))
+
+        page = self.cache.get("Data Engineer", "Sydney", 48, 10, 10, False)
+
+        self.assertEqual(page["job_url"].iloc[0], "https://www.linkedin.com/jobs/view/10")
+        self.assertIsNone(self.cache.get("Data Engineer", "Sydney", 48, 15, 10, False))
+
+    def test_short_scrape_only_serves_the_rows_it_holds(self):
+        # jobspy returns what it has when a 429 stops it partway, so 30 of
+        # 100 rows is not proof the listing ended.
+        self.cache.put("Data Engineer", "Sydney", 48, 0, 100, False, _frame(0, 30))
+
+        self.assertEqual(len(self.cache.get("Data Engineer", "Sydney", 48, 0, 30, False)), 30)
+        self.assertIsNone(self.cache.get("Data Engineer", "Sydney", 48, 0, 100, False))
+        self.assertIsNone(self.cache.get("Data Engineer", "Sydney", 48, 50, 10, False))
+
+    def test_page_after_short_scrape_extends_from_rows_held(self):
+        self.cache.put("Data Engineer", "Sydney", 48, 0, 10, False, _frame(0, 7))
+        self.cache.put("Data Engineer", "Sydney", 48, 7, 10, False, _frame(7, 10))
+
+        self.assertEqual(len(self.cache.get("Data Engineer", "Sydney", 48, 0, 17, False)), 17)
+
+    def test_listing_without_descriptions_does_not_serve_detail_requests(self):
+        self.cache.put("Data Engineer", "Sydney", 48, 0, 10, False, _frame(0, 10))
+
+        self.assertIsNone(self.cache.get("Data Engineer", "Sydney", 48, 0, 10, True))
+        self.assertIsNotNone(self.cache.get("Data Engineer", "Sydney", 48, 0, 10, False))
+
+    def test_empty_results_are_not_cached(self):
+        self.cache.put("Data Engineer", "Sydney", 48, 0, 10, True, pd.DataFrame())
+
+        self.assertEqual(list(self.cache.backend.keys()), [])
+
+    def test_local_dir_backend_round_trips_keys(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ScrapeCache(LocalDirBackend(tmp), ttl_sec=600, clock=self.clock)
+            cache.put("C++ / Node.js", "Sydney, NSW", 48, 0, 10, True, _frame(0, 10))
+
+            again = ScrapeCache(LocalDirBackend(tmp), ttl_sec=600, clock=self.clock)
+
+            self.assertEqual(len(again.get("c++ / node.js", "sydney, nsw", 48, 0, 10, True)), 10)
+            self.assertEqual(list(again.backend.keys()), ["v2|c++ / node.js|sydney, nsw|48"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(__file__))
+
+from site_sources import RateLimiter, SitePolicy, SiteStats, resolve_sources, source_term_key  # noqa: E402
+from sleep_service import VirtualClock  # noqa: E402
+
+
+class SitePolicyTests(unittest.TestCase):
+    def test_env_overrides_site_defaults(self):
+        env = {"FETCH_SOURCE_INDEED_WORKERS": "5", "FETCH_SOURCE_INDEED_RETRIES": "oops"}
+        with mock.patch.dict(os.environ, env):
+            policy = SitePolicy.from_env("indeed")
+
+        self.assertEqual(policy.workers, 5)
+        self.assertEqual(policy.retries, 2)  # unparsable: default kept
+        self.assertEqual(policy.min_interval_sec, 0.5)
+
+    def test_resolve_sources_drops_unknown_and_defaults_to_linkedin(self):
+        with mock.patch.dict(os.environ, {"FETCH_SOURCES": "Indeed, monster, linkedin, indeed"}):
+            self.assertEqual(resolve_sources(), ["indeed", "linkedin"])
+        with mock.patch.dict(os.environ, {"FETCH_SOURCES": ""}):
+            self.assertEqual(resolve_sources(), ["linkedin"])
+
+    def test_resolve_sources_keeps_market_bound_boards_to_their_market(self):
+        with mock.patch.dict(os.environ, {"FETCH_SOURCES": "linkedin,zhipin"}):
+            self.assertEqual(resolve_sources(), ["linkedin"])
+            self.assertEqual(resolve_sources("AU"), ["linkedin"])
+            self.assertEqual(resolve_sources("cn"), ["linkedin", "zhipin"])
+        with mock.patch.dict(os.environ, {"FETCH_SOURCES": "zhipin"}):
+            self.assertEqual(resolve_sources("AU"), ["linkedin"])
+
+    def test_linkedin_checkpoint_keys_stay_bare_terms(self):
+        self.assertEqual(source_term_key("linkedin", "Data Engineer"), "Data Engineer")
+        self.assertEqual(source_term_key("indeed", "Data Engineer"), "indeed:Data Engineer")
+        self.assertEqual(source_term_key("indeed", "Data Engineer", "Perth"), "indeed:Data Engineer@Perth")
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_spaces_request_starts_across_threads(self):
+        # The clock stands still, so every caller reserves the next slot
+        # behind the previous one regardless of which thread gets the lock.
+        slept = []
+        lock = threading.Lock()
+
+        def sleep(seconds):
+            with lock:
+                slept.append(seconds)
+
+        limiter = RateLimiter(2.0, sleep=sleep, clock=lambda: 100.0)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(slept), [2.0, 4.0, 6.0])
+        self.assertEqual(limiter.waited_sec, 12.0)
+
+    def test_zero_interval_never_waits(self):
+        limiter = RateLimiter(0.0, sleep=lambda seconds: self.fail("slept"))
+        self.assertEqual(limiter.acquire(), 0.0)
+
+
+class SiteStatsTests(unittest.TestCase):
+    def test_summary_reports_latency_and_yield(self):
+        clock = VirtualClock(0.0)
+        stats = SiteStats("indeed", clock=clock)
+        stats.start()
+        clock.sleep(1.5)
+        stats.record_frame(rows=10, kept_rows=6)
+        for seconds in (1.0, 2.0, 3.0):
+            stats.record_term(seconds)
+        clock.sleep(2.0)
+        stats.finish()
+
+        summary = stats.summary()
+
+        self.assertEqual(summary["elapsedSec"], 3.5)
+        self.assertEqual(summary["firstFrameSec"], 1.5)
+        self.assertEqual((summary["terms"], summary["termP50Sec"]), (3, 2.0))
+        self.assertEqual(summary["yield"], 0.6)
+
+
+if __name__ == "__main__":
+    unittest.main()
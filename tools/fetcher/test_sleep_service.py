@@ -0,0 +1,51 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(__file__))
+
+from sleep_service import SleepService, VirtualClock  # noqa: E402
+
+
+class SleepServiceTests(unittest.TestCase):
+    def test_virtual_sleep_advances_clock_and_records_breakdown(self):
+        clock = VirtualClock(100.0)
+        sleeper = SleepService.virtual(clock)
+
+        sleeper.sleep(15.0, "scrape_rate_limit", host="linkedin.com")
+        sleeper.sleep(2.5, "detail_retry", host="linkedin.com")
+        sleeper.sleep(4.0, "import_retry", host="joblit.test")
+
+        self.assertEqual(clock.now, 121.5)
+        self.assertEqual(
+            sleeper.summary(),
+            {
+                "totalSec": 21.5,
+                "calls": 3,
+                "byReason": {"detail_retry": 2.5, "import_retry": 4.0, "scrape_rate_limit": 15.0},
+                "byHost": {"joblit.test": 4.0, "linkedin.com": 17.5},
+            },
+        )
+
+    def test_non_positive_sleep_is_not_recorded(self):
+        sleeper = SleepService.virtual()
+        self.assertEqual(sleeper.sleep(0, "term_backoff"), 0.0)
+        self.assertEqual(sleeper.sleep(-3, "term_backoff"), 0.0)
+        self.assertEqual(sleeper.calls, 0)
+
+    def test_reset_clears_totals(self):
+        sleeper = SleepService.virtual()
+        sleeper.sleep(1.0, "import_retry")
+        sleeper.reset()
+        self.assertEqual(sleeper.summary(), {"totalSec": 0.0, "calls": 0, "byReason": {}, "byHost": {}})
+
+    def test_records_measured_time_not_requested_time(self):
+        clock = VirtualClock()
+        # A sleep function that overshoots, like a loaded runner would.
+        sleeper = SleepService(sleep_fn=lambda sec: clock.sleep(sec + 0.5), clock=clock)
+        self.assertEqual(sleeper.sleep(1.0, "scrape_retry"), 1.5)
+        self.assertEqual(sleeper.summary()["byHost"], {"-": 1.5})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(os.path.dirname(__file__))
+
+from spill_store import SpillStore  # noqa: E402
+
+
+def _frame(prefix: str, rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "job_url": [f"https://example.com/{prefix}/{i}" for i in range(rows)],
+            "title": [f"{prefix} engineer {i}" for i in range(rows)],
+            "company": pd.Categorical(["Acme"] * rows),
+            "emails": [None] * rows,
+        }
+    )
+
+
+class SpillStoreTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name) / "run-1"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_write_splits_terms_into_bounded_chunks_in_arrival_order(self):
+        store = SpillStore(self.root, chunk_rows=4, fmt="pickle")
+        store.write("frontend", _frame("fe", 10))
+        store.write("backend", _frame("be", 3))
+
+        chunks = list(store.iter_frames())
+        self.assertEqual([len(c) for c in chunks], [4, 4, 2, 3])
+        self.assertEqual(store.rows_written, 13)
+        self.assertEqual(chunks[0].iloc[0]["job_url"], "https://example.com/fe/0")
+        self.assertEqual(chunks[3].iloc[0]["job_url"], "https://example.com/be/0")
+        self.assertIsInstance(chunks[0]["company"].dtype, pd.CategoricalDtype)
+
+    def test_empty_frames_are_not_spilled(self):
+        store = SpillStore(self.root, fmt="pickle")
+        store.write("nothing", pd.DataFrame())
+        self.assertEqual(len(store), 0)
+        self.assertEqual(list(store.iter_frames()), [])
+
+    def test_cleanup_removes_the_run_directory(self):
+        store = SpillStore(self.root, chunk_rows=2, fmt="pickle")
+        store.write("frontend", _frame("fe", 3))
+        self.assertTrue(any(self.root.iterdir()))
+
+        store.cleanup()
+        self.assertFalse(self.root.exists())
+        self.assertEqual(len(store), 0)
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            SpillStore(self.root, fmt="csv")
+
+
+if __name__ == "__main__":
+    unittest.main()